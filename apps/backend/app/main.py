@@ -4,7 +4,8 @@ from dotenv import load_dotenv
 import os
 
 from app.database import init_db
-from app.routes import candidates, counties, issues, vote_buying, admin
+from app.routes import candidates, counties, issues, media, mps, search, vote_buying, admin
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Load environment variables
 load_dotenv()
@@ -23,6 +24,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
@@ -35,9 +37,12 @@ async def startup():
 # Include routers
 app.include_router(candidates.router, prefix="/candidates", tags=["candidates"])
 app.include_router(counties.router, prefix="/counties", tags=["counties"])
+app.include_router(mps.router, prefix="/mps", tags=["mps"])
 app.include_router(issues.router, prefix="/issues", tags=["issues"])
 app.include_router(vote_buying.router, prefix="/vote-buying-facts", tags=["vote-buying"])
+app.include_router(search.router, prefix="/search", tags=["search"])
 app.include_router(admin.router, prefix="/admin", tags=["admin"])
+app.include_router(media.router, prefix="/media", tags=["media"])
 
 
 @app.get("/", tags=["health"])
@@ -0,0 +1,142 @@
+"""
+Lightweight schema migrations for databases created before a model change.
+
+`Base.metadata.create_all()` only creates missing tables, so anything that
+touches existing tables or data (new columns, backfills) lives here. Each
+migration runs once and is recorded in the `schema_migrations` table.
+
+init_db() runs pending migrations on startup. To run them by hand, from the
+backend directory: python -m app.migrations
+"""
+
+import json
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, bindparam, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.models import MP, CountyElectionResult, CountyMP, CountySenator, CountyVotedBill
+from app.utils.search import install_search_index
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("name", String, primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _load_json(value) -> list:
+    """JSON columns come back parsed from psycopg but as text from SQLite"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return json.loads(value or "[]")
+    return value
+
+
+def backfill_county_child_tables(conn: Connection):
+    """Copy the legacy County *_json columns into the normalized child tables"""
+    legacy = {
+        "senators_json": CountySenator,
+        "mps_json": CountyMP,
+        "past_election_results_json": CountyElectionResult,
+        "voted_bills_json": CountyVotedBill,
+    }
+    existing_columns = {c["name"] for c in inspect(conn).get_columns("counties")}
+    columns = [name for name in legacy if name in existing_columns]
+    if not columns:
+        return  # Database was created after normalization
+
+    rows = conn.execute(text(f"SELECT id, {', '.join(columns)} FROM counties")).mappings().all()
+
+    for column in columns:
+        table = legacy[column].__table__
+        already_filled = set(conn.execute(select(table.c.county_id).distinct()).scalars())
+        batch = []
+        for row in rows:
+            if row["id"] in already_filled:
+                continue
+            for child in legacy[column].from_items(_load_json(row[column])):
+                values = child.to_dict()
+                values.update(county_id=row["id"], position=child.position)
+                batch.append(values)
+        if batch:
+            conn.execute(table.insert(), batch)
+
+
+def create_mp_indexes(conn: Connection):
+    """Composite indexes for the /mps filters, plus a GIN index for committees"""
+    for index in MP.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_mps_committees_gin "
+            "ON mps USING gin ((committees_json::jsonb))"
+        ))
+
+
+def add_mp_content_hash(conn: Connection):
+    """Add mps.content_hash and fill it in for the MPs already stored"""
+    if "content_hash" not in {c["name"] for c in inspect(conn).get_columns("mps")}:
+        conn.execute(text("ALTER TABLE mps ADD COLUMN content_hash VARCHAR(64)"))
+
+    table = MP.__table__
+    rows = conn.execute(
+        select(table.c.id, *(table.c[field] for field in MP.CONTENT_FIELDS))
+        .where(table.c.content_hash.is_(None))
+    ).mappings().all()
+    if rows:
+        # Setting updated_at to itself keeps its onupdate from firing
+        conn.execute(
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values(content_hash=bindparam("hash"), updated_at=table.c.updated_at),
+            [{"row_id": row["id"], "hash": MP.hash_content(row)} for row in rows],
+        )
+
+
+def add_photo_keys(conn: Connection):
+    """Add the local photo asset columns to mps and candidates"""
+    for table in ("mps", "candidates"):
+        if "photo_key" not in {c["name"] for c in inspect(conn).get_columns(table)}:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN photo_key VARCHAR(32)"))
+
+
+# Ordered list of (name, migration). Never rename or reorder applied entries.
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("001_county_child_tables", backfill_county_child_tables),
+    ("002_mp_indexes", create_mp_indexes),
+    ("003_search_index", install_search_index),
+    ("004_mp_content_hash", add_mp_content_hash),
+    ("005_photo_keys", add_photo_keys),
+]
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """Apply pending migrations in order, each in its own transaction"""
+    _meta.create_all(bind=engine)
+    applied = []
+
+    for name, migration in MIGRATIONS:
+        with engine.begin() as conn:
+            done = conn.execute(
+                select(schema_migrations.c.name).where(schema_migrations.c.name == name)
+            ).first()
+            if done:
+                continue
+            migration(conn)
+            conn.execute(schema_migrations.insert().values(name=name, applied_at=datetime.now()))
+            applied.append(name)
+            print(f"✓ Applied migration {name}")
+
+    return applied
+
+
+if __name__ == "__main__":
+    from app.database import init_db
+
+    init_db()
@@ -1,7 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy.orm import declared_attr, relationship
 from sqlalchemy.sql import func
 from app.database import Base
 from datetime import datetime
+import hashlib
+import json
+
+
+# updated_at is set by the application (microseconds) rather than the
+# database: SQLite's CURRENT_TIMESTAMP only has one-second resolution, and
+# the ETags in app/utils/etag.py must change on every write.
 
 
 class Candidate(Base):
@@ -12,6 +20,7 @@ class Candidate(Base):
     name = Column(String, nullable=False)
     party = Column(String, nullable=False)
     photo_url = Column(String, nullable=True)
+    photo_key = Column(String(32), nullable=True)  # Local photo variants, see app/utils/photo_assets.py
     bio_text = Column(String, nullable=False)
     wiki_title = Column(String, nullable=False)
     good_json = Column(JSON, default=list)  # Array of achievements
@@ -19,7 +28,7 @@ class Candidate(Base):
     crazy_json = Column(JSON, default=list)  # Array of questionable claims
     policies_json = Column(JSON, default=list)  # Array of {promise, details, progress, sources}
     county_affiliation = Column(String, nullable=True)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
 
 
 class County(Base):
@@ -30,16 +39,151 @@ class County(Base):
     governor_name = Column(String, nullable=False)
     governor_party = Column(String, nullable=False)
     governor_wiki_title = Column(String, nullable=False)
-    senators_json = Column(JSON, default=list)  # Array of {name, party, wiki_title}
-    mps_json = Column(JSON, default=list)  # Array of {name, constituency, party, wiki_title}
-    past_election_results_json = Column(JSON, default=list)  # Array of {year, type, winner, votes, source}
-    voted_bills_json = Column(JSON, default=list)  # Array of {bill_title, bill_id, vote, date, source_url}
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
+
+    # Child rows, always eager-loaded with one SELECT ... IN per relationship
+    senators = relationship(
+        "CountySenator", order_by="CountySenator.position",
+        cascade="all, delete-orphan", lazy="selectin",
+    )
+    county_mps = relationship(
+        "CountyMP", order_by="CountyMP.position",
+        cascade="all, delete-orphan", lazy="selectin",
+    )
+    election_results = relationship(
+        "CountyElectionResult", order_by="CountyElectionResult.position",
+        cascade="all, delete-orphan", lazy="selectin",
+    )
+    voted_bills = relationship(
+        "CountyVotedBill", order_by="CountyVotedBill.position",
+        cascade="all, delete-orphan", lazy="selectin",
+    )
+
+    # The *_json attributes keep the original list-of-dicts API (schemas,
+    # routes, seeds and the MP scraper) on top of the child tables
+    def _set_children(self, relationship_name: str, items):
+        model = getattr(County, relationship_name).property.mapper.class_
+        setattr(self, relationship_name, model.from_items(items))
+        self.updated_at = datetime.now()  # Child rows don't touch the county row
+
+    @property
+    def senators_json(self):  # Array of {name, party, wiki_title}
+        return [row.to_dict() for row in self.senators]
+
+    @senators_json.setter
+    def senators_json(self, items):
+        self._set_children("senators", items)
+
+    @property
+    def mps_json(self):  # Array of {name, constituency, party, wiki_title, ...}
+        return [row.to_dict() for row in self.county_mps]
+
+    @mps_json.setter
+    def mps_json(self, items):
+        self._set_children("county_mps", items)
+
+    @property
+    def past_election_results_json(self):  # Array of {year, type, winner, votes, source}
+        return [row.to_dict() for row in self.election_results]
+
+    @past_election_results_json.setter
+    def past_election_results_json(self, items):
+        self._set_children("election_results", items)
+
+    @property
+    def voted_bills_json(self):  # Array of {bill_title, bill_id, vote, date, source_url}
+        return [row.to_dict() for row in self.voted_bills]
+
+    @voted_bills_json.setter
+    def voted_bills_json(self, items):
+        self._set_children("voted_bills", items)
+
+
+class CountyChildMixin:
+    """Shared columns and dict conversion for rows that belong to a county"""
+
+    FIELDS: tuple = ()
+
+    id = Column(Integer, primary_key=True)
+    position = Column(Integer, nullable=False, default=0)  # Order within the county
+
+    @declared_attr
+    def county_id(cls):
+        return Column(
+            Integer, ForeignKey("counties.id", ondelete="CASCADE"), nullable=False, index=True
+        )
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_items(cls, items) -> list:
+        """Build rows from dicts or Pydantic models, keeping list order"""
+        rows = []
+        for position, item in enumerate(items or []):
+            if hasattr(item, "model_dump"):
+                item = item.model_dump()
+            rows.append(cls(position=position, **{f: item.get(f) for f in cls.FIELDS}))
+        return rows
+
+
+class CountySenator(CountyChildMixin, Base):
+    __tablename__ = "county_senators"
+
+    FIELDS = ("name", "party", "wiki_title")
+
+    name = Column(String, nullable=False)
+    party = Column(String, nullable=True, index=True)
+    wiki_title = Column(String, nullable=True)
+
+
+class CountyMP(CountyChildMixin, Base):
+    __tablename__ = "county_mps"
+
+    FIELDS = ("name", "constituency", "party", "wiki_title", "email", "phone", "profile_url")
+
+    name = Column(String, nullable=False)
+    constituency = Column(String, nullable=True)
+    party = Column(String, nullable=True, index=True)
+    wiki_title = Column(String, nullable=True)
+    email = Column(String, nullable=True)
+    phone = Column(String, nullable=True)
+    profile_url = Column(String, nullable=True)
+
+
+class CountyElectionResult(CountyChildMixin, Base):
+    __tablename__ = "county_election_results"
+
+    FIELDS = ("year", "type", "winner", "votes", "source")
+
+    year = Column(Integer, nullable=False, index=True)
+    type = Column(String, nullable=False)  # presidential, gubernatorial, mp
+    winner = Column(String, nullable=False)
+    votes = Column(Integer, nullable=True)
+    source = Column(String, nullable=True)
+
+
+class CountyVotedBill(CountyChildMixin, Base):
+    __tablename__ = "county_voted_bills"
+
+    FIELDS = ("bill_title", "bill_id", "vote", "date", "source_url")
+
+    bill_title = Column(String, nullable=False)
+    bill_id = Column(String, nullable=False, index=True)
+    vote = Column(String, nullable=False, index=True)  # Yes, No, Abstain
+    date = Column(String, nullable=True)  # YYYY-MM-DD
+    source_url = Column(String, nullable=True)
 
 
 class MP(Base):
     __tablename__ = "mps"
 
+    # Scraped columns, covered by content_hash
+    CONTENT_FIELDS = (
+        "name", "county", "constituency", "party", "email", "phone", "bio",
+        "photo_url", "profile_url", "committees_json", "wiki_title",
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
     county = Column(String, nullable=True, index=True)
@@ -49,10 +193,28 @@ class MP(Base):
     phone = Column(String, nullable=True)
     bio = Column(String, nullable=True)
     photo_url = Column(String, nullable=True)
+    photo_key = Column(String(32), nullable=True)  # Local photo variants, see app/utils/photo_assets.py
     profile_url = Column(String, nullable=True, unique=True)
     committees_json = Column(JSON, default=list)  # Array of committee names
     wiki_title = Column(String, nullable=True)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    content_hash = Column(String(64), nullable=True)  # hash_content() of the scraped columns
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
+
+    @classmethod
+    def hash_content(cls, values) -> str:
+        """sha256 of the CONTENT_FIELDS in ``values`` (a dict or row mapping)"""
+        content = json.dumps(
+            [values.get(field) for field in cls.CONTENT_FIELDS],
+            ensure_ascii=False, separators=(",", ":"), sort_keys=True,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    # Composite indexes for the filtered, id-ordered /mps listing
+    __table_args__ = (
+        Index("ix_mps_county_party_id", "county", "party", "id"),
+        Index("ix_mps_party_id", "party", "id"),
+        Index("ix_mps_constituency_id", "constituency", "id"),
+    )
 
 
 class Issue(Base):
@@ -63,7 +225,7 @@ class Issue(Base):
     good_points_json = Column(JSON, default=list)  # Array of positive approaches
     bad_points_json = Column(JSON, default=list)  # Array of concerns
     sources_json = Column(JSON, default=list)  # Array of sources
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
 
 
 class VoteBuyingFact(Base):
@@ -73,7 +235,7 @@ class VoteBuyingFact(Base):
     section_title = Column(String, nullable=False)
     content_text = Column(String, nullable=False)
     sources_json = Column(JSON, default=list)  # Array of sources
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
 
 
 class NewsUpdate(Base):
@@ -85,4 +247,4 @@ class NewsUpdate(Base):
     source_url = Column(String, nullable=True)
     published_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), default=datetime.now, onupdate=datetime.now)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Header, HTTPException, status, Depends
-from typing import Optional
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Header, HTTPException, status
+from typing import Dict, Optional
+from app.database import SessionLocal, async_engine, engine, pool_stats
+from app.utils.cache import response_cache
+from app.utils.jobs import Job, JobConflictError, job_runner
 from app.utils.mp_scraper import scrape_and_seed_mps
 
 router = APIRouter()
@@ -19,14 +20,70 @@ async def verify_admin(x_api_key: Optional[str] = Header(None)):
     return {"status": "authorized", "role": "admin"}
 
 
-@router.post("/scrape-mps")
+@router.get("/db-pool")
+async def db_pool_stats(x_api_key: Optional[str] = Header(None)):
+    """Live database connection pool statistics (checked-out, overflow, wait time)"""
+    # Simple admin check - in production, use proper auth
+    if x_api_key != "secret":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.sync_engine.pool),
+    }
+
+
+@router.get("/cache-stats")
+async def cache_stats(x_api_key: Optional[str] = Header(None)):
+    """Response cache hit/miss counters"""
+    # Simple admin check - in production, use proper auth
+    if x_api_key != "secret":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+    return response_cache.stats()
+
+
+def _scrape_mps_job(job: Job, incremental: bool) -> Dict:
+    """Job body: scrape with its own database session, reporting progress on the job"""
+    db = SessionLocal()
+    try:
+        result = scrape_and_seed_mps(db, incremental=incremental, on_progress=job.report)
+    finally:
+        db.close()
+    if not result:
+        raise RuntimeError(job.progress.get("error") or "Scraping failed")
+    return {
+        "total_mps": result.get("total_mps", 0),
+        "counties": len(result.get("by_county", {})),
+        "scraped_at": result.get("scraped_at"),
+        "db_changes": result.get("db_changes"),
+        "photos": result.get("photos"),
+        "wikipedia": result.get("wikipedia"),
+        "manifest": result.get("manifest"),
+        "disappeared": result.get("disappeared", []),
+        "resumed_profiles": result.get("resumed_profiles", 0),
+        "failed": result.get("failed", {}),
+    }
+
+
+@router.post("/scrape-mps", status_code=status.HTTP_202_ACCEPTED)
 async def scrape_mps(
+    incremental: bool = False,
     x_api_key: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
 ):
     """
-    Scrape MPs from parliament.go.ke and update the database
+    Start a background job that scrapes MPs from parliament.go.ke and
+    updates the database; poll GET /admin/jobs/{job_id} for its progress.
     Requires admin API key in headers
+    
+    With ?incremental=true only new or changed profiles are fetched.
+    A scrape interrupted within the last MP_SCRAPER_RESUME_HOURS is resumed
+    from its checkpoint instead of starting over. Only one scrape runs at a
+    time: while one is queued or running this returns 409 with its job id.
     """
     # Simple admin check - in production, use proper auth
     if x_api_key != "secret":
@@ -36,22 +93,44 @@ async def scrape_mps(
         )
     
     try:
-        result = scrape_and_seed_mps(db)
-        if result:
-            return {
-                "status": "success",
-                "message": "MPs scraped and database updated",
-                "total_mps": result.get("total_mps", 0),
-                "counties": len(result.get("by_county", {})),
-                "scraped_at": result.get("scraped_at")
-            }
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Scraping failed"
-            )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error during scraping: {str(e)}"
+        job = job_runner.submit("scrape-mps", _scrape_mps_job, incremental=incremental)
+    except JobConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "job_id": e.job.id},
+        )
+    return {
+        "status": job.state,
+        "job_id": job.id,
+        "status_url": f"/admin/jobs/{job.id}",
+    }
+
+
+@router.get("/jobs")
+async def list_jobs(x_api_key: Optional[str] = Header(None)):
+    """Recent background jobs, newest first"""
+    # Simple admin check - in production, use proper auth
+    if x_api_key != "secret":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+    return [job.to_dict() for job in job_runner.list()]
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, x_api_key: Optional[str] = Header(None)):
+    """State, progress counts, timings, result and error of a background job"""
+    # Simple admin check - in production, use proper auth
+    if x_api_key != "secret":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
         )
+    return job.to_dict()
@@ -1,37 +1,76 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import Candidate
 from app.schemas import CandidateCreate, CandidateResponse, CandidateUpdate
 from app.utils.wikipedia import get_wiki_summary
-from typing import List
+from app.utils.cache import detail_key, invalidate_resource, list_key, response_cache
+from app.utils.etag import collection_etag, collection_version, etag_matches, not_modified, row_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor_headers, paginate
+from typing import List, Optional
 
 router = APIRouter()
 
+CACHE_RESOURCE = "candidates"
+CandidateResponseList = TypeAdapter(List[CandidateResponse])
+CandidateResponseItem = TypeAdapter(CandidateResponse)
+
 
 @router.get("", response_model=List[CandidateResponse])
-async def get_candidates(db: Session = Depends(get_db)):
-    """Get all candidates"""
-    candidates = db.query(Candidate).all()
-    return candidates
+async def get_candidates(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get candidates, one page at a time (ordered by id)"""
+    key = list_key(CACHE_RESOURCE, limit=limit, cursor=cursor)
+    version = await collection_version(db, Candidate)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, limit=limit, cursor=cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    candidates, next_cursor = await paginate(db, select(Candidate), Candidate.id, limit, cursor)
+    headers = {**next_cursor_headers(next_cursor), "ETag": etag}
+    return response_cache.store(key, CandidateResponseList, candidates, headers, version)
 
 
 @router.get("/{slug}", response_model=CandidateResponse)
-async def get_candidate(slug: str, db: Session = Depends(get_db)):
+async def get_candidate(
+    slug: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get a candidate by slug"""
-    candidate = db.query(Candidate).filter(Candidate.slug == slug).first()
+    key = detail_key(CACHE_RESOURCE, slug)
+    version = await collection_version(db, Candidate)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    candidate = await db.scalar(select(Candidate).where(Candidate.slug == slug))
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with slug '{slug}' not found",
         )
-    return candidate
+
+    etag = row_etag(CACHE_RESOURCE, candidate)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return response_cache.store(key, CandidateResponseItem, candidate, {"ETag": etag}, version)
 
 
 @router.post("", response_model=CandidateResponse, status_code=status.HTTP_201_CREATED)
 async def create_candidate(
     candidate: CandidateCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,  # Type hint without validation for now
 ):
     """Create a new candidate (admin only)"""
@@ -43,7 +82,7 @@ async def create_candidate(
         )
 
     # Check if candidate already exists
-    existing = db.query(Candidate).filter(Candidate.slug == candidate.slug).first()
+    existing = await db.scalar(select(Candidate).where(Candidate.slug == candidate.slug))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -52,8 +91,9 @@ async def create_candidate(
 
     db_candidate = Candidate(**candidate.model_dump())
     db.add(db_candidate)
-    db.commit()
-    db.refresh(db_candidate)
+    await db.commit()
+    await db.refresh(db_candidate)
+    invalidate_resource(CACHE_RESOURCE)
     return db_candidate
 
 
@@ -61,7 +101,7 @@ async def create_candidate(
 async def update_candidate(
     slug: str,
     candidate: CandidateUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Update a candidate (admin only)"""
@@ -72,7 +112,7 @@ async def update_candidate(
             detail="Invalid API key",
         )
 
-    db_candidate = db.query(Candidate).filter(Candidate.slug == slug).first()
+    db_candidate = await db.scalar(select(Candidate).where(Candidate.slug == slug))
     if not db_candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -81,18 +121,21 @@ async def update_candidate(
 
     # Update only provided fields
     update_data = candidate.model_dump(exclude_unset=True)
+    if update_data.get("photo_url", db_candidate.photo_url) != db_candidate.photo_url:
+        update_data["photo_key"] = None  # Stale until the next photo sync
     for field, value in update_data.items():
         setattr(db_candidate, field, value)
 
-    db.commit()
-    db.refresh(db_candidate)
+    await db.commit()
+    await db.refresh(db_candidate)
+    invalidate_resource(CACHE_RESOURCE, slug)
     return db_candidate
 
 
 @router.delete("/{slug}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_candidate(
     slug: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Delete a candidate (admin only)"""
@@ -103,12 +146,13 @@ async def delete_candidate(
             detail="Invalid API key",
         )
 
-    db_candidate = db.query(Candidate).filter(Candidate.slug == slug).first()
+    db_candidate = await db.scalar(select(Candidate).where(Candidate.slug == slug))
     if not db_candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with slug '{slug}' not found",
         )
 
-    db.delete(db_candidate)
-    db.commit()
+    await db.delete(db_candidate)
+    await db.commit()
+    invalidate_resource(CACHE_RESOURCE, slug)
@@ -1,36 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import County
 from app.schemas import CountyCreate, CountyResponse, CountyUpdate
-from typing import List
+from app.utils.cache import detail_key, invalidate_resource, list_key, response_cache
+from app.utils.etag import collection_etag, collection_version, etag_matches, not_modified, row_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor_headers, paginate
+from typing import List, Optional
 
 router = APIRouter()
 
+CACHE_RESOURCE = "counties"
+CountyResponseList = TypeAdapter(List[CountyResponse])
+CountyResponseItem = TypeAdapter(CountyResponse)
+
 
 @router.get("", response_model=List[CountyResponse])
-async def get_counties(db: Session = Depends(get_db)):
-    """Get all counties"""
-    counties = db.query(County).all()
-    return counties
+async def get_counties(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get counties, one page at a time (ordered by id)"""
+    key = list_key(CACHE_RESOURCE, limit=limit, cursor=cursor)
+    version = await collection_version(db, County)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, limit=limit, cursor=cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    counties, next_cursor = await paginate(db, select(County), County.id, limit, cursor)
+    headers = {**next_cursor_headers(next_cursor), "ETag": etag}
+    return response_cache.store(key, CountyResponseList, counties, headers, version)
 
 
 @router.get("/{name}", response_model=CountyResponse)
-async def get_county(name: str, db: Session = Depends(get_db)):
+async def get_county(
+    name: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get a county by name"""
-    county = db.query(County).filter(County.name == name).first()
+    key = detail_key(CACHE_RESOURCE, name)
+    version = await collection_version(db, County)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    county = await db.scalar(select(County).where(County.name == name))
     if not county:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"County '{name}' not found",
         )
-    return county
+
+    etag = row_etag(CACHE_RESOURCE, county)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return response_cache.store(key, CountyResponseItem, county, {"ETag": etag}, version)
 
 
 @router.post("", response_model=CountyResponse, status_code=status.HTTP_201_CREATED)
 async def create_county(
     county: CountyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Create a new county (admin only)"""
@@ -42,7 +81,7 @@ async def create_county(
         )
 
     # Check if county already exists
-    existing = db.query(County).filter(County.name == county.name).first()
+    existing = await db.scalar(select(County).where(County.name == county.name))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,8 +90,9 @@ async def create_county(
 
     db_county = County(**county.model_dump())
     db.add(db_county)
-    db.commit()
-    db.refresh(db_county)
+    await db.commit()
+    await db.refresh(db_county)
+    invalidate_resource(CACHE_RESOURCE)
     return db_county
 
 
@@ -60,7 +100,7 @@ async def create_county(
 async def update_county(
     name: str,
     county: CountyUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Update a county (admin only)"""
@@ -71,7 +111,7 @@ async def update_county(
             detail="Invalid API key",
         )
 
-    db_county = db.query(County).filter(County.name == name).first()
+    db_county = await db.scalar(select(County).where(County.name == name))
     if not db_county:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -83,15 +123,16 @@ async def update_county(
     for field, value in update_data.items():
         setattr(db_county, field, value)
 
-    db.commit()
-    db.refresh(db_county)
+    await db.commit()
+    await db.refresh(db_county)
+    invalidate_resource(CACHE_RESOURCE, name, db_county.name)
     return db_county
 
 
 @router.delete("/{name}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_county(
     name: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Delete a county (admin only)"""
@@ -102,12 +143,13 @@ async def delete_county(
             detail="Invalid API key",
         )
 
-    db_county = db.query(County).filter(County.name == name).first()
+    db_county = await db.scalar(select(County).where(County.name == name))
     if not db_county:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"County '{name}' not found",
         )
 
-    db.delete(db_county)
-    db.commit()
+    await db.delete(db_county)
+    await db.commit()
+    invalidate_resource(CACHE_RESOURCE, name)
@@ -1,36 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import Issue
 from app.schemas import IssueCreate, IssueResponse, IssueUpdate
-from typing import List
+from app.utils.cache import detail_key, invalidate_resource, list_key, response_cache
+from app.utils.etag import collection_etag, collection_version, etag_matches, not_modified, row_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor_headers, paginate
+from typing import List, Optional
 
 router = APIRouter()
 
+CACHE_RESOURCE = "issues"
+IssueResponseList = TypeAdapter(List[IssueResponse])
+IssueResponseItem = TypeAdapter(IssueResponse)
+
 
 @router.get("", response_model=List[IssueResponse])
-async def get_issues(db: Session = Depends(get_db)):
-    """Get all issues"""
-    issues = db.query(Issue).all()
-    return issues
+async def get_issues(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get issues, one page at a time (ordered by id)"""
+    key = list_key(CACHE_RESOURCE, limit=limit, cursor=cursor)
+    version = await collection_version(db, Issue)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, limit=limit, cursor=cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    issues, next_cursor = await paginate(db, select(Issue), Issue.id, limit, cursor)
+    headers = {**next_cursor_headers(next_cursor), "ETag": etag}
+    return response_cache.store(key, IssueResponseList, issues, headers, version)
 
 
 @router.get("/{issue_id}", response_model=IssueResponse)
-async def get_issue(issue_id: int, db: Session = Depends(get_db)):
+async def get_issue(
+    issue_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get an issue by ID"""
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    key = detail_key(CACHE_RESOURCE, issue_id)
+    version = await collection_version(db, Issue)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    issue = await db.scalar(select(Issue).where(Issue.id == issue_id))
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Issue with ID {issue_id} not found",
         )
-    return issue
+
+    etag = row_etag(CACHE_RESOURCE, issue)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return response_cache.store(key, IssueResponseItem, issue, {"ETag": etag}, version)
 
 
 @router.post("", response_model=IssueResponse, status_code=status.HTTP_201_CREATED)
 async def create_issue(
     issue: IssueCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Create a new issue (admin only)"""
@@ -43,8 +82,9 @@ async def create_issue(
 
     db_issue = Issue(**issue.model_dump())
     db.add(db_issue)
-    db.commit()
-    db.refresh(db_issue)
+    await db.commit()
+    await db.refresh(db_issue)
+    invalidate_resource(CACHE_RESOURCE)
     return db_issue
 
 
@@ -52,7 +92,7 @@ async def create_issue(
 async def update_issue(
     issue_id: int,
     issue: IssueUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Update an issue (admin only)"""
@@ -63,7 +103,7 @@ async def update_issue(
             detail="Invalid API key",
         )
 
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    db_issue = await db.scalar(select(Issue).where(Issue.id == issue_id))
     if not db_issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,15 +115,16 @@ async def update_issue(
     for field, value in update_data.items():
         setattr(db_issue, field, value)
 
-    db.commit()
-    db.refresh(db_issue)
+    await db.commit()
+    await db.refresh(db_issue)
+    invalidate_resource(CACHE_RESOURCE, issue_id)
     return db_issue
 
 
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_issue(
     issue_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Delete an issue (admin only)"""
@@ -94,12 +135,13 @@ async def delete_issue(
             detail="Invalid API key",
         )
 
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    db_issue = await db.scalar(select(Issue).where(Issue.id == issue_id))
     if not db_issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Issue with ID {issue_id} not found",
         )
 
-    db.delete(db_issue)
-    db.commit()
+    await db.delete(db_issue)
+    await db.commit()
+    invalidate_resource(CACHE_RESOURCE, issue_id)
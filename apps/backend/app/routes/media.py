@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+from app.utils.photo_assets import PhotoStore, default_media_dir
+
+router = APIRouter()
+
+# Asset names contain the content hash, so a stored file never changes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/{name}")
+async def get_media(name: str):
+    """
+    Serve a stored photo variant, e.g. ``/media/<photo_key>-320.webp``
+    (see app/utils/photo_assets.py for the available widths and formats).
+    """
+    asset = PhotoStore(default_media_dir()).resolve(name)
+    if asset is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Media '{name}' not found",
+        )
+
+    path, media_type = asset
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL})
@@ -0,0 +1,126 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import cast, exists, func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.models import MP
+from app.schemas import MPCountResponse, MPProfileResponse
+from app.utils.cache import detail_key, list_key, response_cache
+from app.utils.etag import collection_etag, collection_version, etag_matches, not_modified, row_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor_headers, paginate
+from typing import List, Optional
+
+router = APIRouter()
+
+CACHE_RESOURCE = "mps"
+MPProfileResponseList = TypeAdapter(List[MPProfileResponse])
+MPProfileResponseItem = TypeAdapter(MPProfileResponse)
+MPCountResponseList = TypeAdapter(List[MPCountResponse])
+
+
+def committee_filter(dialect_name: str, committee: str):
+    """Match MPs whose committees_json array contains ``committee``"""
+    if dialect_name == "postgresql":
+        # Served by the GIN index created in migration 002_mp_indexes
+        return cast(MP.committees_json, JSONB).contains([committee])
+
+    committees = func.json_each(MP.committees_json).table_valued("value")
+    return exists().select_from(committees).where(committees.c.value == committee)
+
+
+@router.get("", response_model=List[MPProfileResponse])
+async def get_mps(
+    county: Optional[str] = None,
+    party: Optional[str] = None,
+    constituency: Optional[str] = None,
+    committee: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get MPs, one page at a time (ordered by id).
+
+    Filters match the scraped values exactly (county and constituency names
+    are upper-case on parliament.go.ke, e.g. ``NAIROBI``).
+    """
+    params = dict(
+        county=county, party=party, constituency=constituency,
+        committee=committee, limit=limit, cursor=cursor,
+    )
+    key = list_key(CACHE_RESOURCE, **params)
+    version = await collection_version(db, MP)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, **params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    stmt = select(MP)
+    if county is not None:
+        stmt = stmt.where(MP.county == county)
+    if party is not None:
+        stmt = stmt.where(MP.party == party)
+    if constituency is not None:
+        stmt = stmt.where(MP.constituency == constituency)
+    if committee is not None:
+        stmt = stmt.where(committee_filter(db.bind.dialect.name, committee))
+
+    mps, next_cursor = await paginate(db, stmt, MP.id, limit, cursor)
+    headers = {**next_cursor_headers(next_cursor), "ETag": etag}
+    return response_cache.store(key, MPProfileResponseList, mps, headers, version)
+
+
+@router.get("/counts", response_model=List[MPCountResponse])
+async def get_mp_counts(
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Number of MPs per county and party, aggregated in SQL"""
+    key = list_key(CACHE_RESOURCE, counts=True)
+    version = await collection_version(db, MP)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, counts=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    result = await db.execute(
+        select(MP.county, MP.party, func.count(MP.id).label("count"))
+        .group_by(MP.county, MP.party)
+        .order_by(MP.county, MP.party)
+    )
+    counts = [dict(row) for row in result.mappings()]
+    return response_cache.store(key, MPCountResponseList, counts, {"ETag": etag}, version)
+
+
+@router.get("/{mp_id}", response_model=MPProfileResponse)
+async def get_mp(
+    mp_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get an MP by ID"""
+    key = detail_key(CACHE_RESOURCE, mp_id)
+    version = await collection_version(db, MP)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    mp = await db.scalar(select(MP).where(MP.id == mp_id))
+    if not mp:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"MP with ID {mp_id} not found",
+        )
+
+    etag = row_etag(CACHE_RESOURCE, mp)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return response_cache.store(key, MPProfileResponseItem, mp, {"ETag": etag}, version)
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.schemas import SearchHit
+from app.utils.pagination import decode_cursor, encode_cursor, next_cursor_headers
+from app.utils.search import SEARCH_SOURCES, search
+from typing import List, Optional
+
+router = APIRouter()
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+@router.get("", response_model=List[SearchHit])
+async def search_all(
+    q: str = Query(..., min_length=2, max_length=200),
+    kind: Optional[List[str]] = Query(None, description=f"Any of: {', '.join(SEARCH_SOURCES)}"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Ranked full-text search across candidates, issues, vote-buying facts and MPs.
+
+    Results are ordered by relevance, so the cursor is an offset into the
+    ranking rather than a keyset position.
+    """
+    offset = decode_cursor(cursor) if cursor else 0
+
+    # Fetch one extra hit to find out whether another page exists
+    hits = await search(db, q, kind, limit + 1, offset)
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor(offset + limit)
+    return JSONResponse(hits, headers=next_cursor_headers(next_cursor))
@@ -1,36 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import VoteBuyingFact
 from app.schemas import VoteBuyingFactCreate, VoteBuyingFactResponse, VoteBuyingFactUpdate
-from typing import List
+from app.utils.cache import detail_key, invalidate_resource, list_key, response_cache
+from app.utils.etag import collection_etag, collection_version, etag_matches, not_modified, row_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor_headers, paginate
+from typing import List, Optional
 
 router = APIRouter()
 
+CACHE_RESOURCE = "vote_buying_facts"
+VoteBuyingFactResponseList = TypeAdapter(List[VoteBuyingFactResponse])
+VoteBuyingFactResponseItem = TypeAdapter(VoteBuyingFactResponse)
+
 
 @router.get("", response_model=List[VoteBuyingFactResponse])
-async def get_vote_buying_facts(db: Session = Depends(get_db)):
-    """Get all vote-buying facts"""
-    facts = db.query(VoteBuyingFact).all()
-    return facts
+async def get_vote_buying_facts(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get vote-buying facts, one page at a time (ordered by id)"""
+    key = list_key(CACHE_RESOURCE, limit=limit, cursor=cursor)
+    version = await collection_version(db, VoteBuyingFact)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    etag = collection_etag(CACHE_RESOURCE, version, limit=limit, cursor=cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    facts, next_cursor = await paginate(db, select(VoteBuyingFact), VoteBuyingFact.id, limit, cursor)
+    headers = {**next_cursor_headers(next_cursor), "ETag": etag}
+    return response_cache.store(key, VoteBuyingFactResponseList, facts, headers, version)
 
 
 @router.get("/{fact_id}", response_model=VoteBuyingFactResponse)
-async def get_vote_buying_fact(fact_id: int, db: Session = Depends(get_db)):
+async def get_vote_buying_fact(
+    fact_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get a vote-buying fact by ID"""
-    fact = db.query(VoteBuyingFact).filter(VoteBuyingFact.id == fact_id).first()
+    key = detail_key(CACHE_RESOURCE, fact_id)
+    version = await collection_version(db, VoteBuyingFact)
+    cached = response_cache.get(key, version)
+    if cached is not None:
+        return cached.to_response(if_none_match)
+
+    fact = await db.scalar(select(VoteBuyingFact).where(VoteBuyingFact.id == fact_id))
     if not fact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vote-buying fact with ID {fact_id} not found",
         )
-    return fact
+
+    etag = row_etag(CACHE_RESOURCE, fact)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return response_cache.store(key, VoteBuyingFactResponseItem, fact, {"ETag": etag}, version)
 
 
 @router.post("", response_model=VoteBuyingFactResponse, status_code=status.HTTP_201_CREATED)
 async def create_vote_buying_fact(
     fact: VoteBuyingFactCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Create a new vote-buying fact (admin only)"""
@@ -43,8 +82,9 @@ async def create_vote_buying_fact(
 
     db_fact = VoteBuyingFact(**fact.model_dump())
     db.add(db_fact)
-    db.commit()
-    db.refresh(db_fact)
+    await db.commit()
+    await db.refresh(db_fact)
+    invalidate_resource(CACHE_RESOURCE)
     return db_fact
 
 
@@ -52,7 +92,7 @@ async def create_vote_buying_fact(
 async def update_vote_buying_fact(
     fact_id: int,
     fact: VoteBuyingFactUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Update a vote-buying fact (admin only)"""
@@ -63,7 +103,7 @@ async def update_vote_buying_fact(
             detail="Invalid API key",
         )
 
-    db_fact = db.query(VoteBuyingFact).filter(VoteBuyingFact.id == fact_id).first()
+    db_fact = await db.scalar(select(VoteBuyingFact).where(VoteBuyingFact.id == fact_id))
     if not db_fact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,15 +115,16 @@ async def update_vote_buying_fact(
     for field, value in update_data.items():
         setattr(db_fact, field, value)
 
-    db.commit()
-    db.refresh(db_fact)
+    await db.commit()
+    await db.refresh(db_fact)
+    invalidate_resource(CACHE_RESOURCE, fact_id)
     return db_fact
 
 
 @router.delete("/{fact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_vote_buying_fact(
     fact_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_api_key: str = None,
 ):
     """Delete a vote-buying fact (admin only)"""
@@ -94,12 +135,13 @@ async def delete_vote_buying_fact(
             detail="Invalid API key",
         )
 
-    db_fact = db.query(VoteBuyingFact).filter(VoteBuyingFact.id == fact_id).first()
+    db_fact = await db.scalar(select(VoteBuyingFact).where(VoteBuyingFact.id == fact_id))
     if not db_fact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vote-buying fact with ID {fact_id} not found",
         )
 
-    db.delete(db_fact)
-    db.commit()
+    await db.delete(db_fact)
+    await db.commit()
+    invalidate_resource(CACHE_RESOURCE, fact_id)
@@ -44,6 +44,7 @@ class CandidateUpdate(BaseModel):
 
 class CandidateResponse(CandidateCreate):
     id: int
+    photo_key: Optional[str] = None  # /media/<photo_key>-<width>.webp|jpg
     updated_at: datetime
 
     class Config:
@@ -110,6 +111,33 @@ class CountyResponse(CountyCreate):
         from_attributes = True
 
 
+# MP Schemas (scraped members of the National Assembly)
+class MPProfileResponse(BaseModel):
+    id: int
+    name: str
+    county: Optional[str] = None
+    constituency: Optional[str] = None
+    party: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    bio: Optional[str] = None
+    photo_url: Optional[str] = None
+    photo_key: Optional[str] = None  # /media/<photo_key>-<width>.webp|jpg
+    profile_url: Optional[str] = None
+    committees_json: List[str] = []
+    wiki_title: Optional[str] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class MPCountResponse(BaseModel):
+    county: Optional[str] = None
+    party: Optional[str] = None
+    count: int
+
+
 # Issue Schemas
 class IssueCreate(BaseModel):
     title: str
@@ -154,6 +182,16 @@ class VoteBuyingFactResponse(VoteBuyingFactCreate):
         from_attributes = True
 
 
+# Search Schema
+class SearchHit(BaseModel):
+    kind: str  # candidate, issue, vote_buying_fact, mp
+    ref: str  # Slug or ID, as used in the item's API path
+    title: str
+    snippet: Optional[str] = None  # Matching excerpt with <mark> highlights
+    url: str
+    score: float
+
+
 # Wikipedia Schema
 class WikipediaSummaryResponse(BaseModel):
     extract: Optional[str] = None
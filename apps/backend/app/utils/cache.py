@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.utils.etag import etag_matches, not_modified
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CachedResponse:
+    """
+    A serialized JSON response body plus the headers sent with it, and the
+    version of the data it was built from
+    """
+
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    expires: float = 0.0
+    version: Any = None
+
+    def to_response(self, if_none_match: Optional[str] = None) -> Response:
+        """Full response, or 304 Not Modified when the client's ETag matches"""
+        etag = self.headers.get("ETag")
+        if etag and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+class ResponseCache:
+    """
+    Read-through cache for public GET responses.
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry is
+    evicted once ``max_entries`` is reached. Keys are tuples that start with
+    the resource name, so writes can drop exactly the affected list pages and
+    detail entries (see list_key / detail_key / invalidate_resource).
+
+    The cache is per process, and invalidate_resource() only reaches the
+    process that made the write. Writes from other processes (the MP
+    scraper, the seeder, the photo sync) are caught by versions instead:
+    routes pass the table's current collection_version() to get() and
+    store(), and an entry stored under another version is a miss.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, key: CacheKey, counter: str):
+        resource = self._counters.setdefault(
+            str(key[0]), {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        )
+        resource[counter] += 1
+
+    def get(self, key: CacheKey, version: Any = None) -> Optional[CachedResponse]:
+        """Return a live entry of ``version`` (marking it recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.expires <= time.monotonic() or entry.version != version):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._count(key, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(key, "hits")
+            return entry
+
+    def set(self, key: CacheKey, entry: CachedResponse):
+        """Store an entry, evicting least recently used entries when full"""
+        entry.expires = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._count(evicted, "evictions")
+
+    def store(
+        self,
+        key: CacheKey,
+        adapter: TypeAdapter,
+        data: Any,
+        headers: Optional[Dict[str, str]] = None,
+        version: Any = None,
+    ) -> Response:
+        """Validate and serialize ``data`` once, cache it and return the response"""
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        entry = CachedResponse(body=body, headers=dict(headers or {}), version=version)
+        self.set(key, entry)
+        return entry.to_response()
+
+    def invalidate(self, *keys: CacheKey):
+        """Drop specific entries"""
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._count(key, "invalidations")
+
+    def invalidate_prefix(self, prefix: CacheKey):
+        """Drop every entry whose key starts with ``prefix``"""
+        size = len(prefix)
+        with self._lock:
+            for key in [k for k in self._entries if k[:size] == prefix]:
+                del self._entries[key]
+                self._count(key, "invalidations")
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters, overall and per resource"""
+        with self._lock:
+            resources = {name: dict(counts) for name, counts in self._counters.items()}
+            entries = len(self._entries)
+
+        hits = sum(r["hits"] for r in resources.values())
+        misses = sum(r["misses"] for r in resources.values())
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "resources": resources,
+        }
+
+
+def list_key(resource: str, **params) -> CacheKey:
+    """Cache key for one page of a collection route"""
+    return (resource, "list", tuple(sorted(params.items())))
+
+
+def detail_key(resource: str, identifier: Any) -> CacheKey:
+    """Cache key for a single-item route"""
+    return (resource, "detail", str(identifier))
+
+
+def invalidate_resource(resource: str, *identifiers: Any):
+    """Drop all list pages of a resource plus the given detail entries"""
+    response_cache.invalidate_prefix((resource, "list"))
+    response_cache.invalidate(*(detail_key(resource, i) for i in identifiers))
+
+
+# Shared cache for all routers
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024")),
+    ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL", "300")),
+)
@@ -0,0 +1,18 @@
+"""
+If-None-Match evaluation shared by the API (app/utils/etag.py) and the
+replay server (app/utils/http_archive.py). Standard library only, so the
+record/replay tool doesn't pull in FastAPI or SQLAlchemy.
+"""
+
+from typing import Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against the current ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
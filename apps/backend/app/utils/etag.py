@@ -0,0 +1,53 @@
+"""
+ETags for the public GET endpoints.
+
+A row's ETag comes from its id and updated_at; a collection's from the
+table's max(updated_at), its row count and the page parameters. This relies
+on updated_at changing on every write, so the models set it from the
+application with microsecond resolution (not the database's
+CURRENT_TIMESTAMP, which has one-second resolution on SQLite). Writes that
+bypass the ORM must set updated_at themselves.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.conditional import etag_matches  # noqa: F401 (re-exported for the routes)
+
+
+def _make_etag(*parts: Any) -> str:
+    """Strong ETag from the given version parts"""
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _timestamp(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+
+async def collection_version(db: AsyncSession, model) -> Tuple[Optional[datetime], int]:
+    """Max updated_at and row count of a table, in one aggregate query"""
+    result = await db.execute(select(func.max(model.updated_at), func.count()).select_from(model))
+    max_updated_at, count = result.one()
+    return max_updated_at, count
+
+
+def collection_etag(resource: str, version: Tuple[Optional[datetime], int], **params) -> str:
+    """ETag for a collection page: table version plus the page parameters"""
+    max_updated_at, count = version
+    return _make_etag(resource, _timestamp(max_updated_at), count, sorted(params.items()))
+
+
+def row_etag(resource: str, row) -> str:
+    """ETag for a single row, from its id and updated_at"""
+    return _make_etag(resource, row.id, _timestamp(row.updated_at))
+
+
+def not_modified(etag: str) -> Response:
+    """304 response carrying the current ETag and no body"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,371 @@
+"""
+Interchangeable HTML parser backends for the scrapers.
+
+Each backend parses a page into an HTMLNode tree that exposes the handful of
+primitives the extraction code needs (find by tag/class/attribute, text
+search, parent/sibling navigation, text content). The search semantics are
+defined here rather than borrowed from one library, so every backend returns
+the same records for the same page:
+
+- Text nodes are searched and joined in document order; comments and the
+  contents of <script>, <style> and <template> are ignored.
+- Class filters match against the element's full ``class`` attribute.
+
+Backends:
+    html.parser  BeautifulSoup with Python's built-in parser (always available)
+    lxml         lxml.html (libxml2)
+    selectolax   selectolax's Lexbor engine
+
+get_parser("auto") picks the fastest one that is installed.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+TextFilter = Union[str, Pattern]
+
+# Strings inside these elements are never page text
+HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def _matches(value: Optional[str], wanted: TextFilter) -> bool:
+    if value is None:
+        return False
+    if isinstance(wanted, str):
+        return value == wanted
+    return wanted.search(value) is not None
+
+
+class HTMLNode(ABC):
+    """An element in a parsed page"""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def tag(self) -> str:
+        """Lower-case tag name"""
+
+    @abstractmethod
+    def attr(self, name: str) -> Optional[str]:
+        """Attribute value, or None"""
+
+    @abstractmethod
+    def parent(self) -> Optional["HTMLNode"]:
+        """Parent element (None at the top of the tree)"""
+
+    @abstractmethod
+    def next_element_sibling(self) -> Optional["HTMLNode"]:
+        """Next sibling that is an element"""
+
+    @abstractmethod
+    def iter_elements(self) -> Iterator["HTMLNode"]:
+        """Descendant elements in document order (excluding this one)"""
+
+    @abstractmethod
+    def iter_strings(self) -> Iterator[Tuple[str, "HTMLNode"]]:
+        """Descendant text nodes in document order, each with its parent element"""
+
+    @abstractmethod
+    def iter_nodes(self) -> Iterator[Tuple["HTMLNode", Optional[str]]]:
+        """
+        Descendant elements and text nodes in one document-order walk:
+        ``(element, None)`` for an element, ``(parent, text)`` for a text node
+        """
+
+    # Generic helpers built on the primitives above
+
+    def has_class(self, name: str) -> bool:
+        return name in (self.attr("class") or "").split()
+
+    def matches(
+        self,
+        tag: Optional[str] = None,
+        class_: Optional[TextFilter] = None,
+        **attrs: TextFilter,
+    ) -> bool:
+        """Whether this element has the given tag, class and attribute values"""
+        if tag is not None and self.tag != tag:
+            return False
+        if class_ is not None:
+            if isinstance(class_, str):
+                if not self.has_class(class_):
+                    return False
+            elif not _matches(self.attr("class"), class_):
+                return False
+        return all(_matches(self.attr(name), wanted) for name, wanted in attrs.items())
+
+    def find(self, tag: Optional[str] = None, class_: Optional[TextFilter] = None, **attrs: TextFilter) -> Optional["HTMLNode"]:
+        """First descendant element matching the filters"""
+        for element in self.iter_elements():
+            if element.matches(tag, class_, **attrs):
+                return element
+        return None
+
+    def find_all(self, tag: Optional[str] = None, class_: Optional[TextFilter] = None, **attrs: TextFilter) -> List["HTMLNode"]:
+        """All descendant elements matching the filters"""
+        return [element for element in self.iter_elements() if element.matches(tag, class_, **attrs)]
+
+    def find_string(self, pattern: Pattern) -> Optional[Tuple[str, "HTMLNode"]]:
+        """First descendant text node matching ``pattern``, with its parent element"""
+        for text, parent in self.iter_strings():
+            if pattern.search(text):
+                return text, parent
+        return None
+
+    def find_next_sibling(self, tag: Optional[str] = None, class_: Optional[TextFilter] = None) -> Optional["HTMLNode"]:
+        """First following sibling element matching the filters"""
+        sibling = self.next_element_sibling()
+        while sibling is not None and not sibling.matches(tag, class_):
+            sibling = sibling.next_element_sibling()
+        return sibling
+
+    def find_parent(self, tag: str) -> Optional["HTMLNode"]:
+        """Closest ancestor with the given tag"""
+        parent = self.parent()
+        while parent is not None and parent.tag != tag:
+            parent = parent.parent()
+        return parent
+
+    def text(self, separator: str = "") -> str:
+        """All text inside this element"""
+        return separator.join(text for text, _ in self.iter_strings())
+
+
+# ---------------------------------------------------------------------------
+# BeautifulSoup (html.parser)
+# ---------------------------------------------------------------------------
+
+class SoupNode(HTMLNode):
+    __slots__ = ("_tag",)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def tag(self) -> str:
+        return self._tag.name
+
+    def attr(self, name: str) -> Optional[str]:
+        value = self._tag.get(name)
+        if isinstance(value, list):  # Multi-valued attributes such as class
+            return " ".join(value)
+        return value
+
+    def parent(self) -> Optional[HTMLNode]:
+        parent = self._tag.parent
+        return SoupNode(parent) if parent is not None else None
+
+    def next_element_sibling(self) -> Optional[HTMLNode]:
+        sibling = self._tag.find_next_sibling()
+        return SoupNode(sibling) if sibling is not None else None
+
+    def iter_elements(self) -> Iterator[HTMLNode]:
+        from bs4 import Tag
+
+        for node in self._tag.descendants:
+            if isinstance(node, Tag):
+                yield SoupNode(node)
+
+    def iter_strings(self) -> Iterator[Tuple[str, HTMLNode]]:
+        from bs4 import NavigableString
+
+        # Comments, doctypes and script/style/template strings are subclasses
+        for node in self._tag.descendants:
+            if type(node) is NavigableString:
+                yield str(node), SoupNode(node.parent)
+
+    def iter_nodes(self) -> Iterator[Tuple[HTMLNode, Optional[str]]]:
+        from bs4 import NavigableString, Tag
+
+        for node in self._tag.descendants:
+            if isinstance(node, Tag):
+                yield SoupNode(node), None
+            elif type(node) is NavigableString:
+                yield SoupNode(node.parent), str(node)
+
+
+def parse_html_parser(html: str) -> HTMLNode:
+    from bs4 import BeautifulSoup
+
+    return SoupNode(BeautifulSoup(html, "html.parser"))
+
+
+# ---------------------------------------------------------------------------
+# lxml
+# ---------------------------------------------------------------------------
+
+class LxmlNode(HTMLNode):
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    @staticmethod
+    def _is_element(el) -> bool:
+        return isinstance(el.tag, str)  # Comments and PIs have callable tags
+
+    @property
+    def tag(self) -> str:
+        return self._el.tag
+
+    def attr(self, name: str) -> Optional[str]:
+        return self._el.get(name)
+
+    def parent(self) -> Optional[HTMLNode]:
+        parent = self._el.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def next_element_sibling(self) -> Optional[HTMLNode]:
+        sibling = self._el.getnext()
+        while sibling is not None and not self._is_element(sibling):
+            sibling = sibling.getnext()
+        return LxmlNode(sibling) if sibling is not None else None
+
+    def iter_elements(self) -> Iterator[HTMLNode]:
+        for el in self._el.iterdescendants():
+            if self._is_element(el):
+                yield LxmlNode(el)
+
+    def iter_strings(self) -> Iterator[Tuple[str, HTMLNode]]:
+        yield from self._strings(self._el)
+
+    def _strings(self, el) -> Iterator[Tuple[str, HTMLNode]]:
+        # lxml keeps text before the first child in .text and text after
+        # each child in child.tail
+        node = LxmlNode(el)
+        if el.text and el.tag not in HIDDEN_TEXT_TAGS:
+            yield el.text, node
+        for child in el:
+            if self._is_element(child):
+                yield from self._strings(child)
+            if child.tail:
+                yield child.tail, node
+
+    def iter_nodes(self) -> Iterator[Tuple[HTMLNode, Optional[str]]]:
+        yield from self._nodes(self._el, LxmlNode(self._el))
+
+    def _nodes(self, el, node: HTMLNode) -> Iterator[Tuple[HTMLNode, Optional[str]]]:
+        if el.text and el.tag not in HIDDEN_TEXT_TAGS:
+            yield node, el.text
+        for child in el:
+            if self._is_element(child):
+                child_node = LxmlNode(child)
+                yield child_node, None
+                yield from self._nodes(child, child_node)
+            if child.tail:
+                yield node, child.tail
+
+
+def parse_lxml(html: str) -> HTMLNode:
+    import lxml.html
+
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    return LxmlNode(lxml.html.document_fromstring(html.encode("utf-8"), parser=parser))
+
+
+# ---------------------------------------------------------------------------
+# selectolax (Lexbor)
+# ---------------------------------------------------------------------------
+
+class LexborNode(HTMLNode):
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+
+    def attr(self, name: str) -> Optional[str]:
+        return self._node.attributes.get(name)
+
+    def parent(self) -> Optional[HTMLNode]:
+        parent = self._node.parent
+        if parent is None or not parent.is_element_node:
+            return None
+        return LexborNode(parent)
+
+    def next_element_sibling(self) -> Optional[HTMLNode]:
+        sibling = self._node.next
+        while sibling is not None and not sibling.is_element_node:
+            sibling = sibling.next
+        return LexborNode(sibling) if sibling is not None else None
+
+    def iter_elements(self) -> Iterator[HTMLNode]:
+        nodes = self._node.traverse()
+        next(nodes, None)  # traverse() starts with the node itself
+        for node in nodes:
+            if node.is_element_node:  # Skip comments
+                yield LexborNode(node)
+
+    def iter_strings(self) -> Iterator[Tuple[str, HTMLNode]]:
+        for node in self._node.traverse(include_text=True):
+            if node.is_text_node:
+                parent = node.parent
+                if parent.tag not in HIDDEN_TEXT_TAGS:
+                    yield node.text_content, LexborNode(parent)
+
+    def iter_nodes(self) -> Iterator[Tuple[HTMLNode, Optional[str]]]:
+        nodes = self._node.traverse(include_text=True)
+        next(nodes, None)
+        for node in nodes:
+            if node.is_element_node:
+                yield LexborNode(node), None
+            elif node.is_text_node:
+                parent = node.parent
+                if parent.tag not in HIDDEN_TEXT_TAGS:
+                    yield LexborNode(parent), node.text_content
+
+
+def parse_selectolax(html: str) -> HTMLNode:
+    from selectolax.lexbor import LexborHTMLParser
+
+    return LexborNode(LexborHTMLParser(html).root)
+
+
+# Fastest first
+PARSER_BACKENDS: Dict[str, Callable[[str], HTMLNode]] = {
+    "selectolax": parse_selectolax,
+    "lxml": parse_lxml,
+    "html.parser": parse_html_parser,
+}
+
+_BACKEND_MODULES = {"selectolax": "selectolax.lexbor", "lxml": "lxml.html", "html.parser": "bs4"}
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first"""
+    import importlib.util
+
+    available = []
+    for name, module in _BACKEND_MODULES.items():
+        try:
+            if importlib.util.find_spec(module) is not None:
+                available.append(name)
+        except ModuleNotFoundError:
+            continue
+    return available
+
+
+def get_parser(name: str = "auto") -> Callable[[str], HTMLNode]:
+    """
+    Parse function for a backend name, or the fastest installed one for "auto"
+
+    Raises:
+        ValueError: Unknown backend name
+        RuntimeError: Backend not installed
+    """
+    if name == "auto":
+        available = available_backends()
+        if not available:
+            raise RuntimeError("No HTML parser installed. Install beautifulsoup4, lxml or selectolax.")
+        return PARSER_BACKENDS[available[0]]
+
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser {name!r}. Choose from: auto, {', '.join(PARSER_BACKENDS)}")
+    if name not in available_backends():
+        raise RuntimeError(f"HTML parser {name!r} is not installed (pip install {_BACKEND_MODULES[name].split('.')[0]})")
+    return PARSER_BACKENDS[name]
@@ -0,0 +1,288 @@
+"""
+Record/replay archive of scraper HTTP traffic, for offline runs and benchmarks.
+
+Recording (``CompleteMPScraper(archive=...)``) stores every response the
+scraper receives. Replaying serves the archive from a local stand-in
+server (ArchiveServer) that the scraper is pointed at with ``fetch_origin``.
+A full crawl can then be re-parsed and timed without touching the live
+site. The results are deterministic and run at full speed.
+
+Layout of an archive directory:
+
+    index.json                    path?query -> status, kept headers, body digest
+    blobs/ab/ab12...ef.gz         gzip-compressed bodies named by their sha256
+
+Bodies are content-addressed, so identical pages (error pages, unchanged
+profiles across recordings) are stored once. Entries are keyed by path and
+query only, so an archive replays on any host and port. When a URL is
+fetched more than once, the last response is kept.
+
+From the backend directory:
+    python -m app.utils.http_archive serve <archive dir> [--port 8770] [--latency 0.05] [--error-rate 0.05]
+    python -m app.utils.http_archive stats <archive dir>
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from app.utils.conditional import etag_matches
+
+# Response headers worth replaying (validators, content type, back-off hints)
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+def archive_key(url: str) -> str:
+    """Path and query of a URL (or of a request path), the archive's lookup key"""
+    parts = urlsplit(url)
+    return f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+
+
+@dataclass
+class ArchivedResponse:
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class HTTPArchive:
+    """
+    Thread-safe, content-addressed response archive in ``directory``.
+
+    The index is written by save() / close(); blobs are written as they are
+    recorded.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.entries: Dict[str, Dict] = {}
+        self.recorded_at: Optional[str] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data["entries"]
+            self.recorded_at = data.get("recorded_at")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], f"{digest}.gz")
+
+    def record(self, url: str, status: int, headers: Mapping[str, str], body: bytes):
+        """Store one response (replacing any earlier one for the same path and query)"""
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(body, mtime=0))  # mtime=0: same body, same blob
+            os.replace(tmp_path, blob_path)
+
+        wanted = {name.lower(): name for name in KEPT_HEADERS}
+        kept = {wanted[name.lower()]: value for name, value in headers.items() if name.lower() in wanted}
+        with self._lock:
+            self.entries[archive_key(url)] = {
+                "url": url,
+                "status": status,
+                "headers": kept,
+                "sha256": digest,
+                "size": len(body),
+            }
+            self._dirty = True
+
+    def get(self, url: str) -> Optional[ArchivedResponse]:
+        """The archived response for a URL or request path, or None"""
+        entry = self.entries.get(archive_key(url))
+        if entry is None:
+            return None
+        with open(self._blob_path(entry["sha256"]), "rb") as f:
+            body = gzip.decompress(f.read())
+        return ArchivedResponse(entry["status"], body, dict(entry["headers"]))
+
+    def save(self):
+        """Write the index atomically (sorted, so recordings diff cleanly)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            self.recorded_at = datetime.now().isoformat()
+            data = {"recorded_at": self.recorded_at, "entries": self.entries}
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+
+    def close(self):
+        self.save()
+
+    def __enter__(self) -> "HTTPArchive":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Responses, distinct bodies, raw body bytes and compressed bytes on disk"""
+        digests = {entry["sha256"] for entry in self.entries.values()}
+        return {
+            "responses": len(self.entries),
+            "bodies": len(digests),
+            "raw_bytes": sum(entry["size"] for entry in self.entries.values()),
+            "stored_bytes": sum(
+                os.path.getsize(self._blob_path(digest))
+                for digest in digests
+                if os.path.exists(self._blob_path(digest))
+            ),
+        }
+
+
+class ArchiveServer:
+    """
+    Local stand-in HTTP server replaying an HTTPArchive.
+
+    Archived responses are served with their status and kept headers
+    (If-None-Match against an archived ETag gets 304); anything not in the
+    archive is a 404. ``latency`` adds a fixed delay to every response and
+    ``error_rate`` answers that fraction of requests with a 503 instead
+    (Retry-After: 0), for benchmarking the scraper's retries.
+
+    Args:
+        archive: Archive to serve
+        host / port: Bind address (port 0 picks a free one)
+        latency: Seconds to wait before each response
+        error_rate: Fraction of requests that get an injected 503
+        seed: Seed for choosing those requests (repeatable runs)
+    """
+
+    def __init__(
+        self,
+        archive: HTTPArchive,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.archive = archive
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.misses = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    fail = server.error_rate > 0 and server._random.random() < server.error_rate
+                    server.errors += fail
+                if server.latency:
+                    time.sleep(server.latency)
+                if fail:
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                response = server.archive.get(self.path)
+                if response is None:
+                    with server._lock:
+                        server.misses += 1
+                    self.send_error(404, "Not in archive")
+                    return
+
+                etag = response.headers.get("ETag")
+                if etag and etag_matches(self.headers.get("If-None-Match"), etag):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+        return Handler
+
+    def start(self) -> "ArchiveServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="archive-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "ArchiveServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper HTTP archive tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="replay an archive on a local HTTP server")
+    serve.add_argument("directory")
+    serve.add_argument("--port", type=int, default=8770)
+    serve.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    stats = commands.add_parser("stats", help="summarize an archive")
+    stats.add_argument("directory")
+    args = parser.parse_args()
+
+    archive = HTTPArchive(args.directory)
+    if args.command == "stats":
+        summary = archive.stats()
+        print(f"Recorded: {archive.recorded_at}")
+        print(f"Responses: {summary['responses']} ({summary['bodies']} distinct bodies)")
+        print(f"Size: {summary['raw_bytes'] / 1024:.0f} KB raw, {summary['stored_bytes'] / 1024:.0f} KB compressed")
+        return
+
+    server = ArchiveServer(archive, port=args.port, latency=args.latency, error_rate=args.error_rate).start()
+    print(f"Replaying {len(archive.entries)} responses from {args.directory} at {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
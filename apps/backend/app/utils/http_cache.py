@@ -0,0 +1,166 @@
+"""
+Persistent HTTP response cache for the scrapers.
+
+Bodies are stored in a small SQLite file together with their ETag and
+Last-Modified validators, so the next run can revalidate a page with
+If-None-Match / If-Modified-Since and skip the download when the server
+answers 304 Not Modified. Each entry can also hold the record parsed from the
+body, which lets callers skip re-parsing unchanged pages too.
+
+The cache is bounded by total body size; the least recently used entries are
+evicted first.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    record TEXT,
+    record_version INTEGER,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CacheEntry:
+    """A stored response"""
+
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    record: Any = None
+    record_version: Optional[int] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the server to revalidate this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Thread-safe on-disk cache of HTTP responses keyed by URL.
+
+    Args:
+        path: SQLite file to store responses in
+        max_bytes: Total body size kept before LRU eviction
+        max_entry_bytes: Larger bodies are never stored
+    """
+
+    def __init__(self, path: str, max_bytes: int = 200 * 1024 * 1024, max_entry_bytes: int = 5 * 1024 * 1024):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "revalidated": 0, "fetched": 0, "stored": 0, "evicted": 0}
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Stored entry for ``url`` (marking it recently used) or None"""
+        with self._lock:
+            self.counters["requests"] += 1
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, record, record_version FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+        body, etag, last_modified, record, record_version = row
+        return CacheEntry(
+            url=url,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            record=json.loads(record) if record is not None else None,
+            record_version=record_version,
+        )
+
+    def put(self, url: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a 200 response; responses without validators are not worth keeping"""
+        with self._lock:
+            self.counters["fetched"] += 1
+            if not (etag or last_modified) or len(body) > self.max_entry_bytes:
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._conn.commit()
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, etag, last_modified, record, record_version, size, last_used) "
+                "VALUES (?, ?, ?, ?, NULL, NULL, ?, ?)",
+                (url, body, etag, last_modified, len(body), time.time()),
+            )
+            self.counters["stored"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def set_record(self, url: str, record: Any, version: int):
+        """Attach the record parsed from ``url``'s stored body"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET record = ?, record_version = ? WHERE url = ?",
+                (json.dumps(record), version, url),
+            )
+            self._conn.commit()
+
+    def mark_revalidated(self):
+        """Count a 304 answer for a stored entry"""
+        with self._lock:
+            self.counters["revalidated"] += 1
+
+    def _evict(self):
+        total = self._conn.execute("SELECT coalesce(sum(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.counters["evicted"] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        """Counters plus current size and hit rate (304s / requests)"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT count(*), coalesce(sum(size), 0) FROM responses"
+            ).fetchone()
+            counters = dict(self.counters)
+        requests = counters["requests"]
+        return {
+            **counters,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(counters["revalidated"] / requests, 4) if requests else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,135 @@
+"""
+In-process background jobs for long-running admin tasks (MP scrapes).
+
+Jobs run on a single worker thread, off the event loop, so the HTTP request
+that starts one returns straight away with the job id and clients poll the
+job for its state, progress counts, timings and error. Only one job of each
+kind can be queued or running at a time.
+
+Jobs live in memory: a restart forgets finished jobs (an interrupted scrape
+resumes from its checkpoint on the next run) and the single-flight guarantee
+holds within one server process.
+"""
+
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """One submitted job; ``progress`` is replaced as the job reports it"""
+
+    id: str
+    kind: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    state: str = QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.state in (QUEUED, RUNNING)
+
+    def report(self, progress: Dict[str, Any]):
+        """Progress callback handed to the job function"""
+        self.progress = {**progress, "updated_at": datetime.now().isoformat()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.finished_at or datetime.now()
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "state": self.state,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "queued_seconds": round(((self.started_at or end) - self.created_at).total_seconds(), 3),
+            "run_seconds": round((end - self.started_at).total_seconds(), 3) if self.started_at else None,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobConflictError(RuntimeError):
+    """A job of the same kind is already queued or running"""
+
+    def __init__(self, job: Job):
+        super().__init__(f"A {job.kind} job is already {job.state} ({job.id})")
+        self.job = job
+
+
+class JobRunner:
+    """
+    Runs submitted jobs one at a time on a worker thread.
+
+    Args:
+        max_finished: Finished jobs kept for status queries (oldest dropped first)
+    """
+
+    def __init__(self, max_finished: int = 50):
+        self.max_finished = max_finished
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobs")
+
+    def submit(self, kind: str, fn: Callable[..., Any], **params) -> Job:
+        """
+        Queue ``fn(job, **params)``; its return value becomes the job result.
+
+        Raises:
+            JobConflictError: A ``kind`` job is already queued or running
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.kind == kind and job.active:
+                    raise JobConflictError(job)
+            job = Job(id=uuid.uuid4().hex, kind=kind, params=params)
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: Job, fn: Callable[..., Any]):
+        job.state = RUNNING
+        job.started_at = datetime.now()
+        try:
+            job.result = fn(job, **job.params)
+            state = SUCCEEDED
+        except Exception as e:
+            traceback.print_exc()
+            job.error = f"{type(e).__name__}: {e}"
+            state = FAILED
+        job.finished_at = datetime.now()
+        job.state = state  # Last, so a finished job always has its timings
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if not job.active]
+        for job in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """All known jobs, newest first"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+
+job_runner = JobRunner()
@@ -0,0 +1,191 @@
+"""
+Streaming NDJSON storage for scraped MP records.
+
+MPRecordWriter appends one JSON record per line as soon as a profile is
+parsed and fsyncs every few records, so a crash keeps everything written so
+far. Closing it writes a compact county index next to the data file
+(``<name>.index.json``: county → byte offsets of that county's lines).
+
+Readers:
+    read_records(path)          every record, tolerating a torn last line
+    read_county(path, county)   one county's records via the index
+    load_legacy_output(path)    the old mps_complete.json structure
+                                ({scraped_at, total_mps, mps, by_county})
+
+To rebuild the old JSON file, from the backend directory:
+    python -m app.utils.mp_records mps_complete.ndjson mps_complete.json
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+
+def index_path(path: str) -> str:
+    """County index file for an NDJSON data file"""
+    return f"{os.path.splitext(path)[0]}.index.json"
+
+
+class MPRecordWriter:
+    """
+    Append-only NDJSON writer with periodic fsync.
+
+    Args:
+        path: Data file
+        append: Keep existing records (resume) instead of truncating
+        fsync_every: fsync after this many records...
+        fsync_seconds: ...or once this much time passed since the last one
+    """
+
+    def __init__(self, path: str, append: bool = False, fsync_every: int = 25, fsync_seconds: float = 5.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_seconds = fsync_seconds
+        self.counties: Dict[str, List[int]] = {}
+        self.count = 0
+        self.started_at = datetime.now().isoformat()
+
+        if append and os.path.exists(path):
+            previous = read_index(path)
+            if previous:
+                self.started_at = previous["scraped_at"]
+            # Re-index what is already there, dropping a torn last line
+            valid_end = 0
+            for offset, record in _scan(path):
+                self._index(record, offset)
+                valid_end = offset + record.pop("_length")
+            with open(path, "rb+") as f:
+                f.truncate(valid_end)
+
+        # The index is rewritten on close; until then readers fall back to scanning
+        if os.path.exists(index_path(path)):
+            os.remove(index_path(path))
+
+        self._file = open(path, "ab" if append else "wb")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _index(self, record: Dict, offset: int):
+        self.counties.setdefault(record.get("county") or "Unknown", []).append(offset)
+        self.count += 1
+
+    def write(self, record: Dict):
+        """Append one record"""
+        offset = self._file.tell()
+        self._file.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._file.flush()
+        self._index(record, offset)
+
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_seconds:
+            self.sync()
+
+    def sync(self):
+        """Force written records to disk"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync the data file and write the county index"""
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+
+        index = {
+            "scraped_at": self.started_at,
+            "total_mps": self.count,
+            "counties": self.counties,
+        }
+        tmp_path = f"{index_path(self.path)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, index_path(self.path))
+
+    def __enter__(self) -> "MPRecordWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _scan(path: str) -> Iterator[tuple]:
+    """(byte offset, record) for each complete line; record["_length"] is the line length"""
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # Torn write at the end of a crashed run
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            record["_length"] = len(line)
+            yield offset, record
+            offset += len(line)
+
+
+def read_records(path: str) -> Iterator[Dict]:
+    """Every complete record in file order"""
+    for _, record in _scan(path):
+        record.pop("_length")
+        yield record
+
+
+def read_index(path: str) -> Optional[Dict]:
+    """The county index, or None if the run did not finish"""
+    try:
+        with open(index_path(path), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def read_county(path: str, county: str) -> List[Dict]:
+    """Records for one county, seeking straight to them when the index exists"""
+    index = read_index(path)
+    if index is None:
+        return [r for r in read_records(path) if (r.get("county") or "Unknown") == county]
+
+    records = []
+    with open(path, "rb") as f:
+        for offset in index["counties"].get(county, []):
+            f.seek(offset)
+            records.append(json.loads(f.readline()))
+    return records
+
+
+def load_legacy_output(path: str) -> Dict:
+    """Rebuild the old save_to_json() structure from an NDJSON file"""
+    from app.utils.mp_scraper import group_by_county
+
+    mps = list(read_records(path))
+    index = read_index(path)
+    scraped_at = index["scraped_at"] if index else datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+    return {
+        "scraped_at": scraped_at,
+        "total_mps": len(mps),
+        "mps": mps,
+        "by_county": group_by_county(mps),
+    }
+
+
+def write_legacy_json(path: str, filename: str) -> Dict:
+    """Write the old indented mps_complete.json format from an NDJSON file"""
+    output = load_legacy_output(path)
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    return output
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m app.utils.mp_records <records.ndjson> <output.json>")
+        sys.exit(1)
+    output = write_legacy_json(sys.argv[1], sys.argv[2])
+    print(f"✓ Wrote {output['total_mps']} MPs ({len(output['by_county'])} counties) to {sys.argv[2]}")
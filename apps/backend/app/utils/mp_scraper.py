@@ -7,140 +7,400 @@ Two-step process:
 """
 
 import requests
-from bs4 import BeautifulSoup
+import hashlib
 import json
+import os
 import re
+import threading
 import time
-from datetime import datetime
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from sqlalchemy import case, delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from app.models import MP, County
+from app.models import MP, County, CountyMP
+from app.utils.cache import invalidate_resource
+from app.utils.html_parsers import HTMLNode, get_parser
+from app.utils.http_archive import ArchiveServer, HTTPArchive
+from app.utils.http_cache import CacheEntry, HTTPCache
+from app.utils.mp_records import MPRecordWriter, read_records
+from app.utils.photo_assets import sync_photo_assets
+from app.utils.scrape_checkpoint import ScrapeCheckpoint
+from app.utils.scrape_manifest import ManifestDiff, ScrapeManifest
+from app.utils.scrape_pipeline import FetchParsePipeline
+from app.utils.throttle import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+    parse_retry_after,
+)
+from app.utils.wikipedia import prefetch_tracked_summaries
+
+# Responses worth retrying: the server is overloaded or briefly unavailable
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 
 
 class CompleteMPScraper:
     """Complete MP scraper with pagination and detail page scraping"""
     
-    def __init__(self, delay: float = 1.0):
-        self.base_url = "https://www.parliament.go.ke"
+    # Bump when parsing changes so records cached by HTTPCache are re-parsed
+    PARSER_VERSION = 4
+    
+    def __init__(
+        self,
+        delay: float = 1.0,
+        workers: int = 1,
+        base_url: str = "https://www.parliament.go.ke",
+        http_cache: Optional[HTTPCache] = None,
+        parser: str = "auto",
+        parse_processes: int = 0,
+        ordered: bool = True,
+        min_delay: Optional[float] = None,
+        max_delay: float = 30.0,
+        max_retries: int = 3,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        archive: Optional[HTTPArchive] = None,
+        fetch_origin: Optional[str] = None,
+    ):
+        self.base_url = base_url.rstrip('/')
         self.listing_url = f"{self.base_url}/the-national-assembly/mps"
-        self.delay = delay  # Delay between requests (be respectful!)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.delay = delay  # Starting average gap between requests to one host (be respectful!)
+        self.workers = max(1, workers)  # Requests in flight at once
+        self.http_cache = http_cache
+        self.archive = archive  # Record every response received (see app/utils/http_archive.py)
+        # Send requests here (e.g. an ArchiveServer) instead of base_url's host;
+        # URLs in records still use base_url
+        self.fetch_origin = fetch_origin.rstrip('/') if fetch_origin else None
+        self.parser = parser  # HTML parser backend (see app/utils/html_parsers.py)
+        self.parse_html = get_parser(parser)
+        self.parse_processes = parse_processes  # Parse profiles in a process pool (0: in worker threads)
+        self.ordered = ordered  # Keep profiles in listing order
+        self.on_record: Optional[Callable[[Dict], None]] = None  # Called with each record as it is scraped
+        self.checkpoint: Optional[ScrapeCheckpoint] = None  # Crawl frontier to skip done pages and record progress
+        # The gap then adapts to the server's latency and errors, between
+        # min_delay (default: delay, i.e. never faster) and max_delay
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate=1 / delay,
+            min_rate=1 / max_delay,
+            max_rate=1 / (min_delay or delay),
+        ) if delay > 0 else None
+        self.max_retries = max_retries  # Retries after a timeout, connection error, 429 or 5xx
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.retries = 0
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0  # In this process (not parser processes)
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        }
+        # requests.Session is not thread-safe, so each worker thread gets its own
+        self._local = threading.local()
+        self.pages_fetched = 0
+        self.manifest_diff: Optional[ManifestDiff] = None  # Set by scrape_all_mps when given a manifest
+        self._stats_lock = threading.Lock()
     
-    def scrape_all_mps(self, max_pages: int = 35) -> List[Dict]:
-        """Main method: scrape all MPs with complete details"""
+    @property
+    def session(self) -> requests.Session:
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(self.headers)
+        return self._local.session
+    
+    def scrape_all_mps(
+        self,
+        max_pages: int = 35,
+        manifest: Optional[ScrapeManifest] = None,
+        incremental: bool = False,
+        resumed: Optional[Dict[str, Dict]] = None,
+    ) -> List[Dict]:
+        """
+        Main method: scrape all MPs with complete details
+        
+        Args:
+            max_pages: Maximum number of listing pages
+            manifest: Scrape manifest to diff against and update (optional)
+            incremental: Only fetch profiles the manifest reports as new,
+                changed or stale; reuse its records for the rest
+            resumed: Records already scraped by an interrupted run of this
+                crawl (profile URL -> record); those profiles are not fetched
+                again or passed to on_record
+        """
         print("=" * 70)
         print("KENYA PARLIAMENT COMPLETE MP SCRAPER")
         print("=" * 70)
+        print(f"Workers: {self.workers}, rate limit: {self.rate_description()}")
         print()
         
+        started = time.monotonic()
+        self.pages_fetched = 0
+        self.retries = 0
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0
+        self.manifest_diff = None
+        
         # Step 1: Get all MP profile URLs from listing pages
         print("STEP 1: Collecting MP profile URLs from listing pages...")
         print("-" * 70)
-        profile_urls = self.scrape_listing_pages(max_pages)
+        listing_rows = self.scrape_listing_rows(max_pages)
+        profile_urls = list(listing_rows)
         
         print(f"\n✓ Found {len(profile_urls)} MP profiles")
+        
+        if manifest is not None and listing_rows:
+            self.manifest_diff = manifest.diff(listing_rows)
+            summary = self.manifest_diff.summary()
+            print(
+                f"  Manifest: {summary['new']} new, {summary['changed']} changed, "
+                f"{summary['stale']} stale, {summary['unchanged']} unchanged, "
+                f"{summary['disappeared']} disappeared"
+            )
+            if incremental:
+                profile_urls = self.manifest_diff.to_fetch
         print()
         
         # Step 2: Visit each profile to get complete details
         print("STEP 2: Scraping detailed information from each MP page...")
         print("-" * 70)
-        all_mps = self.scrape_mp_details(profile_urls)
+        already_written = resumed or {}
+        resumed = {url: already_written[url] for url in profile_urls if url in already_written}
+        to_fetch = [url for url in profile_urls if url not in resumed]
+        if resumed:
+            print(f"  Resuming: {len(resumed)} profiles already scraped, {len(to_fetch)} to go")
+        if self.checkpoint:
+            self.checkpoint.finish_listing(to_fetch)
+        
+        all_mps = self.scrape_mp_details(to_fetch)
+        if len(all_mps) < len(to_fetch):
+            print(f"\n⚠ {len(to_fetch) - len(all_mps)} profiles could not be scraped (errors above)")
+        if resumed:
+            fetched = {**resumed, **{mp['profile_url']: mp for mp in all_mps}}
+            all_mps = [fetched[url] for url in profile_urls if url in fetched]
         
+        if self.manifest_diff is not None:
+            fetched = {mp['profile_url']: mp for mp in all_mps}
+            if incremental:
+                # Unchanged profiles (and changed ones that failed) keep their last record
+                all_mps = []
+                for url in listing_rows:
+                    record = fetched.get(url)
+                    if record is None:
+                        record = manifest.record(url)
+                        if record and self.on_record and url not in already_written:
+                            self.on_record(record)
+                    if record:
+                        all_mps.append(record)
+            for url in self.manifest_diff.disappeared:
+                record = manifest.record(url) or {}
+                print(f"  ⚠ No longer listed: {record.get('name') or url}")
+            manifest.update(listing_rows, fetched, self.manifest_diff.disappeared)
+            manifest.save()
+        
+        elapsed = time.monotonic() - started
         print(f"\n✓ Successfully scraped {len(all_mps)} complete MP profiles")
+        print(
+            f"✓ Fetched {self.pages_fetched} pages in {elapsed:.1f}s "
+            f"({self.pages_fetched / elapsed if elapsed else 0:.2f} pages/sec)"
+        )
+        if self.pages_parsed:
+            print(f"  Parsed {self.pages_parsed} pages, {self.parse_seconds / self.pages_parsed * 1000:.1f} ms/page")
+        print(
+            f"  Retries: {self.retries}, circuit opened: {self.circuit_breaker.opened}x, "
+            f"rate limit now: {self.rate_description()}"
+        )
         return all_mps
     
+    def rate_description(self) -> str:
+        if not self.rate_limiter:
+            return "none"
+        health = self.rate_limiter.stats().get(urlsplit(self.base_url).netloc)
+        if not health:
+            return f"{self.rate_limiter.rate:.2f} req/s per host (adaptive)"
+        return (
+            f"{health['rate']:.2f} req/s per host (latency {health['latency'] * 1000:.0f} ms, "
+            f"errors {health['error_rate'] * 100:.0f}%)"
+        )
+    
+    def listing_page_url(self, page_num: int) -> str:
+        """URL of listing page ``page_num`` (0-based)"""
+        # Drupal pagination: page=0 is page 2, page=1 is page 3, etc.
+        if page_num == 0:
+            return self.listing_url
+        return f"{self.listing_url}?page={page_num - 1}"
+    
     def scrape_listing_pages(self, max_pages: int = 35) -> List[str]:
         """Scrape all listing pages to collect MP profile URLs"""
-        all_profile_urls = set()  # Use set to avoid duplicates
+        return list(self.scrape_listing_rows(max_pages))
+    
+    def scrape_listing_rows(self, max_pages: int = 35) -> Dict[str, str]:
+        """
+        Scrape all listing pages to collect MP profile URLs, each with a
+        fingerprint of its listing row.
         
-        for page_num in range(max_pages):
-            # Drupal pagination: page=0 is page 2, page=1 is page 3, etc.
-            if page_num == 0:
-                url = self.listing_url
-            else:
-                url = f"{self.listing_url}?page={page_num - 1}"
-            
-            try:
-                print(f"  Scraping page {page_num + 1}/{max_pages}: {url}")
-                soup = self.fetch_page(url)
-                
-                # Find all MP profile links
-                profile_links = self.extract_profile_links(soup)
-                
-                if not profile_links:
-                    print(f"    ⚠ No profiles found on page {page_num + 1}, stopping...")
-                    break
-                
-                print(f"    ✓ Found {len(profile_links)} profiles")
-                all_profile_urls.update(profile_links)
-                
-                # Be respectful - delay between requests
-                time.sleep(self.delay)
+        Pages are fetched in waves of ``workers`` pages and processed in page
+        order, stopping at the first page without profiles, so the result is
+        the same as fetching them one by one. Pages already recorded in the
+        checkpoint are not fetched again.
+        """
+        all_rows = {}  # Keeps first-seen order, drops duplicates
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for wave_start in range(0, max_pages, self.workers):
+                page_nums = range(wave_start, min(wave_start + self.workers, max_pages))
+                results = pool.map(self._fetch_listing_page, page_nums)
                 
-            except Exception as e:
-                print(f"    ✗ Error on page {page_num + 1}: {e}")
-                continue
+                for page_num, (profile_links, error) in zip(page_nums, results):
+                    print(f"  Scraping page {page_num + 1}/{max_pages}: {self.listing_page_url(page_num)}")
+                    if isinstance(error, CircuitOpenError):
+                        raise error
+                    if error:
+                        print(f"    ✗ Error on page {page_num + 1}: {error}")
+                        continue
+                    if self.checkpoint:
+                        self.checkpoint.record_listing_page(page_num, profile_links)
+                    
+                    if not profile_links:
+                        print(f"    ⚠ No profiles found on page {page_num + 1}, stopping...")
+                        return all_rows
+                    
+                    print(f"    ✓ Found {len(profile_links)} profiles")
+                    for url, fingerprint in profile_links.items():
+                        all_rows.setdefault(url, fingerprint)
         
-        return list(all_profile_urls)
+        return all_rows
+    
+    def _fetch_listing_page(self, page_num: int):
+        """({profile link: row fingerprint}, error) for one listing page"""
+        if self.checkpoint:
+            rows = self.checkpoint.listing_page(page_num)
+            if rows is not None:
+                return rows, None
+        try:
+            return self.fetch_parsed(self.listing_page_url(page_num), self.extract_listing_rows), None
+        except Exception as e:
+            return {}, e
     
-    def extract_profile_links(self, soup: BeautifulSoup) -> List[str]:
+    def extract_profile_links(self, page: HTMLNode) -> List[str]:
         """Extract MP profile links from a listing page"""
         profile_links = []
         
         # Method 1: Look for links with pattern /the-national-assembly/hon-
-        links = soup.find_all('a', href=re.compile(r'/the-national-assembly/hon-'))
+        links = page.find_all('a', href=re.compile(r'/the-national-assembly/hon-'))
         for link in links:
-            href = link.get('href', '')
+            href = link.attr('href')
             if href:
                 full_url = urljoin(self.base_url, href)
                 profile_links.append(full_url)
         
         # Method 2: Look for member profile links (alternative structure)
         if not profile_links:
-            member_links = soup.find_all('a', class_=re.compile(r'member|mp-profile'))
+            member_links = page.find_all('a', class_=re.compile(r'member|mp-profile'))
             for link in member_links:
-                href = link.get('href', '')
+                href = link.attr('href')
                 if href and 'hon-' in href:
                     full_url = urljoin(self.base_url, href)
                     profile_links.append(full_url)
         
-        # Remove duplicates
-        return list(set(profile_links))
+        # Remove duplicates (keeping page order)
+        return list(dict.fromkeys(profile_links))
+    
+    def extract_listing_rows(self, page: HTMLNode) -> Dict[str, str]:
+        """
+        Map each profile link on a listing page to a fingerprint of its table
+        row (name, county, constituency, party, status and photo)
+        """
+        links = {}
+        for link in page.find_all('a', href=re.compile('')):
+            links.setdefault(urljoin(self.base_url, link.attr('href')), link)
+        
+        rows = {}
+        for url in self.extract_profile_links(page):
+            link = links.get(url)
+            row = (link.find_parent('tr') or link) if link else None
+            rows[url] = self.row_fingerprint(row) if row else ""
+        return rows
+    
+    def row_fingerprint(self, row: HTMLNode) -> str:
+        """Stable hash of a listing row's text and image sources"""
+        parts = [self.clean_text(row.text(' '))]
+        parts += [img.attr('src') or '' for img in row.find_all('img')]
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()[:16]
     
     def scrape_mp_details(self, profile_urls: List[str]) -> List[Dict]:
-        """Scrape detailed information from each MP profile page"""
+        """
+        Scrape detailed information from each MP profile page.
+        
+        With ``parse_processes`` set, pages go through a FetchParsePipeline
+        (fetcher threads feeding a process pool of parsers); otherwise each
+        worker thread fetches and parses its own pages. Results are in input
+        order unless ``ordered`` is False.
+        """
         all_mps = []
         total = len(profile_urls)
         
-        for idx, url in enumerate(profile_urls, 1):
-            try:
-                print(f"  [{idx}/{total}] Scraping: {url}")
-                
-                soup = self.fetch_page(url)
-                mp_data = self.parse_mp_profile(soup, url)
-                
-                if mp_data:
-                    all_mps.append(mp_data)
-                    print(f"    ✓ {mp_data['name']} - {mp_data['constituency']}, {mp_data['county']}")
-                else:
-                    print(f"    ✗ Could not parse profile")
-                
-                # Be respectful - delay between requests
-                time.sleep(self.delay)
-                
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-                continue
+        if self.parse_processes:
+            pipeline = FetchParsePipeline(
+                fetch=self._fetch_profile_html,
+                parse=_parse_profile_in_process,
+                fetch_workers=self.workers,
+                parse_workers=self.parse_processes,
+                ordered=self.ordered,
+                initializer=_init_parse_process,
+                initargs=(self.base_url, self.parser),
+            )
+            for idx, result in enumerate(pipeline.run(profile_urls), 1):
+                if result.parsed and result.record and self.http_cache:
+                    self.http_cache.set_record(result.url, result.record, self.PARSER_VERSION)
+                self._report_profile(idx, total, result.url, result.record, result.error, all_mps)
+            return all_mps
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(self._fetch_mp_profile, profile_urls)
+            
+            for idx, (url, (mp_data, error)) in enumerate(zip(profile_urls, results), 1):
+                self._report_profile(idx, total, url, mp_data, error, all_mps)
         
         return all_mps
     
-    def parse_mp_profile(self, soup: BeautifulSoup, url: str) -> Optional[Dict]:
+    def _report_profile(self, idx: int, total: int, url: str, mp_data: Optional[Dict], error, all_mps: List[Dict]):
+        if isinstance(error, CircuitOpenError):
+            # The site is down: stop here (the checkpoint lets a later run resume)
+            raise error
+        print(f"  [{idx}/{total}] Scraping: {url}")
+        if error:
+            print(f"    ✗ Error: {error}")
+        elif mp_data:
+            all_mps.append(mp_data)
+            if self.on_record:
+                self.on_record(mp_data)
+            print(f"    ✓ {mp_data['name']} - {mp_data['constituency']}, {mp_data['county']}")
+        else:
+            print(f"    ✗ Could not parse profile")
+        
+        if self.checkpoint:
+            if mp_data and not error:
+                self.checkpoint.profile_done(url)
+            else:
+                self.checkpoint.profile_failed(url, str(error) if error else "Could not parse profile")
+    
+    def _fetch_mp_profile(self, url: str):
+        """(parsed profile or None, error) for one profile page"""
+        try:
+            return self.fetch_parsed(url, lambda page: self.parse_mp_profile(page, url)), None
+        except Exception as e:
+            return None, e
+    
+    def _fetch_profile_html(self, url: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """Pipeline fetch step: (html, None), or (None, record) for an unchanged cached page"""
+        html, entry = self.fetch_html(url)
+        if entry is not None and entry.record_version == self.PARSER_VERSION:
+            return None, entry.record
+        return html, None
+    
+    def parse_mp_profile(self, page: HTMLNode, url: str) -> Optional[Dict]:
         """Parse complete MP details from their profile page"""
         try:
             mp_data = {
@@ -157,99 +417,34 @@ class CompleteMPScraper:
                 "wiki_title": ""
             }
             
-            # Extract name (usually in h1 or page title)
-            name_elem = soup.find('h1', class_=re.compile(r'page-title|title'))
-            if not name_elem:
-                name_elem = soup.find('h1')
+            # Name (usually in h1 or page title) and the main content area
+            name_elem, content = self.find_title_and_content(page)
             if name_elem:
-                mp_data['name'] = self.clean_text(name_elem.get_text())
-            
-            # Extract main content area
-            content = soup.find('div', class_=re.compile(r'content|main|body'))
-            if not content:
-                content = soup
-            
-            # Extract county
-            county_elem = content.find(text=re.compile(r'County', re.I))
-            if county_elem:
-                # Get the next element which usually contains the value
-                parent = county_elem.find_parent()
-                if parent:
-                    county_value = parent.find_next_sibling()
-                    if county_value:
-                        mp_data['county'] = self.clean_text(county_value.get_text())
-            
-            # Try alternative: look for field-label
-            if not mp_data['county']:
-                county_field = content.find('div', class_='field-label', text=re.compile(r'County', re.I))
-                if county_field:
-                    county_value = county_field.find_next_sibling('div', class_='field-items')
-                    if county_value:
-                        mp_data['county'] = self.clean_text(county_value.get_text())
-            
-            # Extract constituency
-            constituency_elem = content.find(text=re.compile(r'Constituency', re.I))
-            if constituency_elem:
-                parent = constituency_elem.find_parent()
-                if parent:
-                    constituency_value = parent.find_next_sibling()
-                    if constituency_value:
-                        mp_data['constituency'] = self.clean_text(constituency_value.get_text())
-            
-            # Alternative constituency
-            if not mp_data['constituency']:
-                const_field = content.find('div', class_='field-label', text=re.compile(r'Constituency', re.I))
-                if const_field:
-                    const_value = const_field.find_next_sibling('div', class_='field-items')
-                    if const_value:
-                        mp_data['constituency'] = self.clean_text(const_value.get_text())
+                mp_data['name'] = self.clean_text(name_elem.text())
             
-            # Extract party
-            party_elem = content.find(text=re.compile(r'Party', re.I))
-            if party_elem:
-                parent = party_elem.find_parent()
-                if parent:
-                    party_value = parent.find_next_sibling()
-                    if party_value:
-                        mp_data['party'] = self.clean_text(party_value.get_text())
+            index = ProfileIndex.build(content)
             
-            # Alternative party
-            if not mp_data['party']:
-                party_field = content.find('div', class_='field-label', text=re.compile(r'Party', re.I))
-                if party_field:
-                    party_value = party_field.find_next_sibling('div', class_='field-items')
-                    if party_value:
-                        mp_data['party'] = self.clean_text(party_value.get_text())
+            for field in LABELLED_FIELDS:
+                mp_data[field] = self.labelled_value(index, field)
             
-            # Extract email
-            email_link = content.find('a', href=re.compile(r'mailto:'))
-            if email_link:
-                mp_data['email'] = email_link['href'].replace('mailto:', '').strip()
+            if index.email_link:
+                mp_data['email'] = index.email_link.attr('href').replace('mailto:', '').strip()
             
-            # Extract phone
-            phone_text = content.find(text=re.compile(r'\+254|0\d{9}'))
-            if phone_text:
-                phone_match = re.search(r'(\+254\d{9}|0\d{9})', phone_text)
+            if index.phone_text:
+                phone_match = PHONE_NUMBER.search(index.phone_text)
                 if phone_match:
                     mp_data['phone'] = phone_match.group(1)
             
-            # Extract bio
-            bio_elem = content.find('div', class_=re.compile(r'field-name-body|body|biography'))
-            if bio_elem:
-                mp_data['bio'] = self.clean_text(bio_elem.get_text())[:500]  # First 500 chars
+            if index.bio:
+                mp_data['bio'] = self.clean_text(index.bio.text())[:500]  # First 500 chars
             
-            # Extract photo
-            photo_elem = content.find('img', class_=re.compile(r'photo|image|portrait'))
-            if not photo_elem:
-                photo_elem = content.find('img')
-            if photo_elem and photo_elem.get('src'):
-                mp_data['photo_url'] = urljoin(self.base_url, photo_elem['src'])
+            photo_elem = index.photo or index.first_img
+            if photo_elem and photo_elem.attr('src'):
+                mp_data['photo_url'] = urljoin(self.base_url, photo_elem.attr('src'))
             
-            # Extract committees
-            committees_section = content.find('div', class_=re.compile(r'committee'))
-            if committees_section:
-                committee_items = committees_section.find_all('li')
-                mp_data['committees'] = [self.clean_text(c.get_text()) for c in committee_items]
+            if index.committees:
+                committee_items = index.committees.find_all('li')
+                mp_data['committees'] = [self.clean_text(c.text()) for c in committee_items]
             
             # Generate Wikipedia title
             if mp_data['name']:
@@ -261,11 +456,165 @@ class CompleteMPScraper:
             print(f"      Error parsing profile: {e}")
             return None
     
-    def fetch_page(self, url: str) -> BeautifulSoup:
+    def find_title_and_content(self, page: HTMLNode) -> Tuple[Optional[HTMLNode], HTMLNode]:
+        """
+        The page's title h1 (falling back to the first h1) and its main
+        content div (falling back to the whole page), in one walk
+        """
+        title = first_h1 = content = None
+        for element in page.iter_elements():
+            tag = element.tag
+            if tag == 'h1':
+                if first_h1 is None:
+                    first_h1 = element
+                if title is None and element.matches(class_=TITLE_CLASS):
+                    title = element
+            elif tag == 'div' and content is None and element.matches(class_=CONTENT_CLASS):
+                content = element
+            if title is not None and content is not None:
+                break
+        return title or first_h1, content or page
+    
+    def labelled_value(self, index: "ProfileIndex", field: str) -> str:
+        """Value of a labelled profile field, from the first layout that has it"""
+        # The label text's element is usually followed by the value
+        label_elem = index.label_text.get(field)
+        if label_elem:
+            value = label_elem.next_element_sibling()
+            if value:
+                text = self.clean_text(value.text())
+                if text:
+                    return text
+        
+        # Drupal 7: <div class="field-label"> followed by <div class="field-items">
+        for label, label_elem in index.field_labels:
+            if LABELLED_FIELDS[field].search(label):
+                value = label_elem.find_next_sibling('div', class_='field-items')
+                if value:
+                    text = self.clean_text(value.text())
+                    if text:
+                        return text
+                break
+        
+        # Drupal 8+: <div class="field--name-field-county"> wrapping label and items
+        wrapper = index.drupal_fields.get(field)
+        if wrapper:
+            items = wrapper.find(class_=DRUPAL_FIELD_ITEMS_CLASS)
+            if items:
+                return self.clean_text(items.text())
+        return ""
+    
+    def fetch_page(self, url: str) -> HTMLNode:
         """Fetch and parse a page"""
-        response = self.session.get(url, timeout=30)
+        html, _ = self.fetch_html(url)
+        return self.parse_html(html)
+    
+    def fetch_html(self, url: str) -> Tuple[str, Optional[CacheEntry]]:
+        """
+        Fetch a page's HTML, waiting for the circuit breaker and the host's
+        rate limiter first.
+        
+        Timeouts, connection errors, 429 and 5xx responses are retried up to
+        ``max_retries`` times, after the server's Retry-After or else a
+        jittered exponential backoff. Every attempt feeds the adaptive rate
+        limiter and the circuit breaker.
+        
+        With an HTTP cache, stored pages are revalidated with If-None-Match /
+        If-Modified-Since. Returns the HTML plus the cache entry when the
+        server answered 304 Not Modified (None after a full download).
+        """
+        request_url = self.request_url(url)
+        entry = self.http_cache.get(url) if self.http_cache else None
+        headers = entry.conditional_headers() if entry else {}
+        
+        for attempt in range(self.max_retries + 1):
+            paused = self.circuit_breaker.before_request()
+            if paused >= 1:
+                print(f"    ⏸ Paused {paused:.0f}s while the server was failing")
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            with self._stats_lock:
+                self.pages_fetched += 1
+            
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = self.session.get(request_url, headers=headers, timeout=30)
+            except requests.RequestException as e:
+                failure = e
+                retryable = isinstance(e, (requests.Timeout, requests.ConnectionError))
+            else:
+                if self.archive and response.status_code != 304:
+                    self.archive.record(url, response.status_code, response.headers, response.content)
+                if response.status_code not in RETRY_STATUSES:
+                    self._record_attempt(url, time.monotonic() - started, ok=True)
+                    break
+                failure = requests.HTTPError(f"{response.status_code} from {url}", response=response)
+                retryable = True
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            
+            if not retryable:
+                raise failure
+            self._record_attempt(url, time.monotonic() - started, ok=False)
+            if attempt == self.max_retries:
+                raise failure
+            wait = min(retry_after, 300.0) if retry_after is not None else backoff_delay(attempt, base=max(self.delay, 1.0))
+            with self._stats_lock:
+                self.retries += 1
+            print(f"    ↻ {failure}; retry {attempt + 1}/{self.max_retries} in {wait:.1f}s")
+            time.sleep(wait)
+        
+        if entry is not None and response.status_code == 304:
+            self.http_cache.mark_revalidated()
+            if self.archive:
+                # Archive the page itself, not the revalidation
+                headers = {'Content-Type': 'text/html; charset=utf-8', **response.headers}
+                self.archive.record(url, 200, headers, entry.body)
+            return entry.body.decode('utf-8'), entry
+        
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        if self.http_cache:
+            self.http_cache.put(
+                url,
+                response.text.encode('utf-8'),
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            )
+        return response.text, None
+    
+    def request_url(self, url: str) -> str:
+        """Where a request for ``url`` is sent (``fetch_origin`` replacing base_url)"""
+        if self.fetch_origin and url.startswith(self.base_url):
+            return self.fetch_origin + url[len(self.base_url):]
+        return url
+    
+    def _record_attempt(self, url: str, latency: float, ok: bool):
+        if ok:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+        if self.rate_limiter:
+            self.rate_limiter.record(url, latency, ok)
+    
+    def fetch_parsed(self, url: str, parse: Callable[[HTMLNode], Any]) -> Any:
+        """
+        ``parse(page)`` for the page at ``url``.
+        
+        Unchanged pages (304) reuse the record cached from the last parse, so
+        only pages the server sends in full are parsed again.
+        """
+        html, entry = self.fetch_html(url)
+        if entry is not None and entry.record_version == self.PARSER_VERSION:
+            return entry.record
+        
+        started = time.perf_counter()
+        record = parse(self.parse_html(html))
+        with self._stats_lock:
+            self.pages_parsed += 1
+            self.parse_seconds += time.perf_counter() - started
+        if self.http_cache and record is not None:
+            self.http_cache.set_record(url, record, self.PARSER_VERSION)
+        return record
     
     def clean_text(self, text: str) -> str:
         """Clean extracted text"""
@@ -289,6 +638,113 @@ class CompleteMPScraper:
 
 
 
+# Scraper used by each parser process of a FetchParsePipeline
+_process_scraper: Optional[CompleteMPScraper] = None
+
+
+def _init_parse_process(base_url: str, parser: str):
+    global _process_scraper
+    _process_scraper = CompleteMPScraper(delay=0, base_url=base_url, parser=parser)
+
+
+def _parse_profile_in_process(html: str, url: str) -> Optional[Dict]:
+    return _process_scraper.parse_mp_profile(_process_scraper.parse_html(html), url)
+
+
+# Profile fields found next to a label, with the pattern matching the label
+LABELLED_FIELDS = {
+    'county': re.compile(r'County', re.I),
+    'constituency': re.compile(r'Constituency', re.I),
+    'party': re.compile(r'Party', re.I),
+}
+PHONE_TEXT = re.compile(r'\+254|0\d{9}')
+PHONE_NUMBER = re.compile(r'(\+254\d{9}|0\d{9})')
+MAILTO = re.compile(r'mailto:')
+TITLE_CLASS = re.compile(r'page-title|title')
+CONTENT_CLASS = re.compile(r'content|main|body')
+BIO_CLASS = re.compile(r'field-name-body|body|biography')
+PHOTO_CLASS = re.compile(r'photo|image|portrait')
+COMMITTEE_CLASS = re.compile(r'committee')
+DRUPAL_FIELD_CLASS = re.compile(r'\bfield--name-(?:field-)?([\w-]+)')
+DRUPAL_FIELD_ITEMS_CLASS = re.compile(r'\bfield__items?\b|\bfield-items?\b')
+
+
+class ProfileIndex:
+    """
+    Everything parse_mp_profile needs from a profile's content area,
+    collected in a single walk over its elements and text:
+    
+    - label_text: field -> element whose text first mentions the field's label
+    - field_labels: (label text, element) for each Drupal 7 ``field-label`` div
+    - drupal_fields: field name -> Drupal 8+ ``field--name-*`` wrapper element
+    - the first mailto link, phone-like text, bio div, photo, image and
+      committees div
+    """
+    
+    __slots__ = (
+        'label_text', 'field_labels', 'drupal_fields', 'email_link', 'phone_text',
+        'bio', 'photo', 'first_img', 'committees',
+    )
+    
+    def __init__(self):
+        self.label_text: Dict[str, HTMLNode] = {}
+        self.field_labels: List[Tuple[str, HTMLNode]] = []
+        self.drupal_fields: Dict[str, HTMLNode] = {}
+        self.email_link = self.bio = self.photo = self.first_img = self.committees = None
+        self.phone_text: Optional[str] = None
+    
+    @classmethod
+    def build(cls, content: HTMLNode) -> "ProfileIndex":
+        index = cls()
+        pending_labels = dict(LABELLED_FIELDS)
+        
+        for node, text in content.iter_nodes():
+            if text is not None:
+                # Text node: label mentions and the first phone number
+                for field, pattern in list(pending_labels.items()):
+                    if pattern.search(text):
+                        index.label_text[field] = node
+                        del pending_labels[field]
+                if index.phone_text is None and PHONE_TEXT.search(text):
+                    index.phone_text = text
+                continue
+            
+            tag = node.tag
+            classes = node.attr('class') or ''
+            if tag == 'a':
+                if index.email_link is None and MAILTO.search(node.attr('href') or ''):
+                    index.email_link = node
+            elif tag == 'img':
+                if index.first_img is None:
+                    index.first_img = node
+                if index.photo is None and PHOTO_CLASS.search(classes):
+                    index.photo = node
+            elif tag == 'div' and classes:
+                if index.bio is None and BIO_CLASS.search(classes):
+                    index.bio = node
+                if index.committees is None and COMMITTEE_CLASS.search(classes):
+                    index.committees = node
+                if 'field-label' in classes.split():
+                    index.field_labels.append((node.text(), node))
+            
+            if 'field--name-' in classes:
+                match = DRUPAL_FIELD_CLASS.search(classes)
+                index.drupal_fields.setdefault(match.group(1).replace('-', '_'), node)
+        
+        return index
+
+
+def normalize_county_name(name: str) -> str:
+    """
+    Comparable county name: upper-case, apostrophes dropped, other
+    punctuation as spaces, no "County" suffix ("Murang'a" and
+    "MURANGA COUNTY" -> "MURANGA", "Tharaka-Nithi" -> "THARAKA NITHI")
+    """
+    name = re.sub(r"['’]", "", (name or "").upper())
+    name = re.sub(r"[^A-Z0-9]+", " ", name).strip()
+    return re.sub(r" COUNTY$", "", name)
+
+
 def group_by_county(mps: List[Dict]) -> Dict[str, List[Dict]]:
     """Group MPs by county"""
     counties = {}
@@ -314,6 +770,18 @@ def group_by_county(mps: List[Dict]) -> Dict[str, List[Dict]]:
     return counties
 
 
+# MP table columns written by the seeder
+MP_ROW_FIELDS = MP.CONTENT_FIELDS
+
+
+def mp_to_row(mp: Dict) -> Dict:
+    """Map a scraped MP record onto MP table columns, with its content hash"""
+    row = {field: mp.get(field) for field in MP_ROW_FIELDS}
+    row['committees_json'] = mp.get('committees', [])
+    row['content_hash'] = MP.hash_content(row)
+    return row
+
+
 def save_to_json(mps: List[Dict], filename: str = "mps_complete.json"):
     """Save complete MP data to JSON file"""
     output = {
@@ -334,117 +802,459 @@ def save_to_json(mps: List[Dict], filename: str = "mps_complete.json"):
 class DatabaseSeeder:
     """Seeds the database with MP data"""
     
+    # Rows per INSERT ... ON CONFLICT statement (and per IN (...) lookup)
+    UPSERT_CHUNK_SIZE = 200
+    
+    # Changed and removed MPs listed by name in the printed summary
+    SUMMARY_LIMIT = 10
+    
     def __init__(self, db_session: Optional[Session] = None):
         self.db = db_session
     
-    def update_database(self, mps: List[Dict]):
-        """Update database with complete MP data"""
+    def update_database(
+        self,
+        mps: List[Dict],
+        by_county: Optional[Dict[str, List[Dict]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update database with complete MP data.
+        
+        Every stored MP's content_hash is read in one query and compared
+        with the hash of its freshly scraped record; only new MPs and MPs
+        whose hash differs are written (one batched upsert per chunk, all
+        inside a single transaction), so updated_at moves only when
+        something actually changed. Changed rows are re-read to report
+        which fields changed.
+        
+        MPs in the database but missing from this scrape are reported as
+        removed, not deleted: a profile that failed to fetch looks the same.
+        
+        Args:
+            mps: Scraped MP records
+            by_county: group_by_county(mps), if the caller already has it
+        
+        Returns:
+            Change summary: inserted / updated / unchanged / removed counts,
+            changed_fields (field -> MPs changed), changes (profile_url,
+            name and fields of each updated MP) and removed MPs
+        """
         if not self.db:
             print("No database session provided. Skipping database update.")
-            return
+            return None
+        
+        # One row per profile URL (a duplicate would hit ON CONFLICT twice)
+        rows = {row['profile_url']: row for row in map(mp_to_row, mps)}
+        summary = {
+            "inserted": 0, "updated": 0, "unchanged": 0, "removed": 0,
+            "changed_fields": {}, "changes": [], "removed_mps": [],
+        }
         
         try:
-            # First, clear existing MPs (optional - comment out to update instead)
-            # self.db.query(MP).delete()
+            stored = {
+                url: (mp_id, name, content_hash)
+                for url, mp_id, name, content_hash in self.db.execute(
+                    select(MP.profile_url, MP.id, MP.name, MP.content_hash)
+                )
+            }
             
-            # Add or update each MP
-            for mp_data in mps:
-                existing_mp = self.db.query(MP).filter(
-                    MP.profile_url == mp_data['profile_url']
-                ).first()
-                
-                if existing_mp:
-                    # Update existing MP
-                    existing_mp.name = mp_data['name']
-                    existing_mp.county = mp_data['county']
-                    existing_mp.constituency = mp_data['constituency']
-                    existing_mp.party = mp_data['party']
-                    existing_mp.email = mp_data['email']
-                    existing_mp.phone = mp_data['phone']
-                    existing_mp.bio = mp_data['bio']
-                    existing_mp.photo_url = mp_data['photo_url']
-                    existing_mp.committees_json = mp_data['committees']
-                    existing_mp.wiki_title = mp_data['wiki_title']
-                    existing_mp.updated_at = datetime.now()
-                else:
-                    # Create new MP
-                    new_mp = MP(
-                        name=mp_data['name'],
-                        county=mp_data['county'],
-                        constituency=mp_data['constituency'],
-                        party=mp_data['party'],
-                        email=mp_data['email'],
-                        phone=mp_data['phone'],
-                        bio=mp_data['bio'],
-                        photo_url=mp_data['photo_url'],
-                        profile_url=mp_data['profile_url'],
-                        committees_json=mp_data['committees'],
-                        wiki_title=mp_data['wiki_title']
-                    )
-                    self.db.add(new_mp)
+            new = [row for url, row in rows.items() if url not in stored]
+            modified = [
+                row for url, row in rows.items()
+                if url in stored and stored[url][2] != row['content_hash']
+            ]
+            summary["inserted"] = len(new)
+            summary["updated"] = len(modified)
+            summary["unchanged"] = len(rows) - len(new) - len(modified)
+            summary["removed_mps"] = [
+                {"profile_url": url, "name": name}
+                for url, (_, name, _) in stored.items()
+                if url and url not in rows
+            ]
+            summary["removed"] = len(summary["removed_mps"])
+            
+            for start in range(0, len(modified), self.UPSERT_CHUNK_SIZE):
+                self._describe_changes(modified[start:start + self.UPSERT_CHUNK_SIZE], summary)
+            
+            changed = new + modified
+            if changed:
+                upsert = self._upsert_statement()
+                for start in range(0, len(changed), self.UPSERT_CHUNK_SIZE):
+                    self.db.execute(upsert, changed[start:start + self.UPSERT_CHUNK_SIZE])
             
             self.db.commit()
-            print(f"✓ Successfully updated/created {len(mps)} MPs in database")
+            if changed:
+                # List and count pages, plus the detail pages of updated MPs
+                invalidate_resource("mps", *(stored[row['profile_url']][0] for row in modified))
+            self._print_summary(summary)
             
             # Also update county MPs JSON for compatibility
-            self.update_county_mps_json(mps)
+            self.update_county_mps_json(mps, by_county)
+            return summary
             
         except Exception as e:
             print(f"✗ Error updating database: {e}")
             self.db.rollback()
             raise
     
-    def update_county_mps_json(self, mps: List[Dict]):
-        """Update the County.mps_json field with simplified MP data"""
+    def _describe_changes(self, rows: List[Dict], summary: Dict[str, Any]):
+        """Add the changed fields of ``rows`` (all already stored) to the summary"""
+        current = {
+            row['profile_url']: row
+            for row in self.db.execute(
+                select(*(MP.__table__.c[field] for field in MP_ROW_FIELDS))
+                .where(MP.profile_url.in_([row['profile_url'] for row in rows]))
+            ).mappings()
+        }
+        for row in rows:
+            fields = [
+                field for field in MP_ROW_FIELDS
+                if current[row['profile_url']][field] != row[field]
+            ]
+            for field in fields:
+                summary["changed_fields"][field] = summary["changed_fields"].get(field, 0) + 1
+            summary["changes"].append({
+                "profile_url": row['profile_url'],
+                "name": row['name'],
+                "fields": fields,
+            })
+    
+    def _print_summary(self, summary: Dict[str, Any]):
+        print(
+            f"✓ MPs in database: {summary['inserted']} added, {summary['updated']} changed, "
+            f"{summary['unchanged']} unchanged, {summary['removed']} not in this scrape"
+        )
+        if summary["changed_fields"]:
+            fields = sorted(summary["changed_fields"].items(), key=lambda item: (-item[1], item[0]))
+            print("  Changed fields: " + ", ".join(f"{field} ({count})" for field, count in fields))
+        for change in summary["changes"][:self.SUMMARY_LIMIT]:
+            # An empty list means only the stored hash was missing or stale
+            print(f"  ~ {change['name']}: {', '.join(change['fields']) or 'hash refreshed'}")
+        for mp in summary["removed_mps"][:self.SUMMARY_LIMIT]:
+            print(f"  - {mp['name']} ({mp['profile_url']})")
+        hidden = (
+            max(0, len(summary["changes"]) - self.SUMMARY_LIMIT)
+            + max(0, len(summary["removed_mps"]) - self.SUMMARY_LIMIT)
+        )
+        if hidden:
+            print(f"  ... and {hidden} more")
+    
+    def _upsert_statement(self):
+        """INSERT ... ON CONFLICT (profile_url) DO UPDATE for the session's dialect"""
+        dialect = self.db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        
+        stmt = insert(MP.__table__)
+        updates = {
+            field: stmt.excluded[field]
+            for field in (*MP_ROW_FIELDS, 'content_hash') if field != 'profile_url'
+        }
+        # A new photo_url makes the stored photo stale until the next photo sync
+        updates['photo_key'] = case(
+            (MP.__table__.c.photo_url.is_distinct_from(stmt.excluded.photo_url), None),
+            else_=MP.__table__.c.photo_key,
+        )
+        updates['updated_at'] = datetime.now()
+        return stmt.on_conflict_do_update(index_elements=[MP.profile_url], set_=updates)
+    
+    def update_county_mps_json(self, mps: List[Dict], by_county: Optional[Dict[str, List[Dict]]] = None):
+        """
+        Update the County.mps_json field with simplified MP data.
+        
+        Counties and their current MP rows are read in one query each and
+        matched on normalize_county_name(). Only counties whose MP list
+        changed are written: their child rows are replaced with one bulk
+        DELETE and one bulk INSERT, all in one transaction. Counties with
+        no MPs in this scrape keep their rows and are only reported: a
+        partial or resumed crawl looks the same.
+        """
         if not self.db:
             return
         
         try:
-            counties_data = group_by_county(mps)
+            if by_county is None:
+                by_county = group_by_county(mps)
+            counties = {
+                normalize_county_name(name): (county_id, name)
+                for county_id, name in self.db.execute(select(County.id, County.name))
+            }
             
-            for county_name, county_mps in counties_data.items():
-                county = self.db.query(County).filter(County.name == county_name).first()
-                
-                if county:
-                    county.mps_json = county_mps
-                    county.updated_at = datetime.now()
-                    print(f"  Updated {county_name} with {len(county_mps)} MPs")
+            current: Dict[int, List[Dict]] = {}
+            for row in self.db.execute(
+                select(CountyMP.county_id, *(CountyMP.__table__.c[f] for f in CountyMP.FIELDS))
+                .order_by(CountyMP.county_id, CountyMP.position)
+            ).mappings():
+                current.setdefault(row['county_id'], []).append({f: row[f] for f in CountyMP.FIELDS})
             
-            self.db.commit()
-            print(f"✓ Updated MPs in {len(counties_data)} counties")
+            changed: Dict[int, str] = {}
+            new_rows = []
+            unmatched = []
+            for county_name, county_mps in by_county.items():
+                match = counties.get(normalize_county_name(county_name))
+                if match is None:
+                    unmatched.append(county_name)
+                    continue
+                county_id, name = match
+                items = [{f: mp.get(f) for f in CountyMP.FIELDS} for mp in county_mps]
+                if current.get(county_id, []) == items:
+                    continue
+                changed[county_id] = name
+                new_rows += [
+                    {"county_id": county_id, "position": position, **item}
+                    for position, item in enumerate(items)
+                ]
+                print(f"  Updated {name} with {len(county_mps)} MPs")
+            
+            if changed:
+                self.db.execute(delete(CountyMP).where(CountyMP.county_id.in_(changed)))
+                if new_rows:
+                    self.db.execute(insert(CountyMP), new_rows)
+                self.db.execute(update(County).where(County.id.in_(changed)).values(updated_at=datetime.now()))
+                self.db.commit()
+                invalidate_resource("counties", *changed.values())
+            
+            # Counties none of the scraped MPs belong to are left as they are
+            seen = {match[0] for match in map(counties.get, map(normalize_county_name, by_county)) if match}
+            missing = sorted(
+                name for county_id, name in counties.values()
+                if county_id not in seen and current.get(county_id)
+            )
+            
+            print(
+                f"✓ Updated MPs in {len(changed)} counties "
+                f"({len(by_county) - len(changed) - len(unmatched)} unchanged, "
+                f"{len(unmatched)} not in database, {len(missing)} not in this scrape)"
+            )
+            for name in missing[:self.SUMMARY_LIMIT]:
+                print(f"  - {name} (MPs kept)")
+            if len(missing) > self.SUMMARY_LIMIT:
+                print(f"  ... and {len(missing) - self.SUMMARY_LIMIT} more")
         except Exception as e:
             print(f"⚠ Warning updating county MPs: {e}")
             self.db.rollback()
 
 
-def scrape_and_seed_mps(db: Optional[Session] = None) -> Dict:
+def default_http_cache() -> Optional[HTTPCache]:
+    """
+    HTTP cache configured from the environment:
+    MP_SCRAPER_CACHE_DIR (default .scraper_cache, empty to disable) and
+    MP_SCRAPER_HTTP_CACHE_MB (default 200)
+    """
+    cache_dir = os.getenv("MP_SCRAPER_CACHE_DIR", ".scraper_cache")
+    if not cache_dir:
+        return None
+    return HTTPCache(
+        os.path.join(cache_dir, "http_cache.sqlite3"),
+        max_bytes=int(os.getenv("MP_SCRAPER_HTTP_CACHE_MB", "200")) * 1024 * 1024,
+    )
+
+
+def default_manifest(state_dir: Optional[str] = None) -> ScrapeManifest:
+    """
+    Scrape manifest configured from the environment:
+    MP_SCRAPER_MANIFEST (default <cache dir>/manifest.json) and
+    MP_SCRAPER_REFRESH_DAYS (default 7; 0 never re-fetches unchanged profiles).
+    
+    With ``state_dir`` (replays) the manifest is <state_dir>/manifest.json
+    instead, so it never replaces the live site's baseline.
+    """
+    cache_dir = os.getenv("MP_SCRAPER_CACHE_DIR") or ".scraper_cache"
+    refresh_days = float(os.getenv("MP_SCRAPER_REFRESH_DAYS", "7"))
+    if state_dir:
+        path = os.path.join(state_dir, "manifest.json")
+    else:
+        path = os.getenv("MP_SCRAPER_MANIFEST", os.path.join(cache_dir, "manifest.json"))
+    return ScrapeManifest(
+        path,
+        refresh_after=timedelta(days=refresh_days) if refresh_days > 0 else None,
+    )
+
+
+def default_checkpoint_path(state_dir: Optional[str] = None) -> str:
+    """MP_SCRAPER_CHECKPOINT (default <cache dir>/checkpoint.json), or <state_dir>/checkpoint.json"""
+    if state_dir:
+        return os.path.join(state_dir, "checkpoint.json")
+    cache_dir = os.getenv("MP_SCRAPER_CACHE_DIR") or ".scraper_cache"
+    return os.getenv("MP_SCRAPER_CHECKPOINT", os.path.join(cache_dir, "checkpoint.json"))
+
+
+def resumable_checkpoint(resume: Optional[bool], state_dir: Optional[str] = None) -> Optional[ScrapeCheckpoint]:
+    """
+    Checkpoint left by an interrupted scrape, to resume from.
+    
+    With ``resume`` True any checkpoint is used; with None only one saved in
+    the last MP_SCRAPER_RESUME_HOURS (default 6); with False none.
+    ``state_dir`` is as for default_checkpoint_path().
+    """
+    if resume is False:
+        return None
+    checkpoint = ScrapeCheckpoint.load(default_checkpoint_path(state_dir))
+    if checkpoint is None or not os.path.exists(checkpoint.records_file):
+        return None
+    
+    max_age = timedelta(hours=float(os.getenv("MP_SCRAPER_RESUME_HOURS", "6")))
+    if resume is None and checkpoint.age() > max_age:
+        print(f"⚠ Ignoring checkpoint last saved {checkpoint.updated_at} (older than {max_age})")
+        return None
+    return checkpoint
+
+
+def print_http_cache_summary(http_cache: HTTPCache):
+    stats = http_cache.stats()
+    print(f"\nHTTP cache ({http_cache.path}):")
+    print(f"  Unchanged (304): {stats['revalidated']}/{stats['requests']} ({stats['hit_rate'] * 100:.1f}%)")
+    print(f"  Downloaded: {stats['fetched']}, stored: {stats['stored']}, evicted: {stats['evicted']}")
+    print(f"  Size: {stats['entries']} pages, {stats['size_bytes'] / 1024 / 1024:.1f} MB "
+          f"of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+
+
+def scrape_and_seed_mps(
+    db: Optional[Session] = None,
+    workers: Optional[int] = None,
+    incremental: bool = False,
+    resume: Optional[bool] = None,
+    on_progress: Optional[Callable[[Dict], None]] = None,
+    record_to: Optional[str] = None,
+    replay_from: Optional[str] = None,
+    photos: Optional[bool] = None,
+    wiki_prefetch: Optional[bool] = None,
+) -> Dict:
     """
     Main function to scrape MPs and update database
     
     Args:
         db: SQLAlchemy database session (optional)
+        workers: Concurrent requests (default: MP_SCRAPER_WORKERS env var, 4)
+        incremental: Only fetch profiles that are new or changed since the
+            last run (per the scrape manifest)
+        resume: Continue an interrupted scrape from its checkpoint: True for
+            any checkpoint, None (default) only for a recent one, False to
+            always start over
+        on_progress: Called with progress counts (stage, listing pages,
+            profiles pending/done/failed) as the scrape advances
+        record_to: Archive every response in this HTTPArchive directory
+        replay_from: Scrape an HTTPArchive directory instead of the live site,
+            through a local stand-in server, at full speed and without the
+            HTTP cache; its manifest and checkpoint live in
+            ``<replay_from>/state`` instead of the live ones
+        photos: After seeding, download MP photos into the local media store
+            (default: MP_SCRAPER_PHOTOS env var, on; always off when replaying)
+        wiki_prefetch: After seeding, warm the Wikipedia summary cache for
+            every tracked wiki_title (default: WIKIPEDIA_PREFETCH env var, on;
+            always off when replaying)
     
     Returns:
         Dictionary with scraped data and results
     """
-    # Create scraper with 1-second delay between requests
-    scraper = CompleteMPScraper(delay=1.0)
+    if workers is None:
+        workers = int(os.getenv("MP_SCRAPER_WORKERS", "4"))
+    if photos is None:
+        photos = os.getenv("MP_SCRAPER_PHOTOS", "True").lower() == "true"
+    photos = photos and not replay_from
+    if wiki_prefetch is None:
+        wiki_prefetch = os.getenv("WIKIPEDIA_PREFETCH", "True").lower() == "true"
+    wiki_prefetch = wiki_prefetch and not replay_from
+    
+    archive = HTTPArchive(record_to) if record_to else None
+    replay_server = ArchiveServer(HTTPArchive(replay_from)).start() if replay_from else None
+    if replay_server:
+        print(f"Replaying {replay_from} from {replay_server.base_url}")
+    
+    # One request per second to parliament.go.ke, however many workers; the
+    # gap only widens (up to MP_SCRAPER_MAX_DELAY) when the server struggles,
+    # and only narrows if MP_SCRAPER_MIN_DELAY explicitly allows it
+    http_cache = default_http_cache() if not replay_server else None
+    min_delay = os.getenv("MP_SCRAPER_MIN_DELAY")
+    scraper = CompleteMPScraper(
+        delay=1.0 if not replay_server else 0,
+        min_delay=float(min_delay) if min_delay else None,
+        max_delay=float(os.getenv("MP_SCRAPER_MAX_DELAY", "30")),
+        max_retries=int(os.getenv("MP_SCRAPER_RETRIES", "3")),
+        workers=workers,
+        http_cache=http_cache,
+        parser=os.getenv("MP_SCRAPER_PARSER", "auto"),
+        parse_processes=int(os.getenv("MP_SCRAPER_PARSE_PROCESSES", "0")),
+        archive=archive,
+        fetch_origin=replay_server.base_url if replay_server else None,
+    )
+    
+    # A replay keeps its manifest and checkpoint next to the archive, so it
+    # never touches (or resumes) the live scrape's
+    state_dir = os.path.join(replay_from, "state") if replay_from else None
+    
+    # Records already in the NDJSON file of an interrupted run are kept
+    checkpoint = resumable_checkpoint(resume, state_dir)
+    resumed = {}
+    if checkpoint:
+        records_path = checkpoint.records_file
+        resumed = {record['profile_url']: record for record in read_records(records_path)}
+        print(
+            f"Resuming scrape started {checkpoint.started_at}: "
+            f"{len(checkpoint.listing_pages)} listing pages and {len(resumed)} profiles already done"
+        )
+    else:
+        if resume:
+            print("No checkpoint to resume from, starting a new scrape")
+        records_path = os.getenv("MP_SCRAPER_OUTPUT", "mps_complete.ndjson")
+        checkpoint = ScrapeCheckpoint(default_checkpoint_path(state_dir), records_path)
+    
+    checkpoint.on_progress = on_progress
     
     try:
-        # Scrape all MPs (35 pages max)
-        all_mps = scraper.scrape_all_mps(max_pages=35)
+        # Scrape all MPs (35 pages max); full runs also refresh the manifest.
+        # Each record is appended to the NDJSON file as soon as it is parsed.
+        with MPRecordWriter(records_path, append=checkpoint.resumed) as writer:
+            scraper.on_record = writer.write
+            scraper.checkpoint = checkpoint
+            all_mps = scraper.scrape_all_mps(
+                max_pages=35, manifest=default_manifest(state_dir), incremental=incremental, resumed=resumed,
+            )
         
         if not all_mps:
             print("\n✗ No MPs found!")
+            checkpoint.clear()
             return None
         
-        # Save to JSON
-        output = save_to_json(all_mps)
+        output = {
+            "scraped_at": writer.started_at,
+            "total_mps": len(all_mps),
+            "records_file": records_path,
+            "resumed_profiles": len(resumed),
+            "by_county": group_by_county(all_mps),
+        }
+        print(f"\n✓ Saved {len(all_mps)} complete MP profiles to {records_path}")
+        print(f"✓ Found {len(output['by_county'])} counties")
+        if scraper.manifest_diff is not None:
+            output['manifest'] = scraper.manifest_diff.summary()
+            output['disappeared'] = scraper.manifest_diff.disappeared
         
         # Update database if connection provided
         if db:
+            if on_progress:
+                on_progress({**checkpoint.progress(), "stage": "seeding"})
             seeder = DatabaseSeeder(db)
-            seeder.update_database(all_mps)
+            output['db_changes'] = seeder.update_database(all_mps, output['by_county'])
+            
+            if photos:
+                if on_progress:
+                    on_progress({**checkpoint.progress(), "stage": "photos"})
+                try:
+                    output['photos'] = sync_photo_assets(db)
+                except Exception as e:
+                    # Photos fall back to photo_url, so this doesn't fail the scrape
+                    print(f"⚠ Photo sync failed: {e}")
+            
+            if wiki_prefetch:
+                if on_progress:
+                    on_progress({**checkpoint.progress(), "stage": "wikipedia"})
+                try:
+                    output['wikipedia'] = prefetch_tracked_summaries(db)
+                except Exception as e:
+                    # Summaries are fetched on demand anyway
+                    print(f"⚠ Wikipedia prefetch failed: {e}")
+        
+        # The crawl is complete: profiles that failed are left for the next run
+        output['failed'] = checkpoint.failed
+        checkpoint.clear()
         
         # Print summary
         print("\n" + "=" * 70)
@@ -484,9 +1294,14 @@ def scrape_and_seed_mps(db: Optional[Session] = None) -> Dict:
             print(f"  Committees: {len(sample.get('committees', []))}")
             print(f"  Profile URL: {sample['profile_url']}")
         
+        if http_cache:
+            print_http_cache_summary(http_cache)
+            output['http_cache'] = http_cache.stats()
+        
         print("\n" + "=" * 70)
         print("Next steps:")
-        print("1. Review mps_complete.json")
+        print(f"1. Review {records_path} (python -m app.utils.mp_records {records_path} mps_complete.json")
+        print("   rebuilds the old single-document format)")
         print("2. Database has been automatically seeded with MP data")
         print("=" * 70)
         
@@ -496,7 +1311,18 @@ def scrape_and_seed_mps(db: Optional[Session] = None) -> Dict:
         print(f"\n✗ Error during scraping: {e}")
         import traceback
         traceback.print_exc()
+        if on_progress:
+            on_progress({**checkpoint.progress(), "stage": "failed", "error": f"{type(e).__name__}: {e}"})
         return None
+    
+    finally:
+        if http_cache:
+            http_cache.close()
+        if archive:
+            archive.close()
+            print(f"✓ Archived {len(archive.entries)} responses in {record_to}")
+        if replay_server:
+            replay_server.stop()
 
 
 if __name__ == "__main__":
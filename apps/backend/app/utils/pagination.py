@@ -0,0 +1,70 @@
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Page sizes for list endpoints. The default covers every existing frontend
+# page (47 counties, a handful of candidates) in a single request.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_key: Any) -> str:
+    """Encode the last seen key as an opaque cursor string"""
+    return base64.urlsafe_b64encode(str(last_key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor back into the last seen integer key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    key_column,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Run a keyset-paginated query.
+
+    Args:
+        db: Async database session
+        stmt: Select statement for the collection
+        key_column: Unique, indexed column to order and seek on (usually the id)
+        limit: Maximum number of rows to return
+        cursor: Cursor from a previous page, or None for the first page
+
+    Returns:
+        Tuple of (rows, next_cursor) - next_cursor is None on the last page
+    """
+    if cursor:
+        stmt = stmt.where(key_column > decode_cursor(cursor))
+
+    # Fetch one extra row to find out whether another page exists
+    result = await db.execute(stmt.order_by(key_column).limit(limit + 1))
+    rows = list(result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+    return rows, next_cursor
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> Dict[str, str]:
+    """Headers exposing the next-page cursor without changing the list body"""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
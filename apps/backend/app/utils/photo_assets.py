@@ -0,0 +1,387 @@
+"""
+Local store of MP and candidate photos, served from /media.
+
+Remote ``photo_url``s (parliament.go.ke profile photos, candidate images)
+are downloaded once, stored under the sha256 of their bytes and resized
+into a fixed set of variants:
+
+    <key>-<width>.webp / <key>-<width>.jpg    for width in VARIANT_WIDTHS
+
+``key`` is the first 32 hex digits of the sha256, so the same image found
+at several URLs is stored and resized once, and a replaced photo gets a new
+key (and new URLs). That makes every asset immutable: /media serves them
+with a one-year ``Cache-Control: immutable``. The ``photo_key`` columns on
+MP and Candidate record each row's key; clients build
+``/media/<photo_key>-320.webp`` (or ``.jpg``) from it and fall back to
+``photo_url`` while it is null.
+
+Layout of the store directory (MEDIA_DIR, default ``media``):
+
+    sources.json                  photo URL -> key, so known URLs aren't re-downloaded
+    ab/ab12...ef-320.webp         variants, sharded by the key's first two digits
+
+sync_photo_assets() runs after every MP scrape. To sync every MP and
+candidate photo by hand, from the backend directory:
+    python -m app.utils.photo_assets [--refresh] [--workers 4]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.models import MP, Candidate
+from app.utils.cache import invalidate_resource
+from app.utils.throttle import HostRateLimiter
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Serving stored assets doesn't need Pillow
+    Image = ImageOps = None
+
+# Widths (px) of the stored variants; smaller originals are never upscaled
+VARIANT_WIDTHS = (120, 320, 640)
+
+# Extension -> (Pillow format, save options)
+VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+MEDIA_TYPES = {"webp": "image/webp", "jpg": "image/jpeg"}
+
+ASSET_NAME = re.compile(r"^([0-9a-f]{32})-(\d+)\.(webp|jpg)$")
+
+# Larger downloads are refused (original photos are a few hundred KB)
+MAX_PHOTO_BYTES = 10 * 1024 * 1024
+
+
+def default_media_dir() -> str:
+    """Asset store location: MEDIA_DIR (default ``media``)"""
+    return os.getenv("MEDIA_DIR", "media")
+
+
+def default_download_delay() -> float:
+    """
+    Gap (seconds) between photo downloads from one host: the MP scraper's
+    MP_SCRAPER_MIN_DELAY if set, else 1 s. Most photos are on
+    parliament.go.ke, which the scraper never hits faster than that either.
+    """
+    min_delay = os.getenv("MP_SCRAPER_MIN_DELAY")
+    return float(min_delay) if min_delay else 1.0
+
+
+def variant_names(key: str) -> List[str]:
+    return [f"{key}-{width}.{ext}" for width in VARIANT_WIDTHS for ext in VARIANT_FORMATS]
+
+
+class PhotoStore:
+    """
+    Content-addressed photo variants in ``directory``.
+
+    add() is thread-safe: an image is resized by one thread at a time, and
+    variants are written to temporary files and renamed into place, so a
+    crash never leaves a partial file behind.
+    """
+
+    # Keys share a fixed pool of locks, so the pool doesn't grow with the store
+    LOCK_STRIPES = 64
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.sources_path = os.path.join(directory, "sources.json")
+        self._sources: Optional[Dict[str, str]] = None
+        self._key_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name[:2], name)
+
+    def resolve(self, name: str) -> Optional[Tuple[str, str]]:
+        """(file path, media type) of a stored asset, or None"""
+        match = ASSET_NAME.match(name)
+        if not match:
+            return None
+        path = self.path(name)
+        if not os.path.isfile(path):
+            return None
+        return path, MEDIA_TYPES[match.group(3)]
+
+    def has(self, key: str) -> bool:
+        """Whether every variant of ``key`` is stored"""
+        return all(os.path.exists(self.path(name)) for name in variant_names(key))
+
+    def add(self, data: bytes) -> Tuple[str, bool]:
+        """
+        Store an image's variants. Returns (key, created); created is False
+        when the same image was already stored.
+
+        Raises:
+            ValueError: ``data`` is not an image Pillow can read
+        """
+        if Image is None:
+            raise RuntimeError("Pillow is not installed (pip install pillow)")
+
+        key = hashlib.sha256(data).hexdigest()[:32]
+        # The same image from two URLs is resized once
+        with self._key_locks[int(key, 16) % self.LOCK_STRIPES]:
+            if self.has(key):
+                return key, False
+            self._write_variants(key, data)
+        return key, True
+
+    def _write_variants(self, key: str, data: bytes):
+        try:
+            with Image.open(io.BytesIO(data)) as original:
+                image = ImageOps.exif_transpose(original).convert("RGB")
+        except (OSError, Image.DecompressionBombError) as e:
+            raise ValueError(f"Not a usable image: {e}") from e
+
+        os.makedirs(os.path.join(self.directory, key[:2]), exist_ok=True)
+        for width in VARIANT_WIDTHS:
+            variant = image.copy()
+            variant.thumbnail((width, width * 4), Image.LANCZOS)
+            for ext, (image_format, options) in VARIANT_FORMATS.items():
+                path = self.path(f"{key}-{width}.{ext}")
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                variant.save(tmp_path, image_format, **options)
+                os.replace(tmp_path, path)
+
+    @property
+    def sources(self) -> Dict[str, str]:
+        """Photo URL -> key of the image last downloaded from it"""
+        with self._lock:
+            if self._sources is None:
+                self._sources = {}
+                if os.path.exists(self.sources_path):
+                    with open(self.sources_path, encoding="utf-8") as f:
+                        self._sources = json.load(f)
+            return self._sources
+
+    def remember(self, url: str, key: str):
+        sources = self.sources
+        with self._lock:
+            sources[url] = key
+
+    def save(self):
+        """Write sources.json atomically"""
+        with self._lock:
+            if self._sources is None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self.sources_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._sources, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.sources_path)
+
+
+class PhotoDownloader:
+    """
+    Downloads photos into a PhotoStore from a thread pool.
+
+    URLs already in the store's sources (with every variant present) are
+    skipped unless ``refresh`` is set. Requests to each host are spaced by
+    ``delay`` seconds (default default_download_delay()), without bursts,
+    however many workers there are; workers still overlap downloads with
+    resizing.
+    """
+
+    def __init__(
+        self,
+        store: PhotoStore,
+        workers: int = 4,
+        delay: Optional[float] = None,
+        refresh: bool = False,
+        timeout: float = 30.0,
+    ):
+        self.store = store
+        self.workers = max(1, workers)
+        delay = default_download_delay() if delay is None else delay
+        self.rate_limiter = HostRateLimiter(1 / delay, burst=1) if delay > 0 else None
+        self.refresh = refresh
+        self.timeout = timeout
+        self.headers = {"User-Agent": "Mozilla/5.0 (compatible; Elect2027PhotoBot/1.0)"}
+        self.stats = {"downloaded": 0, "known": 0, "duplicates": 0, "failed": 0, "bytes": 0}
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session is not thread-safe, so each worker thread gets its own
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(self.headers)
+        return self._local.session
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def fetch(self, url: str) -> str:
+        """Download one photo into the store and return its key"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if content_type and not content_type.startswith("image/"):
+                raise ValueError(f"Not an image ({content_type})")
+            data = bytearray()
+            for chunk in response.iter_content(64 * 1024):
+                data.extend(chunk)
+                if len(data) > MAX_PHOTO_BYTES:
+                    raise ValueError(f"Larger than {MAX_PHOTO_BYTES // (1024 * 1024)} MB")
+
+        key, created = self.store.add(bytes(data))
+        self._count("downloaded")
+        self._count("bytes", len(data))
+        if not created:
+            self._count("duplicates")
+        self.store.remember(url, key)
+        return key
+
+    def run(self, urls: Iterable[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Make sure every URL's photo is stored.
+
+        Returns:
+            (URL -> key for every stored photo, URL -> error for failures)
+        """
+        keys: Dict[str, str] = {}
+        to_fetch = []
+        for url in dict.fromkeys(urls):
+            key = self.store.sources.get(url)
+            if key and not self.refresh and self.store.has(key):
+                keys[url] = key
+                self._count("known")
+            else:
+                to_fetch.append(url)
+
+        failed: Dict[str, str] = {}
+
+        def fetch(url: str):
+            try:
+                return url, self.fetch(url), None
+            except (requests.RequestException, ValueError, OSError) as e:
+                self._count("failed")
+                return url, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for url, key, error in pool.map(fetch, to_fetch):
+                if key:
+                    keys[url] = key
+                else:
+                    failed[url] = error
+
+        self.store.save()
+        return keys, failed
+
+
+def _sync_table(db: Session, model, keys: Dict[str, str], identifier) -> List:
+    """
+    Point ``model`` rows at their photos' keys. Returns the identifiers of
+    rows that changed.
+
+    Rows without a photo_url lose their key; rows whose photo failed to
+    download keep the one they had (the MP upsert and the candidate PATCH
+    already cleared it if their photo_url changed).
+    """
+    table = model.__table__
+    updates = []
+    for row_id, ident, url, current in db.execute(
+        select(model.id, identifier, model.photo_url, model.photo_key)
+    ):
+        key = keys.get(url) if url else None
+        if (key or not url) and key != current:
+            updates.append({"row_id": row_id, "ident": ident, "key": key})
+
+    if updates:
+        db.execute(
+            table.update().where(table.c.id == bindparam("row_id")).values(photo_key=bindparam("key")),
+            [{"row_id": update["row_id"], "key": update["key"]} for update in updates],
+        )
+    return [update["ident"] for update in updates]
+
+
+def sync_photo_assets(
+    db: Session,
+    store: Optional[PhotoStore] = None,
+    workers: Optional[int] = None,
+    refresh: bool = False,
+) -> Dict:
+    """
+    Download every MP and candidate photo_url into the store and record
+    each row's photo_key (only rows whose key changed are written).
+
+    Args:
+        db: Database session
+        store: Photo store (default: MEDIA_DIR)
+        workers: Concurrent downloads (default PHOTO_WORKERS, 4)
+        refresh: Re-download URLs that are already stored
+
+    Returns:
+        Download stats plus mps_updated, candidates_updated and failed
+        (URL -> error)
+    """
+    store = store or PhotoStore(default_media_dir())
+    workers = workers or int(os.getenv("PHOTO_WORKERS", "4"))
+
+    urls = [
+        url
+        for model in (MP, Candidate)
+        for url in db.execute(select(model.photo_url).where(model.photo_url.startswith("http"))).scalars()
+    ]
+    downloader = PhotoDownloader(store, workers=workers, refresh=refresh)
+    keys, failed = downloader.run(urls)
+
+    try:
+        mps = _sync_table(db, MP, keys, MP.id)
+        candidates = _sync_table(db, Candidate, keys, Candidate.slug)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if mps:
+        invalidate_resource("mps", *mps)
+    if candidates:
+        invalidate_resource("candidates", *candidates)
+
+    stats = downloader.stats
+    print(
+        f"✓ Photos: {stats['downloaded']} downloaded ({stats['duplicates']} duplicates, "
+        f"{stats['bytes'] / 1024:.0f} KB), {stats['known']} already stored, {stats['failed']} failed; "
+        f"{len(mps)} MPs and {len(candidates)} candidates updated"
+    )
+    for url, error in list(failed.items())[:5]:
+        print(f"  ⚠ {url}: {error}")
+    return {**stats, "mps_updated": len(mps), "candidates_updated": len(candidates), "failed": failed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download MP and candidate photos into the local media store")
+    parser.add_argument("--refresh", action="store_true", help="re-download photos that are already stored")
+    parser.add_argument("--workers", type=int, default=None, help="concurrent downloads (default PHOTO_WORKERS or 4)")
+    args = parser.parse_args()
+
+    from app.database import SessionLocal, init_db
+
+    init_db()
+    db = SessionLocal()
+    try:
+        sync_photo_assets(db, workers=args.workers, refresh=args.refresh)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Checkpoint of an in-progress MP scrape, so a crashed run can pick up where
+it stopped instead of starting again from listing page one.
+
+The checkpoint file records the crawl frontier: which listing pages were
+read (with the profile links found on each), whether the listing is
+complete, and which profiles are done, failed or still pending. Parsed
+records themselves are the partial results in the run's NDJSON file (see
+app/utils/mp_records.py); on resume, profiles whose record is already in
+that file are not fetched again.
+
+The file is rewritten atomically, at most every few seconds while profiles
+are being scraped, and deleted once the run completes. ``on_progress`` (if
+set) is called with the progress counts after every change.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ScrapeCheckpoint:
+    """
+    Args:
+        path: Checkpoint JSON file
+        records_file: NDJSON file holding this run's records
+        save_interval: Minimum seconds between saves of profile progress
+    """
+
+    def __init__(self, path: str, records_file: str, save_interval: float = 5.0):
+        self.path = path
+        self.records_file = records_file
+        self.save_interval = save_interval
+        self.started_at = datetime.now().isoformat()
+        self.updated_at = self.started_at
+        self.listing_pages: Dict[int, Dict[str, str]] = {}  # page number -> {profile URL: fingerprint}
+        self.listing_complete = False
+        self.pending: List[str] = []
+        self.done: List[str] = []
+        self.failed: Dict[str, str] = {}  # profile URL -> error
+        self.resumed = False
+        self.on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._last_save = 0.0
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ScrapeCheckpoint"]:
+        """Checkpoint saved at ``path``, or None"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        checkpoint = cls(path, data["records_file"])
+        checkpoint.started_at = data["started_at"]
+        checkpoint.updated_at = data["updated_at"]
+        checkpoint.listing_pages = {int(page): rows for page, rows in data["listing_pages"].items()}
+        checkpoint.listing_complete = data["listing_complete"]
+        checkpoint.pending = data["pending"]
+        checkpoint.done = data["done"]
+        checkpoint.failed = data["failed"]
+        checkpoint.resumed = True
+        return checkpoint
+
+    def age(self) -> timedelta:
+        """Time since the checkpoint was last saved"""
+        return datetime.now() - datetime.fromisoformat(self.updated_at)
+
+    # Listing pages
+
+    def listing_page(self, page_num: int) -> Optional[Dict[str, str]]:
+        """Profile links recorded for a listing page, or None if not read yet"""
+        return self.listing_pages.get(page_num)
+
+    def record_listing_page(self, page_num: int, rows: Dict[str, str]):
+        self.listing_pages[page_num] = rows
+        self.save()
+        self._report()
+
+    def finish_listing(self, profile_urls: List[str]):
+        """Listing read in full; ``profile_urls`` are the profiles to scrape"""
+        self.listing_complete = True
+        finished = set(self.done)
+        self.pending = [url for url in profile_urls if url not in finished]
+        self.save()
+        self._report()
+
+    # Profiles
+
+    def profile_done(self, url: str):
+        self.done.append(url)
+        self.failed.pop(url, None)
+        self._drop_pending(url)
+        self.save(force=False)
+        self._report()
+
+    def profile_failed(self, url: str, error: str):
+        self.failed[url] = error
+        self._drop_pending(url)
+        self.save(force=False)
+        self._report()
+
+    def _drop_pending(self, url: str):
+        try:
+            self.pending.remove(url)
+        except ValueError:
+            pass
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "stage": "profiles" if self.listing_complete else "listing",
+            "listing_pages": len(self.listing_pages),
+            "pending": len(self.pending),
+            "done": len(self.done),
+            "failed": len(self.failed),
+        }
+
+    def _report(self):
+        if self.on_progress:
+            self.on_progress(self.progress())
+
+    # Persistence
+
+    def save(self, force: bool = True):
+        """Write the checkpoint (throttled to ``save_interval`` unless forced)"""
+        now = time.monotonic()
+        if not force and now - self._last_save < self.save_interval:
+            return
+        self._last_save = now
+        self.updated_at = datetime.now().isoformat()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+            "records_file": self.records_file,
+            "listing_pages": self.listing_pages,
+            "listing_complete": self.listing_complete,
+            "pending": self.pending,
+            "done": self.done,
+            "failed": self.failed,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Delete the checkpoint after a completed run"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
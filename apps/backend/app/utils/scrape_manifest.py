@@ -0,0 +1,126 @@
+"""
+Persisted manifest for incremental MP scrapes.
+
+For every profile URL seen on the listing pages the manifest keeps a
+fingerprint of its listing row, when it was first/last seen and fetched, and
+the record parsed from the profile page. An incremental run diffs the current
+listing against it and only fetches profiles that are new, whose listing row
+changed, or whose record is older than the refresh window.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ManifestDiff:
+    """Listing rows compared with the manifest (URLs in listing order)"""
+
+    listing: List[str] = field(default_factory=list)
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    stale: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    disappeared: List[str] = field(default_factory=list)
+
+    @property
+    def to_fetch(self) -> List[str]:
+        """Profiles that need a request this run"""
+        fetch = set(self.new + self.changed + self.stale)
+        return [url for url in self.listing if url in fetch]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "new": len(self.new),
+            "changed": len(self.changed),
+            "stale": len(self.stale),
+            "unchanged": len(self.unchanged),
+            "disappeared": len(self.disappeared),
+        }
+
+
+class ScrapeManifest:
+    """
+    JSON manifest of scraped MP profiles, keyed by profile URL.
+
+    Args:
+        path: JSON file to load from / save to
+        refresh_after: Re-fetch profiles whose record is older than this,
+            even if their listing row is unchanged (None: never)
+    """
+
+    def __init__(self, path: str, refresh_after: Optional[timedelta] = None):
+        self.path = path
+        self.refresh_after = refresh_after
+        self.entries: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("profiles", {})
+
+    def diff(self, rows: Dict[str, str], now: Optional[datetime] = None) -> ManifestDiff:
+        """Compare ``rows`` ({profile URL: listing fingerprint}) with the manifest"""
+        now = now or datetime.now()
+        result = ManifestDiff(listing=list(rows))
+
+        for url, fingerprint in rows.items():
+            entry = self.entries.get(url)
+            if entry is None or entry.get("record") is None:
+                result.new.append(url)
+            elif entry["fingerprint"] != fingerprint:
+                result.changed.append(url)
+            elif self.refresh_after and (
+                now - datetime.fromisoformat(entry["fetched_at"]) > self.refresh_after
+            ):
+                result.stale.append(url)
+            else:
+                result.unchanged.append(url)
+
+        result.disappeared = [
+            url for url, entry in self.entries.items()
+            if url not in rows and entry.get("record") is not None
+        ]
+        return result
+
+    def record(self, url: str) -> Optional[dict]:
+        """Last parsed record for ``url``"""
+        entry = self.entries.get(url)
+        return entry.get("record") if entry else None
+
+    def update(
+        self,
+        rows: Dict[str, str],
+        fetched: Dict[str, dict],
+        disappeared: List[str],
+        now: Optional[datetime] = None,
+    ):
+        """
+        Record a run: every listed URL was seen, ``fetched`` URLs get their new
+        fingerprint and record, and ``disappeared`` URLs are flagged.
+
+        Profiles that failed to fetch keep their old fingerprint, so the next
+        incremental run tries them again.
+        """
+        stamp = (now or datetime.now()).isoformat()
+
+        for url, fingerprint in rows.items():
+            entry = self.entries.setdefault(url, {"fingerprint": None, "first_seen": stamp, "record": None})
+            entry["last_seen"] = stamp
+            entry.pop("missing_since", None)
+            if url in fetched:
+                entry.update(fingerprint=fingerprint, record=fetched[url], fetched_at=stamp)
+
+        for url in disappeared:
+            self.entries[url].setdefault("missing_since", stamp)
+
+    def save(self):
+        """Write the manifest atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": datetime.now().isoformat(), "profiles": self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,215 @@
+"""
+Streaming fetch → parse → collect pipeline for the scrapers.
+
+    fetcher threads ──▶ bounded queue ──▶ dispatcher ──▶ process pool ──▶ writer
+      (network I/O)      (backpressure)                  (parsing, all cores)
+
+- Fetchers download pages on a thread pool. When parsing falls behind, the
+  bounded queue fills up and fetchers block instead of piling up HTML.
+- The dispatcher keeps at most ``max_in_flight`` pages inside the process
+  pool at once.
+- The caller's thread is the single writer: it iterates over the results,
+  either in input order or as soon as each one is ready.
+
+Per-page fetch and parse failures are reported in that page's result.
+Anything else (a crashed parser process, an exception raised by the
+consumer) stops the whole pipeline: fetchers stop taking work, queued and
+pending pages are dropped, every thread and process is shut down, then the
+error propagates.
+"""
+
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+# fetch(url) -> (html, record); a non-None record means the page needs no parsing
+FetchFunc = Callable[[str], Tuple[Optional[str], Any]]
+
+_DONE = object()
+
+
+@dataclass
+class PipelineResult:
+    """Outcome for one input URL"""
+
+    index: int
+    url: str
+    record: Any = None
+    error: Optional[BaseException] = None
+    parsed: bool = False  # False when fetch() supplied the record (e.g. from cache)
+
+
+class _Fatal:
+    """Wraps an error that stops the pipeline"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class FetchParsePipeline:
+    """
+    Args:
+        fetch: Called on fetcher threads; returns (html, None) for pages that
+            need parsing or (None, record) for pages that don't
+        parse: Picklable ``parse(html, url) -> record``, run in the process pool
+        fetch_workers: Fetcher threads
+        parse_workers: Parser processes (default: CPU count)
+        queue_size: Fetched pages waiting for a parser before fetchers block
+        ordered: Yield results in input order (else in completion order)
+        initializer / initargs: Run once in each parser process
+    """
+
+    def __init__(
+        self,
+        fetch: FetchFunc,
+        parse: Callable[[str, str], Any],
+        fetch_workers: int = 4,
+        parse_workers: Optional[int] = None,
+        queue_size: int = 32,
+        ordered: bool = True,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+    ):
+        self.fetch = fetch
+        self.parse = parse
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = parse_workers or multiprocessing.cpu_count()
+        self.queue_size = max(1, queue_size)
+        self.max_in_flight = self.parse_workers * 2
+        self.ordered = ordered
+        self.initializer = initializer
+        self.initargs = initargs
+
+    def run(self, urls: Sequence[str]) -> Iterator[PipelineResult]:
+        """Yield one PipelineResult per URL"""
+        urls = list(urls)
+        if not urls:
+            return
+
+        stop = threading.Event()
+        work: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        for item in enumerate(urls):
+            work.put(item)
+        fetched: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        results: "queue.Queue" = queue.Queue()
+        in_flight = threading.BoundedSemaphore(self.max_in_flight)
+
+        # Spawned (not forked) workers: forking while fetcher threads hold locks is unsafe
+        executor = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self.initializer,
+            initargs=self.initargs,
+        )
+
+        def put(q: queue.Queue, item) -> bool:
+            """Blocking put that gives up once the pipeline is stopping"""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetcher():
+            while not stop.is_set():
+                try:
+                    index, url = work.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    html, record = self.fetch(url)
+                except Exception as e:
+                    results.put(PipelineResult(index, url, error=e))
+                    continue
+                if record is not None or html is None:
+                    results.put(PipelineResult(index, url, record=record))
+                elif not put(fetched, (index, url, html)):
+                    return
+
+        def on_parsed(future: Future, index: int, url: str):
+            in_flight.release()
+            if future.cancelled():
+                return
+            error = future.exception()
+            if isinstance(error, BrokenProcessPool):
+                results.put(_Fatal(error))
+            elif error is not None:
+                results.put(PipelineResult(index, url, error=error))
+            else:
+                results.put(PipelineResult(index, url, record=future.result(), parsed=True))
+
+        def dispatcher():
+            try:
+                while not stop.is_set():
+                    try:
+                        item = fetched.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if item is _DONE:
+                        return
+                    index, url, html = item
+                    while not in_flight.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    future = executor.submit(self.parse, html, url)
+                    future.add_done_callback(lambda f, i=index, u=url: on_parsed(f, i, u))
+            except BaseException as e:
+                results.put(_Fatal(e))
+
+        fetchers = [
+            threading.Thread(target=fetcher, name=f"pipeline-fetch-{i}", daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        dispatch_thread = threading.Thread(target=dispatcher, name="pipeline-dispatch", daemon=True)
+        for thread in fetchers:
+            thread.start()
+        dispatch_thread.start()
+
+        def close_fetched_queue():
+            for thread in fetchers:
+                thread.join()
+            put(fetched, _DONE)
+
+        closer = threading.Thread(target=close_fetched_queue, name="pipeline-close", daemon=True)
+        closer.start()
+
+        try:
+            yield from self._collect(results, len(urls))
+        finally:
+            stop.set()
+            # Unblock anything waiting on a full queue, then tear down
+            while True:
+                try:
+                    fetched.get_nowait()
+                except queue.Empty:
+                    break
+            executor.shutdown(wait=True, cancel_futures=True)
+            for thread in [*fetchers, dispatch_thread, closer]:
+                thread.join()
+
+    def _collect(self, results: queue.Queue, total: int) -> Iterator[PipelineResult]:
+        """The writer: yield results (re-sequenced in ordered mode)"""
+        buffered: Dict[int, PipelineResult] = {}
+        next_index = 0
+        received = 0
+
+        while received < total:
+            result = results.get()
+            if isinstance(result, _Fatal):
+                raise result.error
+            received += 1
+
+            if not self.ordered:
+                yield result
+                continue
+
+            buffered[result.index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
@@ -0,0 +1,216 @@
+"""
+Full-text search across candidates, issues, vote-buying facts and MPs.
+
+Postgres: each source table gets a generated `search_vector` tsvector column
+with a GIN index, so the index follows every write automatically.
+
+SQLite (local/test deployments): one FTS5 table, `search_index`, kept in sync
+by INSERT/UPDATE/DELETE triggers on the source tables.
+
+install_search_index() creates either variant (see migration 003).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """How one table is exposed to search"""
+
+    kind: str
+    table: str
+    ref: str  # Column identifying the row in the API (slug or id)
+    url: str  # API path for a hit, with {ref}
+    title: str  # Title column
+    body: Sequence[str]  # Text columns
+    json_body: Sequence[str] = ()  # JSON arrays of strings
+
+
+SEARCH_SOURCES: Dict[str, SearchSource] = {
+    source.kind: source
+    for source in (
+        SearchSource("candidate", "candidates", "slug", "/candidates/{ref}", "name", ("bio_text",)),
+        SearchSource(
+            "issue", "issues", "id", "/issues/{ref}", "title", (),
+            ("good_points_json", "bad_points_json"),
+        ),
+        SearchSource(
+            "vote_buying_fact", "vote_buying_facts", "id", "/vote-buying-facts/{ref}",
+            "section_title", ("content_text",),
+        ),
+        SearchSource("mp", "mps", "id", "/mps/{ref}", "name", ("constituency", "county")),
+    )
+}
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+def _pg_document(source: SearchSource) -> str:
+    """Immutable expression for a generated tsvector column"""
+    title = f"setweight(to_tsvector('english', coalesce({source.title}, '')), 'A')"
+    parts = [f"coalesce({column}, '')" for column in source.body]
+    parts += [f"coalesce({column}::text, '')" for column in source.json_body]
+    body = " || ' ' || ".join(parts)
+    return f"{title} || setweight(to_tsvector('english', {body}), 'B')"
+
+
+def _sqlite_body(source: SearchSource, row: str) -> str:
+    """Body text expression for a trigger (``row`` is new/old) or backfill"""
+    parts = [f"coalesce({row}.{column}, '')" for column in source.body]
+    parts += [
+        f"coalesce((SELECT group_concat(value, ' ') FROM json_each({row}.{column})), '')"
+        for column in source.json_body
+    ]
+    return " || ' ' || ".join(parts)
+
+
+def install_search_index(conn: Connection):
+    """Create the search columns/indexes (Postgres) or FTS5 table and triggers (SQLite)"""
+    if conn.dialect.name == "postgresql":
+        for source in SEARCH_SOURCES.values():
+            conn.execute(text(
+                f"ALTER TABLE {source.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({_pg_document(source)}) STORED"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{source.table}_search_vector "
+                f"ON {source.table} USING gin (search_vector)"
+            ))
+        return
+
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "kind UNINDEXED, ref UNINDEXED, title, body, tokenize = 'porter unicode61')"
+    ))
+    for source in SEARCH_SOURCES.values():
+        insert = (
+            "INSERT INTO search_index (kind, ref, title, body) "
+            f"VALUES ('{source.kind}', new.{source.ref}, new.{source.title}, {_sqlite_body(source, 'new')});"
+        )
+        delete = (
+            f"DELETE FROM search_index WHERE kind = '{source.kind}' AND ref = old.{source.ref};"
+        )
+        name = f"search_{source.table}"
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {source.table} BEGIN {insert} END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {source.table} BEGIN {delete} END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE ON {source.table} "
+            f"BEGIN {delete} {insert} END"
+        ))
+
+        # Index rows that existed before the triggers
+        conn.execute(text(f"DELETE FROM search_index WHERE kind = '{source.kind}'"))
+        conn.execute(text(
+            "INSERT INTO search_index (kind, ref, title, body) "
+            f"SELECT '{source.kind}', src.{source.ref}, src.{source.title}, {_sqlite_body(source, 'src')} "
+            f"FROM {source.table} AS src"
+        ))
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _fts5_query(q: str) -> str:
+    """Turn free text into an FTS5 query: every word must match (as a prefix)"""
+    terms = [term.replace('"', '""') for term in q.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+def _pg_search_sql(kinds: List[str]) -> str:
+    selects = []
+    for kind in kinds:
+        source = SEARCH_SOURCES[kind]
+        body = [f"coalesce(src.{column}, '')" for column in source.body]
+        body += [
+            f"coalesce((SELECT string_agg(v, ' ') FROM json_array_elements_text(src.{column}) v), '')"
+            for column in source.json_body
+        ]
+        body = " || ' ' || ".join(body)
+        selects.append(
+            f"SELECT '{kind}' AS kind, src.{source.ref}::text AS ref, src.{source.title} AS title, "
+            f"{body} AS body, ts_rank(src.search_vector, query) AS score "
+            f"FROM {source.table} AS src, websearch_to_tsquery('english', :q) AS query "
+            "WHERE src.search_vector @@ query"
+        )
+
+    # Headlines are only computed for the rows on the requested page
+    return (
+        "SELECT kind, ref, title, score, "
+        "ts_headline('english', body, websearch_to_tsquery('english', :q), "
+        f"'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=30, MinWords=10') AS snippet "
+        f"FROM ({' UNION ALL '.join(selects)}) AS hits "
+        "ORDER BY score DESC, kind, ref LIMIT :limit OFFSET :offset"
+    )
+
+
+_SQLITE_SEARCH_SQL = (
+    "SELECT kind, ref, title, -bm25(search_index, 0.0, 0.0, 5.0, 1.0) AS score, "
+    f"snippet(search_index, 3, '{HIGHLIGHT_START}', '{HIGHLIGHT_STOP}', '…', 16) AS snippet "
+    "FROM search_index WHERE search_index MATCH :q AND kind IN ({kinds}) "
+    "ORDER BY score DESC, kind, ref LIMIT :limit OFFSET :offset"
+)
+
+
+async def search(
+    db: AsyncSession,
+    q: str,
+    kinds: Optional[List[str]] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> List[dict]:
+    """
+    Ranked search hits, best first.
+
+    Args:
+        db: Async database session
+        q: Free-text query
+        kinds: Restrict to these SEARCH_SOURCES kinds (default: all)
+        limit: Maximum number of hits
+        offset: Number of hits to skip
+
+    Returns:
+        List of {kind, ref, title, snippet, url, score} dicts
+    """
+    kinds = [k for k in (kinds or SEARCH_SOURCES) if k in SEARCH_SOURCES]
+    if not kinds:
+        return []
+
+    params = {"limit": limit, "offset": offset}
+    if db.bind.dialect.name == "postgresql":
+        sql = _pg_search_sql(kinds)
+        params["q"] = q
+    else:
+        match = _fts5_query(q)
+        if not match:
+            return []
+        placeholders = ", ".join(f":kind{i}" for i in range(len(kinds)))
+        sql = _SQLITE_SEARCH_SQL.format(kinds=placeholders)
+        params.update(q=match, **{f"kind{i}": kind for i, kind in enumerate(kinds)})
+
+    result = await db.execute(text(sql), params)
+    return [
+        {
+            "kind": row.kind,
+            "ref": str(row.ref),
+            "title": row.title,
+            "snippet": row.snippet,
+            "url": SEARCH_SOURCES[row.kind].url.format(ref=row.ref),
+            "score": float(row.score),
+        }
+        for row in result
+    ]
@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds at most ``burst`` tokens and refills at ``rate`` tokens per second.
+    acquire() blocks until a token is available, so callers sharing a bucket
+    never exceed ``rate`` requests per second on average.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float):
+        """Change the refill rate (tokens already accrued are kept)"""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Wait for a request slot on ``url``'s host"""
+        return self.bucket(url).acquire()
+
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """
+    HostRateLimiter whose per-host rate follows the server's health (AIMD).
+
+    Every response is reported with record(). While responses are fast and
+    successful the host's rate grows by ``increase`` req/s per response (up
+    to ``max_rate``); a failure (timeout, 5xx, 429) or a latency average
+    above ``latency_target`` seconds multiplies it by ``decrease`` (down to
+    ``min_rate``). Latency and error rate are exponentially weighted moving
+    averages over roughly the last 1/``smoothing`` responses.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        latency_target: float = 2.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        smoothing: float = 0.2,
+        burst: int = 1,
+    ):
+        super().__init__(rate, burst)
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max(max_rate, rate)
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self.smoothing = smoothing
+        self._health: Dict[str, Dict[str, float]] = {}
+
+    def record(self, url: str, latency: float, ok: bool):
+        """Report one response (or failed attempt) and adjust the host's rate"""
+        bucket = self.bucket(url)
+        host = urlsplit(url).netloc
+        with self._lock:
+            health = self._health.setdefault(host, {"latency": latency, "error_rate": 0.0, "responses": 0})
+            health["latency"] += self.smoothing * (latency - health["latency"])
+            health["error_rate"] += self.smoothing * ((0.0 if ok else 1.0) - health["error_rate"])
+            health["responses"] += 1
+
+            if ok and health["latency"] <= self.latency_target:
+                rate = min(self.max_rate, bucket.rate + self.increase)
+            else:
+                rate = max(self.min_rate, bucket.rate * self.decrease)
+            health["rate"] = rate
+        if rate != bucket.rate:
+            bucket.set_rate(rate)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per host: current rate, latency and error-rate averages, responses seen"""
+        with self._lock:
+            return {host: dict(health) for host, health in self._health.items()}
+
+
+class CircuitOpenError(RuntimeError):
+    """The circuit breaker gave up waiting for the server to recover"""
+
+
+class CircuitBreaker:
+    """
+    Pauses callers while the server is failing instead of letting them burn
+    through every URL.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    before_request() blocks. Once ``reset_timeout`` has passed, one caller
+    is let through as a probe: success closes the circuit and wakes
+    everyone, failure reopens it for twice as long (up to
+    ``max_reset_timeout``). A probe that reports neither within the timeout
+    is replaced by another. If the outage lasts longer than ``give_up_after``
+    seconds, before_request() raises CircuitOpenError from then on.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 300.0,
+        give_up_after: Optional[float] = 900.0,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.give_up_after = give_up_after
+        self.state = self.CLOSED
+        self.opened = 0  # Times the circuit has opened
+        self._failures = 0
+        self._timeout = reset_timeout
+        self._retry_at = 0.0
+        self._outage_started: Optional[float] = None
+        self._cond = threading.Condition()
+
+    def before_request(self) -> float:
+        """Wait until a request may be sent. Returns the time spent waiting."""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                if self.state == self.CLOSED:
+                    return time.monotonic() - started
+                now = time.monotonic()
+                give_up_at = (
+                    self._outage_started + self.give_up_after
+                    if self.give_up_after is not None else float("inf")
+                )
+                if now >= give_up_at:
+                    raise CircuitOpenError(
+                        f"Server still failing after {now - self._outage_started:.0f}s, giving up"
+                    )
+                if now >= self._retry_at:
+                    # This caller is the probe
+                    self.state = self.HALF_OPEN
+                    self._retry_at = now + self._timeout
+                    return time.monotonic() - started
+                # Open and cooling down, or another caller's probe is in flight
+                self._cond.wait(min(self._retry_at, give_up_at) - now)
+
+    def record_success(self):
+        with self._cond:
+            self._failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self._timeout = self.reset_timeout
+                self._outage_started = None
+                self._cond.notify_all()
+
+    def record_failure(self):
+        with self._cond:
+            self._failures += 1
+            if self.state == self.HALF_OPEN:
+                self._timeout = min(self.max_reset_timeout, self._timeout * 2)
+                self._open()
+            elif self.state == self.CLOSED and self._failures >= self.failure_threshold:
+                self._outage_started = time.monotonic()
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened += 1
+        self._retry_at = time.monotonic() + self._timeout
+        self._cond.notify_all()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based): exponential with full jitter"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,12 +1,141 @@
-import requests
+"""
+Wikipedia summaries for candidates, governors, senators and MPs.
+
+get_wiki_summary() fetches one title from the REST summary endpoint and
+caches it in memory for 24 hours. prefetch_wiki_summaries() warms that
+cache for many titles at once through the MediaWiki action API (up to
+BATCH_SIZE titles per request, throttled) and saves what it fetched to a
+snapshot file, so a prefetch run by seeds.py or the MP scraper in another
+process warms the API server too (get_wiki_summary loads the snapshot on a
+cache miss).
+
+Endpoints are configurable, e.g. to point tests at a local stand-in:
+    WIKIPEDIA_API_URL    action API (default https://en.wikipedia.org/w/api.php)
+    WIKIPEDIA_REST_URL   REST API (default https://en.wikipedia.org/api/rest_v1)
+    WIKIPEDIA_CACHE_PATH snapshot (default .scraper_cache/wikipedia.json, empty disables)
+
+To prefetch every wiki_title in the database, from the backend directory:
+    python -m app.utils.wikipedia [--refresh]
+"""
+
+import argparse
 import json
+import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+import requests
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import MP, Candidate, County, CountyMP, CountySenator
 from app.schemas import WikipediaSummaryResponse
+from app.utils.throttle import TokenBucket, backoff_delay, parse_retry_after
 
 # Simple in-memory cache
 _wiki_cache: dict = {}
 
+CACHE_TTL = timedelta(hours=24)
+
+# Titles per action API request (the most intro extracts it returns at once)
+BATCH_SIZE = 20
+
+# Wikimedia asks API clients to identify themselves
+USER_AGENT = "Elect2027/0.1 (Kenya voter information platform)"
+
+_snapshot_lock = threading.Lock()
+_snapshot_mtime: Optional[float] = None
+
+
+def _api_url() -> str:
+    return os.getenv("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+
+
+def _rest_url() -> str:
+    return os.getenv("WIKIPEDIA_REST_URL", "https://en.wikipedia.org/api/rest_v1").rstrip("/")
+
+
+def default_snapshot_path() -> Optional[str]:
+    return os.getenv("WIKIPEDIA_CACHE_PATH", os.path.join(".scraper_cache", "wikipedia.json")) or None
+
+
+def _page_url(title: str) -> str:
+    return f"https://en.m.wikipedia.org/wiki/{quote(title.replace(' ', '_'), safe='()_,')}"
+
+
+def _cache_summary(wiki_title: str, summary: WikipediaSummaryResponse, fetched_at: datetime):
+    _wiki_cache[f"wiki_{wiki_title}"] = {
+        "data": summary,
+        "expires": fetched_at + CACHE_TTL,
+    }
+
+
+def _load_snapshot():
+    """Merge the prefetch snapshot into the cache if it changed since last loaded"""
+    global _snapshot_mtime
+    path = default_snapshot_path()
+    if not path:
+        return
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return
+    with _snapshot_lock:
+        if mtime == _snapshot_mtime:
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        _snapshot_mtime = mtime
+
+    now = datetime.now()
+    for wiki_title, entry in entries.items():
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        cached = _wiki_cache.get(f"wiki_{wiki_title}")
+        if fetched_at + CACHE_TTL > now and (cached is None or cached["expires"] < fetched_at + CACHE_TTL):
+            _cache_summary(wiki_title, WikipediaSummaryResponse(**entry["summary"]), fetched_at)
+
+
+def _save_snapshot(summaries: Dict[str, WikipediaSummaryResponse], fetched_at: datetime):
+    """Add freshly fetched summaries to the snapshot file (atomically)"""
+    path = default_snapshot_path()
+    if not path or not summaries:
+        return
+    with _snapshot_lock:
+        entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+        # Drop expired entries so the file doesn't grow forever
+        cutoff = datetime.now() - CACHE_TTL
+        entries = {
+            title: entry for title, entry in entries.items()
+            if datetime.fromisoformat(entry["fetched_at"]) > cutoff
+        }
+        for wiki_title, summary in summaries.items():
+            entries[wiki_title] = {"fetched_at": fetched_at.isoformat(), "summary": summary.model_dump()}
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, path)
+
+
+def _cached(wiki_title: str) -> Optional[WikipediaSummaryResponse]:
+    cached = _wiki_cache.get(f"wiki_{wiki_title}")
+    if cached and cached["expires"] > datetime.now():
+        return cached["data"]
+    return None
+
 
 def get_wiki_summary(wiki_title: str) -> WikipediaSummaryResponse:
     """
@@ -18,16 +147,17 @@ def get_wiki_summary(wiki_title: str) -> WikipediaSummaryResponse:
     Returns:
         WikipediaSummaryResponse with extract, thumbnail, and page URL
     """
-    # Check cache first
-    cache_key = f"wiki_{wiki_title}"
-    if cache_key in _wiki_cache:
-        cached = _wiki_cache[cache_key]
-        if cached["expires"] > datetime.now():
-            return cached["data"]
+    # Check cache first (including what a prefetch in another process saved)
+    cached = _cached(wiki_title)
+    if cached is None:
+        _load_snapshot()
+        cached = _cached(wiki_title)
+    if cached is not None:
+        return cached
 
     try:
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_title}"
-        response = requests.get(url, timeout=5)
+        url = f"{_rest_url()}/page/summary/{wiki_title}"
+        response = requests.get(url, timeout=5, headers={"User-Agent": USER_AGENT})
         response.raise_for_status()
 
         data = response.json()
@@ -41,10 +171,7 @@ def get_wiki_summary(wiki_title: str) -> WikipediaSummaryResponse:
         )
 
         # Cache for 24 hours
-        _wiki_cache[cache_key] = {
-            "data": result,
-            "expires": datetime.now() + timedelta(hours=24),
-        }
+        _cache_summary(wiki_title, result, datetime.now())
 
         return result
     except requests.RequestException as e:
@@ -65,6 +192,193 @@ def get_wiki_summary(wiki_title: str) -> WikipediaSummaryResponse:
         )
 
 
+def _query_batch(
+    session: requests.Session,
+    titles: List[str],
+    bucket: TokenBucket,
+    stats: Dict[str, int],
+    max_retries: int = 3,
+) -> Dict[str, WikipediaSummaryResponse]:
+    """
+    Summaries for up to BATCH_SIZE titles from one action API query
+    (following continuations). Titles that don't exist get a summary
+    without an extract, so they aren't looked up again. Every HTTP call,
+    retries included, is counted in ``stats["requests"]``.
+
+    Raises:
+        requests.RequestException: The API kept failing
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": "2",
+        "prop": "extracts|pageimages|description",
+        "exintro": "1",
+        "explaintext": "1",
+        "exlimit": "max",
+        "piprop": "thumbnail",
+        "pithumbsize": "320",
+        "pilimit": "max",
+        "redirects": "1",
+        "maxlag": "5",
+        "titles": "|".join(titles),
+    }
+    pages: Dict[str, Dict] = {}
+    renamed: Dict[str, str] = {}
+    continuation: Dict[str, str] = {}
+    attempt = 0
+
+    while True:
+        bucket.acquire()
+        stats["requests"] += 1
+        retry_after = None
+        try:
+            response = session.get(_api_url(), params={**params, **continuation}, timeout=30)
+            if response.status_code in (429, 500, 502, 503, 504):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                response.raise_for_status()
+            data = response.json()
+            if data.get("error", {}).get("code") == "maxlag":
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                raise requests.RequestException("Wikipedia replicas are lagging (maxlag)")
+            response.raise_for_status()
+        except (requests.RequestException, ValueError):
+            if attempt >= max_retries:
+                raise
+            time.sleep(min(retry_after, 60) if retry_after is not None else backoff_delay(attempt))
+            attempt += 1
+            continue
+
+        query = data.get("query", {})
+        for step in (*query.get("normalized", []), *query.get("redirects", [])):
+            renamed[step["from"]] = step["to"]
+        for page in query.get("pages", []):
+            pages.setdefault(page["title"], {}).update(page)
+
+        if "continue" not in data:
+            break
+        continuation = data["continue"]
+
+    summaries = {}
+    for wiki_title in titles:
+        title = wiki_title
+        for _ in range(3):  # Normalized, then redirected (at most once each)
+            title = renamed.get(title, title)
+        page = pages.get(title, {"missing": True})
+        summaries[wiki_title] = WikipediaSummaryResponse(
+            extract=(page.get("extract") or "")[:800] or None,  # Limit to 800 chars
+            thumbnail_url=page.get("thumbnail", {}).get("source"),
+            page_url=_page_url(title),
+            description=page.get("description"),
+        )
+    return summaries
+
+
+def prefetch_wiki_summaries(
+    titles: Iterable[str],
+    rate: Optional[float] = None,
+    refresh: bool = False,
+) -> Dict[str, int]:
+    """
+    Warm the summary cache for many titles with batched action API queries.
+
+    Args:
+        titles: Wikipedia article titles (duplicates and blanks are ignored)
+        rate: Requests per second (default WIKIPEDIA_REQUESTS_PER_SECOND, 1)
+        refresh: Re-fetch titles that are already cached
+
+    Returns:
+        Counts of titles, already cached, fetched, missing (fetched but no
+        article or extract), failed, and API requests made (continuations
+        and retries included)
+    """
+    if rate is None:
+        rate = float(os.getenv("WIKIPEDIA_REQUESTS_PER_SECOND", "1"))
+
+    titles = list(dict.fromkeys(title.strip() for title in titles if title and title.strip()))
+    if not refresh:
+        _load_snapshot()
+    to_fetch = titles if refresh else [title for title in titles if _cached(title) is None]
+    stats = {
+        "titles": len(titles),
+        "cached": len(titles) - len(to_fetch),
+        "fetched": 0,
+        "missing": 0,
+        "failed": 0,
+        "requests": 0,
+    }
+
+    bucket = TokenBucket(rate)
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    fetched_at = datetime.now()
+    fetched: Dict[str, WikipediaSummaryResponse] = {}
+
+    for start in range(0, len(to_fetch), BATCH_SIZE):
+        batch = to_fetch[start:start + BATCH_SIZE]
+        try:
+            summaries = _query_batch(session, batch, bucket, stats)
+        except (requests.RequestException, ValueError) as e:
+            print(f"⚠ Wikipedia batch of {len(batch)} titles failed: {e}")
+            stats["failed"] += len(batch)
+            continue
+        for wiki_title, summary in summaries.items():
+            _cache_summary(wiki_title, summary, fetched_at)
+            fetched[wiki_title] = summary
+            stats["fetched"] += 1
+            stats["missing"] += summary.extract is None
+
+    _save_snapshot(fetched, fetched_at)
+    return stats
+
+
+def tracked_wiki_titles(db: Session) -> List[str]:
+    """Every candidate, governor, senator and MP wiki_title in the database"""
+    columns = (
+        Candidate.wiki_title,
+        County.governor_wiki_title,
+        CountySenator.wiki_title,
+        CountyMP.wiki_title,
+        MP.wiki_title,
+    )
+    titles = set()
+    for column in columns:
+        titles.update(db.execute(select(column).where(column.is_not(None)).distinct()).scalars())
+    return sorted(title for title in titles if title.strip())
+
+
+def prefetch_tracked_summaries(db: Session, refresh: bool = False) -> Dict[str, int]:
+    """prefetch_wiki_summaries() for every wiki_title in the database"""
+    stats = prefetch_wiki_summaries(tracked_wiki_titles(db), refresh=refresh)
+    print(
+        f"✓ Wikipedia summaries: {stats['fetched']} fetched in {stats['requests']} requests "
+        f"({stats['missing']} without a summary), {stats['cached']} already cached, "
+        f"{stats['failed']} failed"
+    )
+    return stats
+
+
 def clear_wiki_cache():
     """Clear Wikipedia cache (useful for testing)"""
+    global _snapshot_mtime
     _wiki_cache.clear()
+    _snapshot_mtime = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch Wikipedia summaries for every tracked person")
+    parser.add_argument("--refresh", action="store_true", help="re-fetch summaries that are already cached")
+    args = parser.parse_args()
+
+    from app.database import SessionLocal, init_db
+
+    init_db()
+    db = SessionLocal()
+    try:
+        prefetch_tracked_summaries(db, refresh=args.refresh)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Concurrent-request throughput: sync sessions vs the async data layer.
+
+Fires batches of concurrent GET /candidates/{slug} requests at two versions of
+the handler - the old one (async def + sync Session on a NullPool engine) and
+the ported one (async def + AsyncSession) - and reports requests/sec for each.
+
+A temporary SQLite database stands in for Postgres. Every query against the
+`candidates` view waits DB_LATENCY_MS inside the driver, the way a remote
+database would, so the difference shows whether that wait blocks the event loop.
+
+Run from the backend directory: python -m benchmarks.async_routes
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="elect-bench-"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.database import DATABASE_URL, async_engine, engine
+from app.models import Candidate
+from app.routes import candidates
+from app.schemas import CandidateResponse
+
+DB_LATENCY_MS = 20
+
+
+def _install_latency(dbapi_connection, connection_record):
+    """Register bench_sleep() so the candidates view can simulate DB latency"""
+    dbapi_connection.create_function(
+        "bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 1
+    )
+
+
+def setup_database(rows: int):
+    """Create a candidates table behind a view that waits DB_LATENCY_MS per query"""
+    event.listen(engine, "connect", _install_latency)
+    event.listen(async_engine.sync_engine, "connect", _install_latency)
+
+    with engine.begin() as conn:
+        Candidate.__table__.create(conn)
+        conn.execute(text("ALTER TABLE candidates RENAME TO candidates_data"))
+        conn.execute(
+            text(
+                "CREATE VIEW candidates AS SELECT c.* FROM candidates_data c "
+                f"JOIN (SELECT bench_sleep({DB_LATENCY_MS}) AS s) ON 1"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO candidates_data (slug, name, party, photo_url, bio_text, "
+                "wiki_title, good_json, bad_json, crazy_json, policies_json) "
+                "VALUES (:slug, :name, 'Party', 'https://example.com/p.jpg', 'Bio', "
+                ":name, '[]', '[]', '[]', '[]')"
+            ),
+            [{"slug": f"candidate-{i}", "name": f"Candidate {i}"} for i in range(rows)],
+        )
+
+
+def build_sync_app() -> FastAPI:
+    """The pre-async handler: async def route running a blocking sync query"""
+    sync_engine = create_engine(DATABASE_URL, poolclass=NullPool)
+    event.listen(sync_engine, "connect", _install_latency)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/candidates/{slug}", response_model=CandidateResponse)
+    async def get_candidate(slug: str, db: Session = Depends(get_db)):
+        candidate = db.query(Candidate).filter(Candidate.slug == slug).first()
+        if not candidate:
+            raise HTTPException(status_code=404)
+        return candidate
+
+    return app
+
+
+def build_async_app() -> FastAPI:
+    """The ported candidates router on AsyncSession"""
+    app = FastAPI()
+    app.include_router(candidates.router, prefix="/candidates")
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int, rows: int) -> float:
+    """Send `requests` GETs with at most `concurrency` in flight; return req/s"""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(i: int):
+            async with semaphore:
+                response = await client.get(f"/candidates/candidate-{i % rows}")
+                response.raise_for_status()
+
+        await one(0)  # Warm up connections and route compilation
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    return requests / elapsed
+
+
+def main():
+    global DB_LATENCY_MS
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--latency-ms", type=int, default=DB_LATENCY_MS)
+    args = parser.parse_args()
+    DB_LATENCY_MS = args.latency_ms
+
+    setup_database(args.rows)
+
+    print(f"{args.requests} requests, {args.concurrency} concurrent, "
+          f"{DB_LATENCY_MS} ms simulated query latency")
+    print("-" * 60)
+
+    results = {}
+    for label, app in (("sync Session", build_sync_app()), ("AsyncSession", build_async_app())):
+        results[label] = asyncio.run(run_load(app, args.requests, args.concurrency, args.rows))
+        print(f"  {label:<14} {results[label]:8.1f} req/s")
+
+    speedup = results["AsyncSession"] / results["sync Session"]
+    print("-" * 60)
+    print(f"  speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+HTML parser backends on the checked-in parliament.go.ke fixtures.
+
+For every installed backend (see app/utils/html_parsers.py) parses each
+fixture and runs the scraper's extraction (parse_mp_profile and
+extract_listing_rows) on it, then reports milliseconds per page and peak
+memory. Each backend runs in a fresh process so its peak RSS is not mixed
+up with the others'. The run fails if backends disagree on the output.
+
+Run from the backend directory: python -m benchmarks.html_parsers
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+FIXTURES = ["full_page.html", "page_sample.html"]
+
+
+def _peak_rss_kb() -> int:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_backend(backend: str, iterations: int, results):
+    """Parse + extract every fixture ``iterations`` times (runs in a child process)"""
+    from app.utils.mp_scraper import CompleteMPScraper
+
+    scraper = CompleteMPScraper(delay=0, parser=backend)
+    pages = {}
+    for name in FIXTURES:
+        with open(os.path.join(BACKEND_DIR, name), encoding="utf-8") as f:
+            pages[name] = f.read()
+
+    rss_before = _peak_rss_kb()
+    timings = {}
+    outputs = {}
+    for name, html in pages.items():
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            page = scraper.parse_html(html)
+            output = [scraper.parse_mp_profile(page, name), scraper.extract_listing_rows(page)]
+            samples.append((time.perf_counter() - started) * 1000)
+        timings[name] = statistics.median(samples)
+        outputs[name] = output
+
+    results.put({
+        "backend": backend,
+        "ms_per_page": timings,
+        "peak_rss_growth_kb": _peak_rss_kb() - rss_before,
+        "output": json.dumps(outputs, sort_keys=True),
+    })
+
+
+def main():
+    from app.utils.html_parsers import available_backends
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for backend in available_backends():
+        results = ctx.Queue()
+        process = ctx.Process(target=run_backend, args=(backend, args.iterations, results))
+        process.start()
+        rows.append(results.get())
+        process.join()
+
+    sizes = {name: os.path.getsize(os.path.join(BACKEND_DIR, name)) // 1024 for name in FIXTURES}
+    header = f"{'backend':<12}" + "".join(f"{f'{name} ({sizes[name]} KB)':>28}" for name in FIXTURES) + f"{'peak RSS growth':>18}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        cells = "".join(f"{row['ms_per_page'][name]:>25.2f} ms" for name in FIXTURES)
+        print(f"{row['backend']:<12}{cells}{row['peak_rss_growth_kb'] / 1024:>15.1f} MB")
+
+    # html.parser is the original backend
+    baseline = next((row for row in rows if row["backend"] == "html.parser"), rows[0])
+    mismatched = [row["backend"] for row in rows if row["output"] != baseline["output"]]
+    if mismatched:
+        print(f"\n✗ Output differs from {baseline['backend']}: {', '.join(mismatched)}")
+        sys.exit(1)
+    print(f"\n✓ All {len(rows)} backends produce identical output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Per-profile parse time: the original parse_mp_profile vs the single-pass one.
+
+"Before" is the original implementation, kept below as it was: a separate
+BeautifulSoup find() per field, each a full tree walk with a freshly compiled
+regex. "After" is CompleteMPScraper.parse_mp_profile, which builds a
+ProfileIndex in one walk, on every installed parser backend.
+
+Tree building and extraction are timed separately so the effect of the
+single-pass index is visible on its own. Inputs are the checked-in fixtures
+plus a small synthetic profile page in the parliament.go.ke Drupal layout.
+The run fails if any result differs from the original implementation.
+
+Run from the backend directory: python -m benchmarks.profile_parsing
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Dict, Optional
+from urllib.parse import urljoin
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from bs4 import BeautifulSoup
+
+from app.utils.html_parsers import available_backends
+from app.utils.mp_scraper import CompleteMPScraper
+
+SYNTHETIC_PROFILE = """<!DOCTYPE html>
+<html><head><title>Hon. Jane Doe | Parliament of Kenya</title></head>
+<body><div class="page">
+<h1 class="page-title">Hon. (Dr.) Jane Doe, MP</h1>
+<div class="main-content">
+  <div class="field field-name-field-county"><div class="field-label">County:&nbsp;</div><div class="field-items">NAIROBI</div></div>
+  <div class="field field-name-field-constituency"><div class="field-label">Constituency:&nbsp;</div><div class="field-items">WESTLANDS</div></div>
+  <div class="field field-name-field-party"><div class="field-label">Party:&nbsp;</div><div class="field-items">ODM</div></div>
+  <p>Tel: +254712345678 | <a href="mailto:jane.doe@parliament.go.ke">jane.doe@parliament.go.ke</a></p>
+  <img class="mp-photo" src="/sites/default/files/mps/jane-doe.jpg" alt="Jane Doe">
+  <div class="field field-name-body"><p>Jane Doe is serving her second term.</p><p>She is an advocate of the High Court.</p></div>
+  <div class="committees"><ul><li>Budget and Appropriations Committee</li><li>Health Committee</li></ul></div>
+</div></div></body></html>
+"""
+
+
+def legacy_parse_mp_profile(scraper: CompleteMPScraper, soup: BeautifulSoup, url: str) -> Optional[Dict]:
+    """parse_mp_profile before the single-pass index (text= spelled string=)"""
+    mp_data = {
+        "profile_url": url, "name": "", "county": "", "constituency": "", "party": "",
+        "email": "", "phone": "", "bio": "", "photo_url": "", "committees": [], "wiki_title": "",
+    }
+
+    name_elem = soup.find('h1', class_=re.compile(r'page-title|title'))
+    if not name_elem:
+        name_elem = soup.find('h1')
+    if name_elem:
+        mp_data['name'] = scraper.clean_text(name_elem.get_text())
+
+    content = soup.find('div', class_=re.compile(r'content|main|body'))
+    if not content:
+        content = soup
+
+    for field, label in (('county', 'County'), ('constituency', 'Constituency'), ('party', 'Party')):
+        elem = content.find(string=re.compile(label, re.I))
+        if elem:
+            parent = elem.find_parent()
+            if parent:
+                value = parent.find_next_sibling()
+                if value:
+                    mp_data[field] = scraper.clean_text(value.get_text())
+        if not mp_data[field]:
+            label_field = content.find('div', class_='field-label', string=re.compile(label, re.I))
+            if label_field:
+                value = label_field.find_next_sibling('div', class_='field-items')
+                if value:
+                    mp_data[field] = scraper.clean_text(value.get_text())
+
+    email_link = content.find('a', href=re.compile(r'mailto:'))
+    if email_link:
+        mp_data['email'] = email_link['href'].replace('mailto:', '').strip()
+
+    phone_text = content.find(string=re.compile(r'\+254|0\d{9}'))
+    if phone_text:
+        phone_match = re.search(r'(\+254\d{9}|0\d{9})', phone_text)
+        if phone_match:
+            mp_data['phone'] = phone_match.group(1)
+
+    bio_elem = content.find('div', class_=re.compile(r'field-name-body|body|biography'))
+    if bio_elem:
+        mp_data['bio'] = scraper.clean_text(bio_elem.get_text())[:500]
+
+    photo_elem = content.find('img', class_=re.compile(r'photo|image|portrait'))
+    if not photo_elem:
+        photo_elem = content.find('img')
+    if photo_elem and photo_elem.get('src'):
+        mp_data['photo_url'] = urljoin(scraper.base_url, photo_elem['src'])
+
+    committees_section = content.find('div', class_=re.compile(r'committee'))
+    if committees_section:
+        mp_data['committees'] = [scraper.clean_text(c.get_text()) for c in committees_section.find_all('li')]
+
+    if mp_data['name']:
+        mp_data['wiki_title'] = scraper.generate_wiki_title(mp_data['name'])
+    return mp_data
+
+
+def median_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {"synthetic profile": SYNTHETIC_PROFILE}
+    for name in ("full_page.html", "page_sample.html"):
+        with open(os.path.join(BACKEND_DIR, name), encoding="utf-8") as f:
+            pages[name] = f.read()
+
+    legacy_scraper = CompleteMPScraper(delay=0, parser="html.parser")
+    mismatches = []
+
+    print(f"{'page':<20}{'version':<26}{'build tree':>12}{'extract':>12}{'total':>12}")
+    print("-" * 82)
+    for name, html in pages.items():
+        soup = BeautifulSoup(html, "html.parser")
+        expected = legacy_parse_mp_profile(legacy_scraper, soup, name)
+        build = median_ms(lambda: BeautifulSoup(html, "html.parser"), args.iterations)
+        extract = median_ms(lambda: legacy_parse_mp_profile(legacy_scraper, soup, name), args.iterations)
+        print(f"{name:<20}{'before (bs4 finds)':<26}{build:>9.2f} ms{extract:>9.2f} ms{build + extract:>9.2f} ms")
+
+        for backend in reversed(available_backends()):
+            scraper = CompleteMPScraper(delay=0, parser=backend)
+            page = scraper.parse_html(html)
+            if scraper.parse_mp_profile(page, name) != expected:
+                mismatches.append(f"{name} ({backend})")
+            build = median_ms(lambda: scraper.parse_html(html), args.iterations)
+            extract = median_ms(lambda: scraper.parse_mp_profile(page, name), args.iterations)
+            print(f"{'':<20}{f'after ({backend})':<26}{build:>9.2f} ms{extract:>9.2f} ms{build + extract:>9.2f} ms")
+
+    if mismatches:
+        print(f"\n✗ Output differs from the original implementation: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("\n✓ Output identical to the original implementation")
+
+
+if __name__ == "__main__":
+    main()
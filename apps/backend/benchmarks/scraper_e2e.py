@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+End-to-end MP scraper throughput against a local stand-in site.
+
+Builds a fixture site from the checked-in pages and serves it with
+ArchiveServer (app/utils/http_archive.py), adding latency and injected 503s
+if asked:
+
+    listing pages   full_page.html, its profile links renamed per page
+    last page       page_sample.html (no profiles, so the crawl stops there)
+    profiles        a synthetic profile in full_page.html's page chrome
+
+Then CompleteMPScraper crawls it in each mode, each mode in a fresh process:
+
+    sequential      workers=1
+    threaded        workers=8
+    process-pool    workers=8, parse_processes=2
+    cached          warm HTTP cache: every page revalidates as 304
+    incremental     manifest from a previous run: listing pages only
+
+For each mode it reports wall time, pages/sec, parse ms/page (in the
+scraper's process), peak RSS, and the time to write the MPs to a fresh
+SQLite database. The run fails if any mode's records differ from the
+sequential crawl. With --baseline it also fails when wall time, parse time
+or DB write time grew by more than --threshold over the saved results.
+
+Run from the backend directory:
+    python -m benchmarks.scraper_e2e [--pages 20] [--latency 0.02] [--error-rate 0.05]
+    python -m benchmarks.scraper_e2e --save-baseline scraper_e2e.json
+    python -m benchmarks.scraper_e2e --baseline scraper_e2e.json [--threshold 0.25]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+BASE_URL = "https://www.parliament.go.ke"
+LISTING_PATH = "/the-national-assembly/mps"
+PROFILE_LINK = re.compile(r'href="(/the-national-assembly/hon-[^"]+)"')
+COUNTIES = ["NAIROBI", "MOMBASA", "KISUMU", "NAKURU", "KIAMBU", "MACHAKOS", "KAKAMEGA", "TURKANA"]
+
+MODES = {
+    "sequential": {"workers": 1},
+    "threaded": {"workers": 8},
+    "process-pool": {"workers": 8, "parse_processes": 2},
+    "cached": {"workers": 8, "http_cache": True},
+    "incremental": {"workers": 8, "incremental": True},
+}
+
+# Compared against --baseline; growth within the slack (seconds / ms) is noise
+CHECKED_METRICS = {"wall_s": 0.05, "parse_ms": 0.5, "db_write_s": 0.05}
+
+PROFILE_TEMPLATE = """
+<h1 class="page-title">Hon. {name}, MP</h1>
+<div class="main-content">
+  <div class="field field-name-field-county"><div class="field-label">County:&nbsp;</div><div class="field-items">{county}</div></div>
+  <div class="field field-name-field-constituency"><div class="field-label">Constituency:&nbsp;</div><div class="field-items">{constituency}</div></div>
+  <div class="field field-name-field-party"><div class="field-label">Party:&nbsp;</div><div class="field-items">ODM</div></div>
+  <p>Tel: +2547{number:08d} | <a href="mailto:{slug}@parliament.go.ke">{slug}@parliament.go.ke</a></p>
+  <img class="mp-photo" src="/sites/default/files/mps/{slug}.jpg" alt="{name}">
+  <div class="field field-name-body"><p>{name} represents {constituency}.</p></div>
+  <div class="committees"><ul><li>Budget and Appropriations Committee</li><li>Health Committee</li></ul></div>
+</div>
+"""
+
+
+def _read_fixture(name: str) -> str:
+    with open(os.path.join(BACKEND_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def build_site(directory: str, pages: int) -> int:
+    """Write the fixture site as an HTTPArchive; returns the number of MPs"""
+    from app.utils.http_archive import HTTPArchive
+
+    listing = _read_fixture("full_page.html")
+    body_tag = re.search(r"<body[^>]*>", listing)
+    profiles = []
+
+    with HTTPArchive(directory) as archive:
+        def add(path: str, html: str):
+            body = html.encode("utf-8")
+            headers = {
+                "Content-Type": "text/html; charset=utf-8",
+                "ETag": f'"{hashlib.sha256(body).hexdigest()[:16]}"',
+            }
+            archive.record(BASE_URL + path, 200, headers, body)
+
+        for page_num in range(pages + 1):
+            path = LISTING_PATH if page_num == 0 else f"{LISTING_PATH}?page={page_num - 1}"
+            if page_num == pages:
+                add(path, _read_fixture("page_sample.html"))
+                continue
+            html = listing.replace("/the-national-assembly/hon-", f"/the-national-assembly/hon-p{page_num}-")
+            add(path, html)
+            profiles += [link for link in dict.fromkeys(PROFILE_LINK.findall(html)) if link not in profiles]
+
+        for number, path in enumerate(profiles):
+            slug = path.rsplit("/", 1)[1]
+            name = slug[len("hon-"):].replace("-", " ").title()
+            block = PROFILE_TEMPLATE.format(
+                name=name,
+                slug=slug,
+                number=number,
+                county=COUNTIES[number % len(COUNTIES)],
+                constituency=f"{name.split()[-1].upper()} CONSTITUENCY",
+            )
+            add(path, listing[:body_tag.end()] + block + listing[body_tag.end():])
+
+    return len(profiles)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak / 1024 if sys.platform == "darwin" else peak) / 1024
+
+
+def run_mode(mode: str, site_dir: str, work_dir: str, args: argparse.Namespace, results):
+    """Crawl the fixture site in one mode and seed a fresh database (runs in a child process)"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(work_dir, f'{mode}.db')}"
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+
+    from app.database import SessionLocal, init_db
+    from app.utils.http_archive import ArchiveServer, HTTPArchive
+    from app.utils.http_cache import HTTPCache
+    from app.utils.mp_scraper import CompleteMPScraper, DatabaseSeeder
+    from app.utils.scrape_manifest import ScrapeManifest
+
+    config = MODES[mode]
+    server = ArchiveServer(
+        HTTPArchive(site_dir), latency=args.latency, error_rate=args.error_rate, seed=args.seed,
+    ).start()
+    http_cache = HTTPCache(os.path.join(work_dir, f"{mode}.cache.sqlite3")) if config.get("http_cache") else None
+    manifest = ScrapeManifest(os.path.join(work_dir, f"{mode}.manifest.json")) if config.get("incremental") else None
+
+    def scraper(**options) -> CompleteMPScraper:
+        return CompleteMPScraper(
+            delay=0,
+            base_url=BASE_URL,
+            fetch_origin=server.base_url,
+            parser=args.parser,
+            http_cache=http_cache,
+            **options,
+        )
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if http_cache or manifest:
+            # Untimed first crawl that fills the cache / manifest
+            scraper(workers=config["workers"]).scrape_all_mps(max_pages=args.pages + 1, manifest=manifest)
+
+        crawler = scraper(workers=config["workers"], parse_processes=config.get("parse_processes", 0))
+        started = time.perf_counter()
+        mps = crawler.scrape_all_mps(
+            max_pages=args.pages + 1, manifest=manifest, incremental=config.get("incremental", False),
+        )
+        wall = time.perf_counter() - started
+
+        init_db()
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            DatabaseSeeder(db).update_database(mps)
+            db_write = time.perf_counter() - started
+        finally:
+            db.close()
+
+    server.stop()
+    if http_cache:
+        http_cache.close()
+    results.put({
+        "mode": mode,
+        "mps": len(mps),
+        "records": hashlib.sha256(json.dumps(mps, sort_keys=True).encode("utf-8")).hexdigest(),
+        "wall_s": wall,
+        "pages": crawler.pages_fetched,
+        "pages_per_s": crawler.pages_fetched / wall if wall else 0.0,
+        "parse_ms": crawler.parse_seconds / crawler.pages_parsed * 1000 if crawler.pages_parsed else None,
+        "retries": crawler.retries,
+        "injected_errors": server.errors,
+        "peak_rss_mb": _peak_rss_mb(),
+        "db_write_s": db_write,
+    })
+
+
+def regressions(rows, baseline, threshold: float):
+    """Metrics that grew past the threshold (plus slack) since the baseline"""
+    found = []
+    for row in rows:
+        previous = baseline.get(row["mode"])
+        if not previous:
+            continue
+        for metric, slack in CHECKED_METRICS.items():
+            before, now = previous.get(metric), row[metric]
+            if before is None or now is None:
+                continue
+            if now > before * (1 + threshold) + slack:
+                found.append(f"{row['mode']} {metric}: {before:.3f} -> {now:.3f} (+{(now / before - 1) * 100:.0f}%)")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20, help="listing pages (10 MPs each)")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--parser", default="auto", help="HTML parser backend")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated subset of modes")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed growth over the baseline")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write these results as a baseline")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="scraper-e2e-") as work_dir:
+        site_dir = os.path.join(work_dir, "site")
+        total_mps = build_site(site_dir, args.pages)
+        print(
+            f"Fixture site: {args.pages} listing pages, {total_mps} profiles, "
+            f"latency {args.latency * 1000:.0f} ms, error rate {args.error_rate * 100:.0f}%\n"
+        )
+
+        for mode in modes:
+            results = ctx.Queue()
+            process = ctx.Process(target=run_mode, args=(mode, site_dir, work_dir, args, results))
+            process.start()
+            rows.append(results.get())
+            process.join()
+
+    header = (
+        f"{'mode':<14}{'MPs':>6}{'wall':>10}{'pages':>7}{'pages/s':>9}{'parse/page':>12}"
+        f"{'retries':>9}{'peak RSS':>10}{'DB write':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        parse = f"{row['parse_ms']:.2f} ms" if row["parse_ms"] is not None else "-"
+        print(
+            f"{row['mode']:<14}{row['mps']:>6}{row['wall_s']:>8.2f} s{row['pages']:>7}{row['pages_per_s']:>9.1f}"
+            f"{parse:>12}{row['retries']:>9}{row['peak_rss_mb']:>7.0f} MB{row['db_write_s'] * 1000:>7.0f} ms"
+        )
+
+    failures = []
+    reference = next((row for row in rows if row["mode"] == "sequential"), rows[0])
+    mismatched = [row["mode"] for row in rows if row["records"] != reference["records"]]
+    if mismatched:
+        failures.append(f"records differ from {reference['mode']}: {', '.join(mismatched)}")
+    if reference["mps"] != total_mps:
+        failures.append(f"{reference['mode']} scraped {reference['mps']} of {total_mps} MPs")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures += regressions(rows, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({row["mode"]: row for row in rows}, f, indent=2)
+        print(f"\nSaved baseline to {args.save_baseline}")
+
+    if failures:
+        print("\n✗ " + "\n✗ ".join(failures))
+        sys.exit(1)
+    print(f"\n✓ All {len(rows)} modes produce identical records" + (" within the baseline" if args.baseline else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
 MP Scraper runner script
-Run from backend directory: python scrape_mps.py
+Run from backend directory:
+    python scrape_mps.py [--incremental] [--resume] [--record DIR | --replay DIR]
 """
 
+import argparse
 import os
 import sys
 from dotenv import load_dotenv
@@ -19,13 +21,43 @@ from app.utils.mp_scraper import scrape_and_seed_mps
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Scrape MPs from parliament.go.ke and seed the database")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only fetch profiles that are new or changed since the last run",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted scrape from its checkpoint instead of starting over",
+    )
+    archive_mode = parser.add_mutually_exclusive_group()
+    archive_mode.add_argument(
+        "--record",
+        metavar="DIR",
+        help="also save every HTTP response to this archive directory",
+    )
+    archive_mode.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="scrape a recorded archive instead of parliament.go.ke (offline, full speed)",
+    )
+    args = parser.parse_args()
+    
     print("Initializing database...")
     init_db()
     
     print("Starting MP scraper...")
     db = SessionLocal()
     try:
-        result = scrape_and_seed_mps(db)
+        result = scrape_and_seed_mps(
+            db,
+            incremental=args.incremental,
+            resume=args.resume,
+            record_to=args.record,
+            replay_from=args.replay,
+        )
         if result:
             print("\n✓ MP scraping and seeding completed successfully!")
     finally:
@@ -15,6 +15,7 @@ load_dotenv()
 
 from app.database import SessionLocal, init_db
 from app.models import Candidate, County, Issue, VoteBuyingFact
+from app.utils.wikipedia import prefetch_tracked_summaries
 
 
 def seed_candidates(db):
@@ -608,6 +609,14 @@ def main():
 
         print("\n✅ Database seeding completed successfully!")
 
+        if os.getenv("WIKIPEDIA_PREFETCH", "True").lower() == "true":
+            print("\nPrefetching Wikipedia summaries...")
+            try:
+                prefetch_tracked_summaries(db)
+            except Exception as e:
+                # Summaries are fetched on demand anyway
+                print(f"⚠ Wikipedia prefetch failed: {e}")
+
     except Exception as e:
         print(f"\n❌ Error during seeding: {e}")
         db.rollback()
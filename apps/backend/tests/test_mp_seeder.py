@@ -0,0 +1,222 @@
+"""
+DatabaseSeeder writes against an in-memory SQLite database.
+
+Run from the backend directory: python -m pytest tests
+"""
+
+import os
+import re
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.database import Base  # noqa: E402
+from app.models import MP, County, CountyMP  # noqa: E402
+from app.utils.mp_scraper import DatabaseSeeder  # noqa: E402
+
+
+def scraped_mp(n: int, county: str = "NAIROBI", **fields) -> dict:
+    """A record shaped like CompleteMPScraper's output"""
+    return {
+        "name": f"MP {n}",
+        "county": county,
+        "constituency": f"Constituency {n}",
+        "party": "UDA",
+        "email": f"mp{n}@parliament.go.ke",
+        "phone": "",
+        "bio": f"Member for Constituency {n}",
+        "photo_url": f"https://www.parliament.go.ke/photos/{n}.jpg",
+        "profile_url": f"https://www.parliament.go.ke/the-national-assembly/mps/{n}",
+        "committees": ["Budget"],
+        "wiki_title": f"MP_{n}",
+        **fields,
+    }
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def writes(engine):
+    """Statements that wrote to the database (INSERT, UPDATE, DELETE)"""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(" ", 1)[0] in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.fixture
+def counties(db):
+    """Seeded counties (as seeds.py writes them), by name"""
+    names = ["Nairobi", "Mombasa", "Murang'a"]
+    db.add_all(
+        County(name=name, governor_name=f"Governor of {name}", governor_party="UDA",
+               governor_wiki_title=f"Governor_{name}")
+        for name in names
+    )
+    db.commit()
+    return {county.name: county.id for county in db.scalars(select(County))}
+
+
+def stored_mps(db) -> dict:
+    db.expire_all()
+    return {mp.profile_url: mp for mp in db.scalars(select(MP))}
+
+
+def test_inserts_new_mps(db):
+    mps = [scraped_mp(1), scraped_mp(2)]
+
+    summary = DatabaseSeeder(db).update_database(mps)
+
+    assert (summary["inserted"], summary["updated"], summary["unchanged"]) == (2, 0, 0)
+    stored = stored_mps(db)
+    assert stored[mps[0]["profile_url"]].committees_json == ["Budget"]
+    assert all(mp.content_hash for mp in stored.values())
+
+
+def test_unchanged_mps_are_not_rewritten(db, writes):
+    mps = [scraped_mp(1), scraped_mp(2)]
+    DatabaseSeeder(db).update_database(mps)
+    writes.clear()
+
+    summary = DatabaseSeeder(db).update_database([dict(mp) for mp in mps])
+
+    assert (summary["inserted"], summary["updated"], summary["unchanged"]) == (0, 0, 2)
+    assert [s for s in writes if re.search(r"\bmps\b", s)] == []
+
+
+def test_changed_mps_are_updated(db):
+    mps = [scraped_mp(1), scraped_mp(2)]
+    DatabaseSeeder(db).update_database(mps)
+
+    summary = DatabaseSeeder(db).update_database([
+        scraped_mp(1, party="ODM", committees=["Budget", "Health"]),
+        scraped_mp(2),
+    ])
+
+    assert (summary["inserted"], summary["updated"], summary["unchanged"]) == (0, 1, 1)
+    assert summary["changed_fields"] == {"committees_json": 1, "party": 1}
+    assert summary["changes"] == [{
+        "profile_url": mps[0]["profile_url"],
+        "name": "MP 1",
+        "fields": ["party", "committees_json"],
+    }]
+    stored = stored_mps(db)[mps[0]["profile_url"]]
+    assert stored.party == "ODM"
+    assert stored.committees_json == ["Budget", "Health"]
+    assert stored.content_hash == MP.hash_content(stored.__dict__)
+
+
+def test_updated_at_moves_only_when_something_changed(db):
+    mps = [scraped_mp(1), scraped_mp(2)]
+    DatabaseSeeder(db).update_database(mps)
+    before = {url: mp.updated_at for url, mp in stored_mps(db).items()}
+
+    DatabaseSeeder(db).update_database([scraped_mp(1, bio="Re-elected"), scraped_mp(2)])
+
+    after = {url: mp.updated_at for url, mp in stored_mps(db).items()}
+    assert after[mps[0]["profile_url"]] > before[mps[0]["profile_url"]]
+    assert after[mps[1]["profile_url"]] == before[mps[1]["profile_url"]]
+
+
+def test_missing_mps_are_reported_not_deleted(db):
+    mps = [scraped_mp(1), scraped_mp(2)]
+    DatabaseSeeder(db).update_database(mps)
+
+    summary = DatabaseSeeder(db).update_database([scraped_mp(1)])
+
+    assert summary["removed_mps"] == [{"profile_url": mps[1]["profile_url"], "name": "MP 2"}]
+    assert len(stored_mps(db)) == 2
+
+
+def county_state(db) -> dict:
+    """County name -> (updated_at, [(position, MP name)])"""
+    db.expire_all()
+    rows = {}
+    for county_id, position, name in db.execute(
+        select(CountyMP.county_id, CountyMP.position, CountyMP.name).order_by(CountyMP.position)
+    ):
+        rows.setdefault(county_id, []).append((position, name))
+    return {
+        county.name: (county.updated_at, rows.get(county.id, []))
+        for county in db.scalars(select(County))
+    }
+
+
+def test_counties_get_their_mps_in_scrape_order(db, counties):
+    DatabaseSeeder(db).update_database([
+        scraped_mp(1, county="NAIROBI"),
+        scraped_mp(2, county="MURANGA COUNTY"),
+        scraped_mp(3, county="NAIROBI"),
+        scraped_mp(4, county="ATLANTIS"),
+    ])
+
+    state = county_state(db)
+    assert state["Nairobi"][1] == [(0, "MP 1"), (1, "MP 3")]
+    assert state["Murang'a"][1] == [(0, "MP 2")]
+    assert state["Mombasa"][1] == []
+    assert db.get(County, counties["Nairobi"]).mps_json[0]["profile_url"] == scraped_mp(1)["profile_url"]
+
+
+def test_unchanged_counties_are_not_rewritten(db, counties, writes):
+    mps = [scraped_mp(1, county="NAIROBI"), scraped_mp(2, county="MOMBASA")]
+    DatabaseSeeder(db).update_database(mps)
+    before = county_state(db)
+    writes.clear()
+
+    DatabaseSeeder(db).update_database([dict(mp) for mp in mps])
+
+    assert county_state(db) == before
+    assert [s for s in writes if re.search(r"\b(county_mps|counties)\b", s)] == []
+
+
+def test_changed_county_is_replaced(db, counties):
+    DatabaseSeeder(db).update_database([scraped_mp(1, county="NAIROBI"), scraped_mp(2, county="MOMBASA")])
+    before = county_state(db)
+
+    DatabaseSeeder(db).update_database([
+        scraped_mp(1, county="NAIROBI", party="ODM"),
+        scraped_mp(5, county="NAIROBI"),
+        scraped_mp(2, county="MOMBASA"),
+    ])
+
+    after = county_state(db)
+    assert after["Nairobi"][1] == [(0, "MP 1"), (1, "MP 5")]
+    assert after["Nairobi"][0] > before["Nairobi"][0]
+    assert after["Mombasa"] == before["Mombasa"]
+    assert db.scalar(select(CountyMP.party).where(CountyMP.name == "MP 1")) == "ODM"
+
+
+def test_county_missing_from_partial_scrape_is_left_intact(db, counties, capsys):
+    DatabaseSeeder(db).update_database([
+        scraped_mp(1, county="NAIROBI"),
+        scraped_mp(2, county="MOMBASA"),
+        scraped_mp(3, county="MOMBASA"),
+    ])
+    before = county_state(db)
+
+    # e.g. a listing page failed, so none of Mombasa's MPs were scraped
+    DatabaseSeeder(db).update_database([scraped_mp(1, county="NAIROBI", bio="Re-elected")])
+
+    after = county_state(db)
+    assert after["Mombasa"] == before["Mombasa"]
+    assert after["Mombasa"][1] == [(0, "MP 2"), (1, "MP 3")]
+    assert "1 not in this scrape" in capsys.readouterr().out
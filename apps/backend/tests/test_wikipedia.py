@@ -0,0 +1,241 @@
+"""
+Wikipedia prefetch against a local stand-in for the MediaWiki APIs.
+
+Run from the backend directory: python -m pytest tests
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.utils import wikipedia  # noqa: E402
+
+
+class StandInWikipedia:
+    """
+    Local HTTP server answering action API queries (``/w/api.php``) and REST
+    summary requests (``/rest/page/summary/<title>``).
+
+    Each action API call is answered by the next entry of ``scripted``
+    (status, headers, body), or by ``answer(params)`` once that runs out.
+    Every call's query parameters are kept in ``api_calls``.
+    """
+
+    def __init__(self):
+        self.api_calls = []
+        self.rest_calls = []
+        self.scripted = []
+        self.answer = self.pages_for
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def pages_for(params):
+        """Every title exists, with an extract naming it"""
+        pages = [
+            {"title": title, "extract": f"About {title}", "description": "Kenyan politician"}
+            for title in params["titles"].split("|")
+        ]
+        return 200, {}, {"batchcomplete": True, "query": {"pages": pages}}
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if parts.path.startswith("/rest/"):
+                    stand_in.rest_calls.append(parts.path)
+                    status, headers, body = 200, {}, {
+                        "extract": "From REST",
+                        "content_urls": {"mobile": {"page": "https://en.m.wikipedia.org/wiki/X"}},
+                    }
+                else:
+                    params = {name: values[0] for name, values in parse_qs(parts.query).items()}
+                    stand_in.api_calls.append(params)
+                    if stand_in.scripted:
+                        status, headers, body = stand_in.scripted.pop(0)
+                    else:
+                        status, headers, body = stand_in.answer(params)
+
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def __enter__(self) -> "StandInWikipedia":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    with StandInWikipedia() as stand_in:
+        monkeypatch.setenv("WIKIPEDIA_API_URL", f"{stand_in.base_url}/w/api.php")
+        monkeypatch.setenv("WIKIPEDIA_REST_URL", f"{stand_in.base_url}/rest")
+        monkeypatch.setenv("WIKIPEDIA_CACHE_PATH", str(tmp_path / "wikipedia.json"))
+        wikipedia.clear_wiki_cache()
+        yield stand_in
+        wikipedia.clear_wiki_cache()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record back-off sleeps instead of waiting (token bucket waits are tiny)"""
+    recorded = []
+    real_sleep = wikipedia.time.sleep
+
+    def sleep(seconds):
+        if seconds >= 0.5:
+            recorded.append(seconds)
+        else:
+            real_sleep(seconds)
+
+    monkeypatch.setattr(wikipedia.time, "sleep", sleep)
+    return recorded
+
+
+def test_batches_twenty_titles_per_request(api):
+    titles = [f"MP {i}" for i in range(45)]
+
+    stats = wikipedia.prefetch_wiki_summaries(titles, rate=1000)
+
+    assert [len(call["titles"].split("|")) for call in api.api_calls] == [20, 20, 5]
+    assert stats == {"titles": 45, "cached": 0, "fetched": 45, "missing": 0, "failed": 0, "requests": 3}
+    assert wikipedia.get_wiki_summary("MP 44").extract == "About MP 44"
+    assert api.rest_calls == []
+
+    # Already cached: no further requests
+    stats = wikipedia.prefetch_wiki_summaries(titles, rate=1000)
+    assert stats["cached"] == 45 and stats["requests"] == 0
+    assert len(api.api_calls) == 3
+
+
+def test_maps_normalized_and_redirected_titles_back(api):
+    api.scripted.append((200, {}, {
+        "batchcomplete": True,
+        "query": {
+            "normalized": [{"from": "william_Ruto", "to": "William Ruto"}],
+            "redirects": [{"from": "William Ruto", "to": "William Samoei Ruto"}],
+            "pages": [
+                {"title": "William Samoei Ruto", "extract": "President of Kenya",
+                 "thumbnail": {"source": "https://upload.example/ruto.jpg"}},
+                {"title": "Susan Kihika", "extract": "Governor of Nakuru"},
+                {"title": "Nobody Here", "missing": True},
+            ],
+        },
+    }))
+
+    stats = wikipedia.prefetch_wiki_summaries(["william_Ruto", "Susan Kihika", "Nobody Here"], rate=1000)
+
+    ruto = wikipedia.get_wiki_summary("william_Ruto")
+    assert ruto.extract == "President of Kenya"
+    assert ruto.thumbnail_url == "https://upload.example/ruto.jpg"
+    assert ruto.page_url == "https://en.m.wikipedia.org/wiki/William_Samoei_Ruto"
+    assert wikipedia.get_wiki_summary("Susan Kihika").extract == "Governor of Nakuru"
+    # Missing pages are cached too, so they aren't looked up one by one
+    assert wikipedia.get_wiki_summary("Nobody Here").extract is None
+    assert api.rest_calls == []
+    assert stats["missing"] == 1
+
+
+def test_follows_continuation(api):
+    api.scripted += [
+        (200, {}, {
+            "continue": {"excontinue": "1", "continue": "||"},
+            "query": {"pages": [{"title": "A", "extract": "About A"}, {"title": "B"}]},
+        }),
+        (200, {}, {
+            "batchcomplete": True,
+            "query": {"pages": [{"title": "A"}, {"title": "B", "extract": "About B"}]},
+        }),
+    ]
+
+    stats = wikipedia.prefetch_wiki_summaries(["A", "B"], rate=1000)
+
+    assert api.api_calls[1]["excontinue"] == "1"
+    assert api.api_calls[1]["titles"] == "A|B"
+    assert wikipedia.get_wiki_summary("A").extract == "About A"
+    assert wikipedia.get_wiki_summary("B").extract == "About B"
+    assert stats["requests"] == 2
+
+
+def test_retries_429_honouring_retry_after(api, sleeps):
+    api.scripted.append((429, {"Retry-After": "7"}, {}))
+
+    stats = wikipedia.prefetch_wiki_summaries(["A"], rate=1000)
+
+    assert sleeps == [7]
+    assert stats["requests"] == 2
+    assert wikipedia.get_wiki_summary("A").extract == "About A"
+
+
+def test_retries_maxlag_honouring_retry_after(api, sleeps):
+    api.scripted.append((200, {"Retry-After": "5"}, {
+        "error": {"code": "maxlag", "info": "Waiting for a database server: 6 seconds lagged"},
+    }))
+
+    stats = wikipedia.prefetch_wiki_summaries(["A"], rate=1000)
+
+    assert sleeps == [5]
+    assert stats["requests"] == 2
+    assert stats["fetched"] == 1
+
+
+def test_gives_up_after_repeated_failures(api, sleeps):
+    api.answer = lambda params: (503, {"Retry-After": "1"}, {})
+
+    stats = wikipedia.prefetch_wiki_summaries(["A", "B"], rate=1000)
+
+    assert stats["failed"] == 2 and stats["fetched"] == 0
+    assert stats["requests"] == 4  # First try plus three retries
+    assert sleeps == [1, 1, 1]
+
+
+def test_snapshot_warms_another_process(api, tmp_path):
+    wikipedia.prefetch_wiki_summaries(["A"], rate=1000)
+
+    # A fresh process: empty memory cache, same snapshot file
+    wikipedia.clear_wiki_cache()
+    assert wikipedia.get_wiki_summary("A").extract == "About A"
+    assert api.rest_calls == []
+
+    # A later prefetch elsewhere rewrites the snapshot; it is reloaded
+    snapshot_path = tmp_path / "wikipedia.json"
+    entries = json.loads(snapshot_path.read_text())
+    entries["B"] = {**entries["A"], "summary": {**entries["A"]["summary"], "extract": "About B"}}
+    snapshot_path.write_text(json.dumps(entries))
+    stat = snapshot_path.stat()
+    os.utime(snapshot_path, (stat.st_atime, stat.st_mtime + 1))
+
+    assert wikipedia.get_wiki_summary("B").extract == "About B"
+    assert api.rest_calls == []
+
+    # Titles nobody prefetched still come from the REST endpoint
+    assert wikipedia.get_wiki_summary("C").extract == "From REST"
+    assert len(api.rest_calls) == 1
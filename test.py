@@ -1,11 +1,33 @@
+"""
+Print the structure of a parliament.go.ke listing page and MP profile page.
+
+    python test.py                 fetch from the live site
+    python test.py --replay DIR    fetch from an HTTP archive recorded with
+                                   apps/backend/scrape_mps.py --record DIR
+"""
+import argparse
+import os
+import sys
+
 import requests
 from bs4 import BeautifulSoup
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--replay", metavar="DIR", help="serve the pages from a recorded HTTP archive")
+args = parser.parse_args()
+
+base_url = "https://www.parliament.go.ke"
+if args.replay:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "apps", "backend"))
+    from app.utils.http_archive import ArchiveServer, HTTPArchive
+
+    base_url = ArchiveServer(HTTPArchive(args.replay)).start().base_url
+
 # 1. Check listing page
 print("="*60)
 print("LISTING PAGE STRUCTURE")
 print("="*60)
-listing_url = "https://www.parliament.go.ke/the-national-assembly/mps?page=1"
+listing_url = f"{base_url}/the-national-assembly/mps?page=1"
 response = requests.get(listing_url)
 soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -20,7 +42,7 @@ if mp_links:
 print("\n" + "="*60)
 print("DETAIL PAGE SECTIONS")
 print("="*60)
-detail_url = "https://www.parliament.go.ke/the-national-assembly/hon-amb-langat-benjamin-kipkirui"
+detail_url = f"{base_url}/the-national-assembly/hon-amb-langat-benjamin-kipkirui"
 response = requests.get(detail_url)
 soup = BeautifulSoup(response.content, 'html.parser')
 